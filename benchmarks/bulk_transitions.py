@@ -0,0 +1,58 @@
+"""Bulk transition benchmark: accept_all vs per-order accept() with try/except.
+
+Run: python -m benchmarks.bulk_transitions [--orders N] [--invalid-share P]
+"""
+
+import argparse
+import time
+
+from src.pizza.domain.delivery import Coordinates
+from src.pizza.domain.errors import DomainError
+from src.pizza.domain.menu import Menu
+from src.pizza.domain.order import Order, accept_all
+from src.pizza.domain.status import OrderStatus
+
+
+def make_orders(count: int, invalid_share: float) -> list[Order]:
+    menu = Menu([], [])
+    every = max(1, round(1 / invalid_share)) if invalid_share else 0
+    return [
+        Order(
+            menu,
+            None,
+            "c",
+            Coordinates(0, 0),
+            [],
+            OrderStatus.DELIVERED if every and i % every == 0 else OrderStatus.NEW,
+            None,
+        )
+        for i in range(count)
+    ]
+
+
+def one_by_one(orders: list[Order]) -> int:
+    failed = 0
+    for order in orders:
+        try:
+            order.accept()
+        except DomainError:
+            failed += 1
+    return failed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, default=200_000)
+    parser.add_argument("--invalid-share", type=float, default=0.2)
+    args = parser.parse_args()
+
+    for label, run in (("one by one", one_by_one), ("accept_all", accept_all)):
+        orders = make_orders(args.orders, args.invalid_share)
+        started = time.perf_counter()
+        run(orders)
+        elapsed = time.perf_counter() - started
+        print(f"{label:>10}: {args.orders / elapsed:>12,.0f} orders/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Compare courier assignment strategies on a simulated day.
+
+Run: python -m benchmarks.city_simulation [--seed S] [--couriers N] [--days D]
+"""
+
+import argparse
+from typing import Sequence
+
+from src.pizza.domain.delivery import AssignmentStrategy, Coordinates, Courier, distance
+from src.pizza.sim.city import CitySimulator, SimulationConfig
+
+
+class NearestCourier(AssignmentStrategy):
+    """Closest available courier to the pickup point."""
+
+    def choose(self, order_address: Coordinates, couriers: Sequence[Courier]) -> Courier:
+        return min(couriers, key=lambda courier: distance(courier.location, order_address))
+
+
+class FastestVehicle(AssignmentStrategy):
+    """Available courier with the quickest vehicle."""
+
+    def choose(self, order_address: Coordinates, couriers: Sequence[Courier]) -> Courier:
+        return max(couriers, key=lambda courier: courier.vehicle.speed_coef)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--couriers", type=int, default=12)
+    parser.add_argument("--days", type=float, default=1.0)
+    args = parser.parse_args()
+
+    strategies = {
+        "any-available": None,
+        "nearest": NearestCourier(),
+        "fastest-vehicle": FastestVehicle(),
+    }
+    config = SimulationConfig(seed=args.seed, couriers=args.couriers, hours=24 * args.days)
+    for name, strategy in strategies.items():
+        report = CitySimulator(config, strategy).run()
+        p = report.percentiles
+        print(
+            f"{name:<16} orders={report.orders} delivered={report.delivered} "
+            f"p50={p['p50']:.1f}m p90={p['p90']:.1f}m p99={p['p99']:.1f}m "
+            f"utilization={report.mean_utilization:.1%} backlog={report.max_backlog} "
+            f"wall={report.wall_seconds:.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
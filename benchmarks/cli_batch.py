@@ -0,0 +1,82 @@
+"""CLI batch throughput: stream a generated command file through one warm Session.
+
+Run: python -m benchmarks.cli_batch [--commands N] [--spawn K]
+"""
+
+import argparse
+import io
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+from src.pizza.cli.session import Session, load_config
+
+LIFECYCLE = (
+    "order new customer-{i} {x} {y}",
+    "add-item @ pz-mar large 2 tp-basil",
+    '{{"cmd":"add-item","order":"@","sku":"pz-pep","size":"small","qty":1}}',
+    "accept @",
+    "bake @",
+    "box @",
+    "dispatch @",
+    "deliver @",
+    "pay @",
+    "show @",
+)
+
+
+def write_commands(path: str, count: int, seed: int = 7) -> None:
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as out:
+        written = 0
+        i = 0
+        while written < count:
+            x, y = rng.uniform(-5, 5), rng.uniform(-5, 5)
+            for template in LIFECYCLE[: count - written]:
+                out.write(template.format(i=i, x=f"{x:.3f}", y=f"{y:.3f}") + "\n")
+                written += 1
+            i += 1
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--commands", type=int, default=1_000_000)
+    parser.add_argument("--spawn", type=int, default=10, help="one-shot processes to time")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "commands.txt")
+        write_commands(path, args.commands)
+        session = Session(*load_config(None))
+        sink = io.StringIO()
+        started = time.perf_counter()
+        with open(path, encoding="utf-8") as source:
+            for line in session.run_batch(source):
+                sink.write(line)
+            elapsed = time.perf_counter() - started
+        print(
+            f"batch: {args.commands:,} commands in {elapsed:.2f}s "
+            f"({args.commands / elapsed:,.0f}/s, {elapsed / args.commands * 1e6:.1f} µs each, "
+            f"{session.errors} errors, {sink.tell() / 2**20:.0f} MiB output)"
+        )
+
+    if args.spawn:
+        started = time.perf_counter()
+        for _ in range(args.spawn):
+            subprocess.run(
+                [sys.executable, "-m", "src.pizza.cli.app", "menu"],
+                check=True,
+                stdout=subprocess.DEVNULL,
+            )
+        per_process = (time.perf_counter() - started) / args.spawn
+        print(
+            f"one process per command: {per_process * 1e3:.0f} ms each, "
+            f"{per_process * args.commands / 3600:.1f} h for {args.commands:,} commands"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Per-command CLI latency: cold process vs thin client talking to a warm daemon.
+
+Run: python -m benchmarks.cli_daemon [--runs N] [--requests M]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from src.pizza.cli.protocol import DaemonClient
+from src.pizza.domain.metrics import Histogram
+
+CLI = [sys.executable, "-m", "src.pizza.cli.app"]
+
+
+def time_processes(command: list[str], runs: int, env: dict[str, str]) -> float:
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(command, check=False, stdout=subprocess.DEVNULL, env=env)
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--requests", type=int, default=20_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "pizza.sock")
+        env = {**os.environ, "PIZZA_SOCKET": path}
+        daemon = subprocess.Popen(CLI + ["daemon"], env=env)
+        try:
+            while (probe := DaemonClient.connect(path)) is None:
+                time.sleep(0.05)
+            probe.close()
+            interpreter = time_processes([sys.executable, "-c", "pass"], args.runs, env)
+            cold = time_processes(CLI + ["--no-daemon", "menu"], args.runs, env)
+            thin = time_processes(CLI + ["menu"], args.runs, env)
+
+            histogram = Histogram()  # nanoseconds
+            with DaemonClient.connect(path) as client:
+                for i in range(args.requests):
+                    if i % 10 == 0:  # keep orders small: the reply carries the whole order
+                        client.request(["order", "new", "bench"])
+                    started = time.perf_counter_ns()
+                    client.request(["add-item", "@", "pz-mar", "large"])
+                    histogram.record(time.perf_counter_ns() - started)
+                client.send({"op": "shutdown"})
+        finally:
+            try:
+                daemon.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                daemon.terminate()
+                daemon.wait()
+
+    print(f"bare interpreter start:        {interpreter * 1e3:7.1f} ms (median of {args.runs})")
+    print(f"cold process per command:      {cold * 1e3:7.1f} ms (median of {args.runs})")
+    print(f"thin client + warm daemon:     {thin * 1e3:7.1f} ms (median of {args.runs})")
+    print(
+        f"daemon round trip (connected): p50 {histogram.percentile(50) / 1e6:.3f} ms, "
+        f"p99 {histogram.percentile(99) / 1e6:.3f} ms over {args.requests:,} add-item requests"
+    )
+
+
+if __name__ == "__main__":
+    main()
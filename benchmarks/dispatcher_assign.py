@@ -0,0 +1,38 @@
+"""Dispatcher assignment benchmark: cost per assign/release as the fleet grows.
+
+Run: python -m benchmarks.dispatcher_assign [--rounds R]
+"""
+
+import argparse
+import time
+
+from src.pizza.domain.delivery import Coordinates, Courier, Dispatcher, Vehicle
+
+
+def measure(fleet_size: int, rounds: int) -> float:
+    bike = Vehicle(kind="bike", speed_coef=1.0)
+    couriers = [
+        Courier(id=f"c{i}", location=Coordinates(0, 0), vehicle=bike, available=True)
+        for i in range(fleet_size)
+    ]
+    dispatcher = Dispatcher(couriers=couriers)
+
+    started = time.perf_counter()
+    for i in range(rounds):
+        result = dispatcher.assign(f"o{i}")
+        dispatcher.has_available()
+        dispatcher.release(result.courier_id)
+    return (time.perf_counter() - started) / rounds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=200_000)
+    args = parser.parse_args()
+    for fleet_size in (10, 1_000, 100_000):
+        per_op = measure(fleet_size, args.rounds)
+        print(f"fleet={fleet_size:>7} assign+release={per_op * 1e9:,.0f}ns")
+
+
+if __name__ == "__main__":
+    main()
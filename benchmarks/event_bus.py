@@ -0,0 +1,52 @@
+"""Event bus publish overhead by number of subscribers.
+
+Run: python -m benchmarks.event_bus [--events N] [--batch-size B]
+"""
+
+import argparse
+import asyncio
+import time
+
+from src.pizza.domain.bus import EventBus
+from src.pizza.domain.status import OrderStatus
+
+
+def sync_handler(batch) -> None:
+    pass
+
+
+async def async_handler(batch) -> None:
+    pass
+
+
+async def publish(subscribers: int, handler, events: int, batch_size: int) -> float:
+    bus = EventBus()
+    for i in range(subscribers):
+        bus.subscribe(handler, batch_size=batch_size, max_buffer=events, name=f"s{i}")
+    await bus.start()
+    emit = bus.emit
+    started = time.perf_counter()
+    for i in range(events):
+        emit("order", OrderStatus.NEW, OrderStatus.ACCEPTED)
+    elapsed = time.perf_counter() - started
+    await bus.stop()
+    return elapsed / events
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=100_000)
+    parser.add_argument("--batch-size", type=int, default=100)
+    args = parser.parse_args()
+
+    print(f"{'subscribers':>11} {'sync µs/publish':>16} {'async µs/publish':>17}")
+    for subscribers in (0, 1, 10, 100):
+        timings = [
+            asyncio.run(publish(subscribers, handler, args.events, args.batch_size)) * 1e6
+            for handler in (sync_handler, async_handler)
+        ]
+        print(f"{subscribers:>11} {timings[0]:>16.2f} {timings[1]:>17.2f}")
+
+
+if __name__ == "__main__":
+    main()
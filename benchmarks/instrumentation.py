@@ -0,0 +1,97 @@
+"""Instrumentation overhead: hot paths with metrics disabled, enabled, and uninstrumented.
+
+Run: python -m benchmarks.instrumentation [--number N] [--repeat R]
+
+"uninstrumented" calls the original function kept by the registry, i.e. the code
+without any decorator; "disabled" must match it, since disabling puts exactly
+that function back on the class.
+"""
+
+import argparse
+import contextlib
+import timeit
+from decimal import Decimal
+
+from benchmarks.payment_authorize import make_orders
+from src.pizza.domain import metrics
+from src.pizza.domain.delivery import Coordinates, Courier, Dispatcher, Vehicle
+from src.pizza.domain.order import Order
+from src.pizza.domain.payment import CashPayment
+from src.pizza.domain.pricing import PercentOff
+from src.pizza.domain.products import PizzaSize
+
+NULL = contextlib.nullcontext()
+
+
+def compare(call, original, number: int, repeat: int) -> tuple[float, float, float]:
+    """Best ns/op of (uninstrumented, disabled, enabled), measured in alternating rounds."""
+
+    samples: tuple[list[float], list[float], list[float]] = ([], [], [])
+    for _ in range(repeat):
+        metrics.disable()
+        samples[0].append(timeit.timeit(original, number=number))
+        samples[1].append(timeit.timeit(call, number=number))
+        metrics.enable()
+        samples[2].append(timeit.timeit(call, number=number))
+        metrics.disable()
+    return tuple(min(times) / number * 1e9 for times in samples)  # type: ignore[return-value]
+
+
+def cases() -> dict[str, tuple[object, object]]:
+    """name -> (call through the class attribute, call of the original function)."""
+
+    originals = {
+        target.wrapper.__qualname__: target.function for target in metrics.REGISTRY._targets
+    }
+    order = make_orders(1)[0]
+    order.set_pricing_strategy(PercentOff(Decimal("10")))
+    add_item = originals["Order.add_item"]
+    final_total = originals["Order.final_total"]
+    assign = originals["Dispatcher.assign"]
+    capture = originals["CashPayment.capture"]
+    dispatcher = Dispatcher([Courier("k", Coordinates(0, 0), Vehicle("bike", 1.0), True)])
+    cash = CashPayment()
+    amount = Decimal("1.00")
+
+    def add(method):
+        method(order, "pz-mar", PizzaSize.LARGE, 1, ())
+        order._items.pop()
+
+    return {
+        "Order.add_item": (lambda: add(Order.add_item), lambda: add(add_item)),
+        "Order.final_total": (order.final_total, lambda: final_total(order)),
+        "Dispatcher.assign": (
+            lambda: dispatcher.release(dispatcher.assign("o").courier_id),
+            lambda: dispatcher.release(assign(dispatcher, "o").courier_id),
+        ),
+        "CashPayment.capture": (
+            lambda: cash.capture(order, amount),
+            lambda: capture(cash, order, amount),
+        ),
+        "timer() block": (lambda: _block(metrics.timer("bench")), lambda: _block(NULL)),
+    }
+
+
+def _block(timer) -> None:
+    with timer:
+        pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=25)
+    args = parser.parse_args()
+
+    print(f"{'':22}{'uninstrumented':>16}{'disabled':>12}{'enabled':>12}{'enabled cost':>14}")
+    for name, (call, original) in cases().items():
+        bare, disabled, enabled = compare(call, original, args.number, args.repeat)
+        print(
+            f"{name:22}{bare:13,.0f} ns{disabled:9,.0f} ns{enabled:9,.0f} ns"
+            f"{enabled - disabled:+11,.0f} ns"
+        )
+    metrics.reset()
+
+
+if __name__ == "__main__":
+    main()
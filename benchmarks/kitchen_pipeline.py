@@ -0,0 +1,74 @@
+"""Kitchen-to-door pipeline load test with stand-in ovens and couriers.
+
+Run: python -m benchmarks.kitchen_pipeline [--orders N] [--ovens O] [--couriers C]
+     [--bake-time S] [--trip-time S] [--queue-size Q] [--trace-memory]
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+from decimal import Decimal
+
+from src.pizza.domain.delivery import Coordinates, Courier, Dispatcher, Vehicle
+from src.pizza.domain.inventory import BatchOven, InMemoryInventory
+from src.pizza.domain.pipeline import OrderPipeline, kitchen_stages
+
+from .payment_authorize import make_orders
+
+
+async def run(args: argparse.Namespace) -> None:
+    orders = make_orders(args.orders)
+    dough = orders[0].items_view()[0].pizza.recipe[0].ingredient
+    inventory = InMemoryInventory({dough: Decimal(4 * args.orders)})
+    ovens = [BatchOven(capacity=4) for _ in range(args.ovens)]
+    bike = Vehicle("bike", 1.0)
+    dispatcher = Dispatcher(
+        [Courier(f"k{i}", Coordinates(0, 0), bike, True) for i in range(args.couriers)]
+    )
+    pipeline = OrderPipeline(
+        kitchen_stages(
+            inventory, ovens, dispatcher, args.bake_time, args.trip_time, args.queue_size
+        )
+    )
+
+    if args.trace_memory:
+        tracemalloc.start()
+    started = time.perf_counter()
+    stats = await pipeline.run(orders)
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    memory = f", peak traced {peak / 2**20:.1f} MiB" if args.trace_memory else ""
+
+    if pipeline.failures or pipeline.completed != len(orders):
+        raise SystemExit(f"{len(pipeline.failures)} of {len(orders):,} orders failed")
+    if dispatcher.available_count() != args.couriers:
+        raise SystemExit("couriers were not all released")
+    print(
+        f"{pipeline.completed:,} delivered, {len(pipeline.failures)} failed in {elapsed:.2f}s "
+        f"({pipeline.completed / elapsed:,.0f} orders/s){memory}"
+    )
+    print(f"{'stage':>8} {'workers':>7} {'max queue':>9} {'orders/s':>10} {'p50':>9} {'p99':>9}")
+    for stage in stats:
+        print(
+            f"{stage.name:>8} {stage.workers:>7} {stage.max_queue_depth:>9} "
+            f"{stage.throughput:>10,.0f} {stage.p50_latency * 1e3:>7.2f}ms "
+            f"{stage.p99_latency * 1e3:>7.2f}ms"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, default=50_000)
+    parser.add_argument("--ovens", type=int, default=8)
+    parser.add_argument("--couriers", type=int, default=40)
+    parser.add_argument("--bake-time", type=float, default=0.0)
+    parser.add_argument("--trip-time", type=float, default=0.0)
+    parser.add_argument("--queue-size", type=int, default=100)
+    parser.add_argument("--trace-memory", action="store_true")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
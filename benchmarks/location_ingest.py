@@ -0,0 +1,59 @@
+"""Courier location ingestion benchmark: pings/sec, coalescing ratio and apply lag.
+
+Run: python -m benchmarks.location_ingest [--couriers N] [--pings P] [--tick T]
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from src.pizza.domain.delivery import Coordinates, Courier, Dispatcher, Vehicle
+from src.pizza.domain.tracking import LocationIngestor
+
+
+async def run(couriers: int, pings: int, tick: float, burst: int, seed: int) -> None:
+    rng = random.Random(seed)
+    bike = Vehicle(kind="bike", speed_coef=1.0)
+    fleet = [
+        Courier(id=f"c{i}", location=Coordinates(0, 0), vehicle=bike, available=True)
+        for i in range(couriers)
+    ]
+    ingestor = LocationIngestor(Dispatcher(couriers=fleet, strategy=None), tick=tick)
+    ids = [courier.id for courier in fleet]
+
+    async def stream():
+        for i in range(pings):
+            yield rng.choice(ids), Coordinates(rng.uniform(-10, 10), rng.uniform(-10, 10))
+            if i % burst == 0:
+                await asyncio.sleep(0)
+
+    runner = asyncio.create_task(ingestor.run())
+    started = time.perf_counter()
+    await ingestor.consume(stream())
+    ingestor.stop()
+    await runner
+    elapsed = time.perf_counter() - started
+
+    stats = ingestor.stats()
+    print(
+        f"pings={stats.received} elapsed={elapsed:.2f}s rate={stats.received / elapsed:,.0f}/s "
+        f"applied={stats.applied} coalesced={stats.coalesced} dropped={stats.dropped} "
+        f"batches={stats.batches} mean_lag={stats.mean_lag * 1000:.1f}ms "
+        f"max_lag={stats.max_lag * 1000:.1f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--couriers", type=int, default=2000)
+    parser.add_argument("--pings", type=int, default=500_000)
+    parser.add_argument("--tick", type=float, default=0.05)
+    parser.add_argument("--burst", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    asyncio.run(run(args.couriers, args.pings, args.tick, args.burst, args.seed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""LogStructuredOrderRepository benchmark: append rate, get latency and compaction.
+
+Run: python -m benchmarks.log_store [--orders N] [--versions V]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from src.pizza.domain.metrics import Histogram
+from src.pizza.infra.log_store import LogStructuredOrderRepository
+
+from .payment_authorize import make_orders
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, default=100_000)
+    parser.add_argument("--versions", type=int, default=3)
+    args = parser.parse_args()
+
+    orders = make_orders(args.orders)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "orders.log")
+        with LogStructuredOrderRepository(path, orders[0].menu) as repo:
+            started = time.perf_counter()
+            for _ in range(args.versions):
+                for order in orders:
+                    repo.save(order)
+            repo.flush()
+            saves = args.orders * args.versions
+            elapsed = time.perf_counter() - started
+            print(f"save: {saves:,} appends in {elapsed:.2f}s ({saves / elapsed:,.0f}/s)")
+
+            histogram = Histogram()  # nanoseconds
+            ids = [str(order.id) for order in orders]
+            for order_id in random.Random(1).choices(ids, k=50_000):
+                started = time.perf_counter_ns()
+                repo.get(order_id)
+                histogram.record(time.perf_counter_ns() - started)
+            print(
+                f"get: p50 {histogram.percentile(50) / 1e3:,.1f}µs  "
+                f"p99 {histogram.percentile(99) / 1e3:,.1f}µs"
+            )
+
+            before = repo.stats()
+            started = time.perf_counter()
+            repo.compact()
+            elapsed = time.perf_counter() - started
+            after = repo.stats()
+            print(
+                f"compact: {before.file_bytes / 2**20:,.1f} MiB -> "
+                f"{after.file_bytes / 2**20:,.1f} MiB in {elapsed:.2f}s"
+            )
+
+        started = time.perf_counter()
+        LogStructuredOrderRepository(path, orders[0].menu).close()
+        print(f"recovery scan: {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
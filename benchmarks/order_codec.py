@@ -0,0 +1,77 @@
+"""Order serialization benchmark: OrderCodec vs pickle vs JSON (size and throughput).
+
+Run: python -m benchmarks.order_codec [--orders N]
+"""
+
+import argparse
+import json
+import pickle
+import time
+import uuid
+
+from src.pizza.domain.delivery import Coordinates
+from src.pizza.domain.order import Order, OrderItem
+from src.pizza.domain.products import PizzaSize
+from src.pizza.domain.status import OrderStatus
+from src.pizza.domain.types import OrderId
+from src.pizza.infra.codec import OrderCodec
+
+from .payment_authorize import make_orders
+
+
+def to_json(order: Order) -> bytes:
+    items = [
+        [item.pizza.sku, item.size.value, item.qty, [t.sku for t in item.toppings]]
+        for item in order.items_view()
+    ]
+    address = order.delivery_address
+    fields = [str(order.id), order.customer, address.x, address.y, order.status.value, items]
+    return json.dumps(fields, separators=(",", ":")).encode()
+
+
+def from_json(menu, data: bytes) -> Order:
+    order_id, customer, x, y, status, items = json.loads(data)
+    return Order(
+        menu,
+        OrderId(uuid.UUID(order_id)),
+        customer,
+        Coordinates(x, y),
+        [
+            OrderItem(menu.find_pizza_sku(sku), qty, PizzaSize(size), ())
+            for sku, size, qty, _ in items
+        ],
+        OrderStatus(status),
+        None,
+    )
+
+
+def measure(label: str, orders: list[Order], encode, decode) -> None:
+    started = time.perf_counter()
+    blobs = [encode(order) for order in orders]
+    encoded = time.perf_counter() - started
+    started = time.perf_counter()
+    for blob in blobs:
+        decode(blob)
+    decoded = time.perf_counter() - started
+    size = sum(len(blob) for blob in blobs) / len(blobs)
+    print(
+        f"{label:>7}: {size:8,.0f} B/order  encode {len(orders) / encoded:>10,.0f}/s  "
+        f"decode {len(orders) / decoded:>10,.0f}/s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, default=100_000)
+    args = parser.parse_args()
+
+    orders = make_orders(args.orders)
+    menu = orders[0].menu
+    codec = OrderCodec(menu)
+    measure("codec", orders, codec.encode, lambda blob: codec.decode(memoryview(blob)))
+    measure("json", orders, to_json, lambda blob: from_json(menu, blob))
+    measure("pickle", orders, pickle.dumps, pickle.loads)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Checkout authorize benchmark: sequential vs pooled concurrent calls to a mock provider.
+
+Run: python -m benchmarks.payment_authorize [--orders N] [--latency S] [--pool P]
+"""
+
+import argparse
+import asyncio
+import time
+from decimal import Decimal
+
+from src.pizza.domain.delivery import Coordinates
+from src.pizza.domain.inventory import Ingredient, IngredientRequirement
+from src.pizza.domain.menu import Menu
+from src.pizza.domain.order import Order
+from src.pizza.domain.products import Pizza, PizzaSize
+from src.pizza.domain.types import OrderId
+from src.pizza.infra.mock_provider import MockPaymentProvider
+from src.pizza.infra.payment_client import AsyncPaymentClient
+
+
+def make_orders(count: int) -> list[Order]:
+    dough = Ingredient(name="Dough", unit="kg")
+    menu = Menu(
+        pizzas=[
+            Pizza(
+                name="Margherita",
+                default_price=Decimal("10.00"),
+                sku="pz-mar",
+                recipe=[IngredientRequirement(dough, Decimal("1"))],
+            )
+        ],
+        toppings=[],
+    )
+    orders = []
+    for i in range(count):
+        order = Order(menu, OrderId.generate(), f"c{i}", Coordinates(0, 0), [], None, None)
+        order.add_item("pz-mar", PizzaSize.LARGE, 1 + i % 3, ())
+        orders.append(order)
+    return orders
+
+
+async def run(count: int, latency: float, pool: int) -> None:
+    async with MockPaymentProvider(latency=latency) as provider:
+        async with AsyncPaymentClient(provider.host, provider.port, pool_size=pool) as client:
+            orders = make_orders(count)
+            started = time.perf_counter()
+            for order in orders[: count // 2]:
+                await client.authorize(order)
+            sequential = time.perf_counter() - started
+
+            started = time.perf_counter()
+            await client.authorize_many(orders[count // 2 :])
+            concurrent = time.perf_counter() - started
+
+    half = count // 2
+    print(
+        f"sequential: {half} authorizations in {sequential:.2f}s ({half / sequential:,.0f}/s)\n"
+        f"concurrent: {count - half} authorizations in {concurrent:.2f}s "
+        f"({(count - half) / concurrent:,.0f}/s, pool={pool})"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.005)
+    parser.add_argument("--pool", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(run(args.orders, args.latency, args.pool))
+
+
+if __name__ == "__main__":
+    main()
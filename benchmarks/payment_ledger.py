@@ -0,0 +1,60 @@
+"""Payment ledger benchmark: append rate, bytes per event and payment_record() lookups.
+
+Run: python -m benchmarks.payment_ledger [--orders N] [--lookups L]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from decimal import Decimal
+
+from src.pizza.domain.types import OrderId
+from src.pizza.infra.ledger import PaymentLedger
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, default=300_000)
+    parser.add_argument("--lookups", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+    ids = [str(OrderId.generate()) for _ in range(args.orders)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "payments.log")
+        with PaymentLedger(path) as ledger:
+            started = time.perf_counter()
+            for i, order_id in enumerate(ids):
+                amount = Decimal(rng.randint(500, 9000)).scaleb(-2)
+                ledger.append(order_id, "authorize", amount, "card", f"pay-{i}")
+                ledger.append(order_id, "capture", amount, "card", f"pay-{i}")
+                if i % 10 == 0:
+                    ledger.append(order_id, "refund", amount, "card", f"pay-{i}")
+            ledger.flush()
+            append_s = time.perf_counter() - started
+            events = len(ledger)
+
+            started = time.perf_counter()
+            for _ in range(args.lookups):
+                ledger.payment_record(rng.choice(ids))
+            lookup_s = time.perf_counter() - started
+            size = os.path.getsize(path)
+
+        started = time.perf_counter()
+        with PaymentLedger(path) as reopened:
+            reopen_s = time.perf_counter() - started
+            assert reopened.payment_record(ids[-1]) is not None
+
+    print(
+        f"events={events:,} append={events / append_s:,.0f}/s file={size / 1e6:.1f}MB "
+        f"({size / events:.0f} B/event)\n"
+        f"payment_record lookups={args.lookups / lookup_s:,.0f}/s "
+        f"reopen+index={reopen_s:.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Tail latency of authorize with and without hedged requests under a heavy-tail provider.
+
+Run: python -m benchmarks.payment_resilience [--calls N] [--slow-share P] [--hedge-after S]
+"""
+
+import argparse
+import random
+import time
+from decimal import Decimal
+
+from src.pizza.domain.payment import PaymentAuthResult
+from src.pizza.domain.resilience import ResilientPayment
+
+from .payment_authorize import make_orders
+
+
+class HeavyTailCard:
+    """Answers in ~2ms, but ``slow_share`` of calls take 100x longer."""
+
+    method = "card"
+
+    def __init__(self, slow_share: float, seed: int = 7) -> None:
+        self.slow_share = slow_share
+        self._rng = random.Random(seed)
+
+    def authorize(self, order) -> PaymentAuthResult:
+        slow = self._rng.random() < self.slow_share
+        time.sleep(0.2 if slow else 0.002)
+        return PaymentAuthResult(f"p-{order.id}", "authorized", Decimal("10"), "card")
+
+
+def measure(payment: ResilientPayment, orders) -> tuple[float, float, float]:
+    for order in orders:
+        payment.authorize(order)
+    payment.close()
+    histogram = payment.histograms()[("heavy-tail", "authorize")]
+    return histogram.percentile(50) / 1e9, histogram.percentile(99) / 1e9, histogram.max / 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=500)
+    parser.add_argument("--slow-share", type=float, default=0.05)
+    parser.add_argument("--hedge-after", type=float, default=0.01)
+    args = parser.parse_args()
+
+    orders = make_orders(args.calls)
+    for label, hedge_after in (("plain", None), ("hedged", args.hedge_after)):
+        payment = ResilientPayment(
+            HeavyTailCard(args.slow_share), "heavy-tail", hedge_after=hedge_after
+        )
+        p50, p99, worst = measure(payment, orders)
+        stats = payment.stats()
+        print(
+            f"{label:>6}: p50 {p50 * 1000:6.1f} ms  p99 {p99 * 1000:6.1f} ms  "
+            f"max {worst * 1000:6.1f} ms  hedges {stats.hedges}"
+        )
+
+
+if __name__ == "__main__":
+    main()
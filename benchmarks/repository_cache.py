@@ -0,0 +1,50 @@
+"""CachingOrderRepository benchmark: Zipf-distributed get() polling over a SQLite store.
+
+Run: python -m benchmarks.repository_cache [--orders N] [--gets G] [--skew S] [--cache C]
+"""
+
+import argparse
+import itertools
+import os
+import random
+import tempfile
+import time
+
+from src.pizza.domain.repository import CachingOrderRepository
+from src.pizza.infra.sqlite_repository import SQLiteOrderRepository
+
+from .payment_authorize import make_orders
+
+
+def zipf_ids(ids: list[str], count: int, skew: float, seed: int = 1) -> list[str]:
+    weights = [1 / rank**skew for rank in range(1, len(ids) + 1)]
+    cumulative = list(itertools.accumulate(weights))
+    return random.Random(seed).choices(ids, cum_weights=cumulative, k=count)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, default=100_000)
+    parser.add_argument("--gets", type=int, default=200_000)
+    parser.add_argument("--skew", type=float, default=1.1)
+    parser.add_argument("--cache", type=int, default=5_000)
+    args = parser.parse_args()
+
+    orders = make_orders(args.orders)
+    with tempfile.TemporaryDirectory() as directory:
+        with SQLiteOrderRepository(os.path.join(directory, "o.db"), orders[0].menu) as store:
+            ids = store.save_many(orders)
+            requests = zipf_ids(ids, args.gets, args.skew)
+            cached = CachingOrderRepository(store, max_entries=args.cache, ttl=60)
+            for label, repo in (("sqlite", store), ("cached", cached)):
+                started = time.perf_counter()
+                for order_id in requests:
+                    repo.get(order_id)
+                elapsed = time.perf_counter() - started
+                print(f"{label:>6}: {args.gets / elapsed:>10,.0f} gets/s")
+            stats = cached.stats()
+            print(f"hit ratio {stats.hit_ratio:.1%}, evictions {stats.evictions:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""InMemoryOrderRepository benchmark: save and indexed find_by_status with 1M stored orders.
+
+Run: python -m benchmarks.repository_indexes [--orders N] [--polls P]
+"""
+
+import argparse
+import time
+
+from src.pizza.domain.delivery import Coordinates
+from src.pizza.domain.menu import Menu
+from src.pizza.domain.order import Order
+from src.pizza.domain.repository import InMemoryOrderRepository
+from src.pizza.domain.status import OrderStatus
+from src.pizza.domain.types import OrderId
+
+# Status mix of a day's history: almost everything is finished, a few orders are live.
+MIX = [OrderStatus.DELIVERED] * 97 + [
+    OrderStatus.CANCELED,
+    OrderStatus.BAKING,
+    OrderStatus.DISPATCHED,
+]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, default=1_000_000)
+    parser.add_argument("--polls", type=int, default=1_000)
+    args = parser.parse_args()
+
+    menu = Menu([], [])
+    repo = InMemoryOrderRepository()
+    orders = [
+        Order(
+            menu,
+            OrderId.generate(),
+            f"c{i % 50_000}",
+            Coordinates(0, 0),
+            [],
+            MIX[i % len(MIX)],
+            None,
+        )
+        for i in range(args.orders)
+    ]
+    started = time.perf_counter()
+    for order in orders:
+        repo.save(order)
+    elapsed = time.perf_counter() - started
+    print(f"save: {args.orders:,} orders in {elapsed:.2f}s ({args.orders / elapsed:,.0f}/s)")
+
+    for status in (OrderStatus.BAKING, OrderStatus.DELIVERED):
+        polls = args.polls if status is OrderStatus.BAKING else 5
+        started = time.perf_counter()
+        for _ in range(polls):
+            found = repo.find_by_status(status)
+        indexed = (time.perf_counter() - started) / polls
+
+        started = time.perf_counter()
+        scanned = [order for order in repo.list_all() if order.status is status]
+        scan = time.perf_counter() - started
+        assert len(scanned) == len(found)
+        print(
+            f"find_by_status({status.name}): {len(found):,} results  "
+            f"indexed {indexed * 1e3:8.3f} ms  full scan {scan * 1e3:8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Repository throughput under threads: global-lock repository vs ShardedOrderRepository.
+
+Each operation is a get + conditional save (read-modify-write) of a random order.
+With the GIL, pure-Python work does not run in parallel; sharding removes lock
+convoys, so throughput should hold steady instead of dropping as threads are added.
+
+Run: python -m benchmarks.repository_threads [--orders N] [--ops OPS]
+"""
+
+import argparse
+import random
+import threading
+import time
+
+from src.pizza.domain.delivery import Coordinates
+from src.pizza.domain.errors import StaleOrderVersion
+from src.pizza.domain.menu import Menu
+from src.pizza.domain.order import Order
+from src.pizza.domain.repository import ShardedOrderRepository
+from src.pizza.domain.types import OrderId
+
+
+def run(repo: ShardedOrderRepository, ids: list[str], threads: int, ops: int) -> float:
+    per_thread = ops // threads
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(seed: int) -> None:
+        rng = random.Random(seed)
+        barrier.wait()
+        for _ in range(per_thread):
+            order, version = repo.get_versioned(rng.choice(ids))
+            try:
+                repo.save(order, expected_version=version)
+            except StaleOrderVersion:
+                pass
+
+    workers = [threading.Thread(target=worker, args=(seed,)) for seed in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    return per_thread * threads / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, default=100_000)
+    parser.add_argument("--ops", type=int, default=400_000)
+    args = parser.parse_args()
+
+    menu = Menu([], [])
+    orders = [
+        Order(menu, OrderId.generate(), "c", Coordinates(0, 0), [], None, None)
+        for _ in range(args.orders)
+    ]
+    for label, shards in (("global lock", 1), ("64 shards", 64)):
+        repo = ShardedOrderRepository(shards=shards)
+        ids = [repo.save(order) for order in orders]
+        for threads in (1, 2, 4, 8, 16):
+            throughput = run(repo, ids, threads, args.ops)
+            print(f"{label:>12} threads={threads:>2}: {throughput:>10,.0f} ops/s")
+
+
+if __name__ == "__main__":
+    main()
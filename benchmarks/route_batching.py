@@ -0,0 +1,101 @@
+"""Route batching benchmark: deliveries per courier-hour, single-drop vs multi-drop.
+
+Run: python -m benchmarks.route_batching [--orders N] [--couriers M] [--seed S]
+"""
+
+import argparse
+import random
+import time
+
+from src.pizza.domain.delivery import Coordinates, Courier, Dispatcher, Vehicle
+from src.pizza.domain.menu import Menu
+from src.pizza.domain.order import Order
+from src.pizza.domain.routing import RouteBatcher
+from src.pizza.domain.status import OrderStatus
+from src.pizza.domain.types import OrderId
+
+DEPOT = Coordinates(0, 0)
+VEHICLES = (
+    Vehicle(kind="bike", speed_coef=0.8),
+    Vehicle(kind="scooter", speed_coef=1.0),
+    Vehicle(kind="car", speed_coef=1.3),
+)
+
+
+def generate_orders(rng: random.Random, count: int, radius: float) -> list[Order]:
+    menu = Menu(pizzas=[], toppings=[])
+    return [
+        Order(
+            menu=menu,
+            id=OrderId.generate(),
+            customer=f"customer-{i}",
+            delivery_address=Coordinates(
+                rng.uniform(-radius, radius), rng.uniform(-radius, radius)
+            ),
+            items=[],
+            status=OrderStatus.BOXED,
+            pricing_strategy=None,
+        )
+        for i in range(count)
+    ]
+
+
+def simulate(
+    orders: list[Order], couriers: int, capacity: int, max_detour: float, seed: int
+) -> dict[str, float]:
+    """Dispatch orders in waves until all are delivered; couriers return between waves."""
+
+    rng = random.Random(seed)
+    fleet = [
+        Courier(id=f"c{i}", location=DEPOT, vehicle=rng.choice(VEHICLES), available=True)
+        for i in range(couriers)
+    ]
+    dispatcher = Dispatcher(fleet)
+    batcher = RouteBatcher(DEPOT, capacity=capacity, max_detour=max_detour)
+
+    pending = list(orders)
+    courier_hours = 0.0
+    delivered = 0
+    planning = 0.0
+    while pending:
+        started = time.perf_counter()
+        plan = batcher.plan(pending, dispatcher)
+        planning += time.perf_counter() - started
+
+        courier_hours += sum(trip.duration for trip in plan.trips)
+        delivered += plan.deliveries
+        pending = list(plan.unassigned)
+        for trip in plan.trips:
+            dispatcher.release(trip.courier_id)
+
+    return {
+        "capacity": capacity,
+        "delivered": delivered,
+        "courier_hours": courier_hours,
+        "deliveries_per_courier_hour": delivered / courier_hours if courier_hours else 0.0,
+        "planning_ms": planning * 1000,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, default=5000)
+    parser.add_argument("--couriers", type=int, default=50)
+    parser.add_argument("--radius", type=float, default=8.0)
+    parser.add_argument("--max-detour", type=float, default=2.0)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    for capacity in (1, 2, 3, 4):
+        orders = generate_orders(random.Random(args.seed), args.orders, args.radius)
+        result = simulate(orders, args.couriers, capacity, args.max_detour, args.seed)
+        print(
+            f"capacity={result['capacity']} delivered={result['delivered']} "
+            f"courier_hours={result['courier_hours']:.1f} "
+            f"deliveries/courier-hour={result['deliveries_per_courier_hour']:.2f} "
+            f"planning={result['planning_ms']:.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
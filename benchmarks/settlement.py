@@ -0,0 +1,60 @@
+"""End-of-day settlement benchmark: bulk capture throughput against the mock provider.
+
+Run: python -m benchmarks.settlement [--orders N] [--batch-size B] [--concurrency C]
+"""
+
+import argparse
+import asyncio
+import time
+from decimal import Decimal
+
+from src.pizza.domain.payment import PaymentAuthResult
+from src.pizza.domain.settlement import SettlementEngine
+from src.pizza.infra.mock_provider import MockPaymentProvider
+from src.pizza.infra.payment_client import AsyncPaymentClient
+
+from .payment_authorize import make_orders
+
+
+async def run(count: int, batch_size: int, concurrency: int) -> None:
+    orders = make_orders(count)
+    async with MockPaymentProvider() as provider:
+        auths = []
+        for order in orders:
+            amount = order.final_total()
+            _, reply = provider.handle(
+                "authorize", {"order_id": str(order.id), "amount": str(amount)}
+            )
+            auths.append(
+                PaymentAuthResult(
+                    reply["payment_id"], "authorized", Decimal(reply["amount"]), "card"
+                )
+            )
+
+        async with AsyncPaymentClient(provider.host, provider.port, timeout=60) as client:
+            engine = SettlementEngine(client, batch_size=batch_size, concurrency=concurrency)
+            started = time.perf_counter()
+            for order, auth in zip(orders, auths):
+                engine.enqueue(order, auth)
+            report = await engine.settle()
+            elapsed = time.perf_counter() - started
+
+    print(
+        f"orders={count} batches={report.batches} captured={len(report.captured)} "
+        f"failed={len(report.failed)} reconciled={report.reconciled} "
+        f"total={report.captured_total} elapsed={elapsed:.2f}s "
+        f"throughput={count / elapsed:,.0f} orders/s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, default=100_000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+    asyncio.run(run(args.orders, args.batch_size, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
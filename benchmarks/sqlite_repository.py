@@ -0,0 +1,66 @@
+"""SQLiteOrderRepository benchmark: sustained saves/sec and get latency percentiles.
+
+The 10M-order figure from the design notes needs ~1.5 GB of disk and several minutes:
+    python -m benchmarks.sqlite_repository --orders 10000000
+
+Run: python -m benchmarks.sqlite_repository [--orders N] [--batch B] [--gets G] [--path FILE]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from src.pizza.domain.metrics import Histogram
+from src.pizza.infra.sqlite_repository import SQLiteOrderRepository
+
+from .payment_authorize import make_orders
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, default=1_000_000)
+    parser.add_argument("--batch", type=int, default=5_000)
+    parser.add_argument("--gets", type=int, default=20_000)
+    parser.add_argument("--path", default=None)
+    args = parser.parse_args()
+
+    directory = tempfile.TemporaryDirectory()
+    path = args.path or os.path.join(directory.name, "orders.db")
+    template = make_orders(args.batch)
+    menu = template[0].menu
+    ids: list[str] = []
+    with SQLiteOrderRepository(path, menu) as repo:
+        started = time.perf_counter()
+        for _ in range(0, args.orders, args.batch):
+            for order in template:
+                order.id = None
+            ids.extend(repo.save_many(template))
+        elapsed = time.perf_counter() - started
+        print(f"save_many: {len(ids):,} orders in {elapsed:.1f}s ({len(ids) / elapsed:,.0f}/s)")
+
+        singles = template[:1_000]
+        started = time.perf_counter()
+        for order in singles:
+            order.id = None
+            repo.save(order)
+        elapsed = time.perf_counter() - started
+        print(f"save: {len(singles):,} orders in {elapsed:.2f}s ({len(singles) / elapsed:,.0f}/s)")
+
+        histogram = Histogram()  # nanoseconds
+        rng = random.Random(1)
+        for order_id in rng.choices(ids, k=args.gets):
+            started = time.perf_counter_ns()
+            repo.get(order_id)
+            histogram.record(time.perf_counter_ns() - started)
+        print(
+            f"get: p50 {histogram.percentile(50) / 1e3:,.0f}µs  "
+            f"p99 {histogram.percentile(99) / 1e3:,.0f}µs  max {histogram.max / 1e3:,.0f}µs"
+        )
+        print(f"database: {os.path.getsize(path) / 2**20:,.0f} MiB")
+    directory.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Streaming export benchmark: iter_all over a large SQLite order store with bounded memory.
+
+Peak memory is measured with tracemalloc, which slows iteration several times;
+compare throughput with benchmarks.sqlite_repository rather than reading it here.
+
+Run: python -m benchmarks.streaming_export [--orders 5000000] [--page-size P]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+from src.pizza.infra.sqlite_repository import SQLiteOrderRepository
+
+from .payment_authorize import make_orders
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, default=5_000_000)
+    parser.add_argument("--page-size", type=int, default=1_000)
+    args = parser.parse_args()
+
+    template = make_orders(10_000)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "orders.db")
+        with SQLiteOrderRepository(path, template[0].menu) as repo:
+            started = time.perf_counter()
+            for _ in range(0, args.orders, len(template)):
+                for order in template:
+                    order.id = None
+                repo.save_many(template)
+            print(f"loaded {len(repo):,} orders in {time.perf_counter() - started:.0f}s")
+
+            tracemalloc.start()
+            started = time.perf_counter()
+            count = sum(1 for _ in repo.iter_all(page_size=args.page_size))
+            elapsed = time.perf_counter() - started
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(
+                f"iter_all: {count:,} orders in {elapsed:.1f}s ({count / elapsed:,.0f}/s), "
+                f"peak Python memory {peak / 2**20:,.1f} MiB (page size {args.page_size})"
+            )
+
+
+if __name__ == "__main__":
+    main()
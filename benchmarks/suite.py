@@ -0,0 +1,438 @@
+"""Domain hot-path benchmark suite with JSON results and baseline regression checks.
+
+Run: python -m benchmarks.suite [--sizes 10,1000,100000] [--cases GLOB] [--seed S]
+                                [--output results.json] [--baseline base.json]
+                                [--threshold 0.25]
+
+Every case is timed for every size; what "size" means is given in the case's
+docstring (menu entries, order lines, fleet size, stored orders...). Data comes
+from a seeded DataGenerator, so two runs with the same --seed time the same
+inputs. A case is timed as ``repeat`` rounds of ``number`` calls (``number``
+calibrated to take at least --min-time); the best round is the reported ns/op.
+
+With --baseline, each (case, size) also present in the baseline file is compared
+and a slowdown of more than --threshold (0.25 = 25%) is a regression: they are
+listed and the exit status is 1. Record a baseline with --output on a quiet machine;
+benchmarks/baseline.json is the reference run of the default sizes (re-record it
+on new hardware before comparing).
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import itertools
+import json
+import platform
+import random
+import sys
+import time
+import timeit
+import uuid
+from dataclasses import asdict, dataclass
+from decimal import Decimal
+from typing import Any, Callable, Iterable
+
+from src.pizza.domain.delivery import Coordinates, Courier, Dispatcher, Vehicle
+from src.pizza.domain.inventory import Ingredient, IngredientRequirement, InMemoryInventory
+from src.pizza.domain.menu import Menu
+from src.pizza.domain.order import Order
+from src.pizza.domain.pricing import BuyNGetMFree, FirstOrderCoupon, NoDiscount, PercentOff
+from src.pizza.domain.products import Pizza, PizzaSize, Topping
+from src.pizza.domain.repository import InMemoryOrderRepository
+from src.pizza.domain.types import OrderId
+
+SIZES = (10, 1_000, 100_000)
+SCHEMA = 1
+"""Version of the JSON result layout; baselines of another version are rejected."""
+
+Operation = Callable[[], object]
+CaseSetup = Callable[["DataGenerator", int], Operation]
+CASES: dict[str, CaseSetup] = {}
+
+
+def case(name: str) -> Callable[[CaseSetup], CaseSetup]:
+    """Register ``setup(gen, size) -> operation``; the operation is what gets timed."""
+
+    def register(setup: CaseSetup) -> CaseSetup:
+        CASES[name] = setup
+        return setup
+
+    return register
+
+
+class DataGenerator:
+    """Seeded source of menus, orders, stock and fleets; equal seeds give equal data."""
+
+    def __init__(self, seed: int) -> None:
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.ingredients = [Ingredient(f"ingredient-{i}", "g", f"in-{i}") for i in range(16)]
+
+    def money(self, low: int = 5, high: int = 25) -> Decimal:
+        return Decimal(self.rng.randint(low * 100, high * 100)) / 100
+
+    def recipe(self, length: int = 4) -> list[IngredientRequirement]:
+        return [
+            IngredientRequirement(ingredient, Decimal(self.rng.randint(10, 300)))
+            for ingredient in self.rng.sample(self.ingredients, min(length, len(self.ingredients)))
+        ]
+
+    def menu(self, pizzas: int, toppings: int = 20) -> Menu:
+        return Menu(
+            [
+                Pizza(f"Pizza {i:06d}", self.money(), f"pz-{i:06d}", self.recipe())
+                for i in range(pizzas)
+            ],
+            [
+                Topping(f"Topping {i:04d}", self.money(1, 3), f"tp-{i:04d}", self.recipe(1))
+                for i in range(toppings)
+            ],
+        )
+
+    def order_id(self) -> OrderId:
+        return OrderId(uuid.UUID(int=self.rng.getrandbits(128), version=4))
+
+    def order(self, menu: Menu, lines: int) -> Order:
+        order = Order(
+            menu,
+            self.order_id(),
+            f"c{self.rng.randrange(10_000)}",
+            Coordinates(self.rng.uniform(0, 10), self.rng.uniform(0, 10)),
+            [],
+            None,
+            None,
+        )
+        pizzas = menu.list_pizzas()
+        toppings = [topping.sku for topping in menu.list_toppings()]
+        for _ in range(lines):
+            order.add_item(
+                self.rng.choice(pizzas).sku,
+                self.rng.choice(list(PizzaSize)),
+                self.rng.randint(1, 3),
+                self.rng.sample(toppings, self.rng.randint(0, 2)),
+            )
+        return order
+
+    def stock(self, ingredients: int) -> InMemoryInventory:
+        """Plenty of every recipe ingredient, padded with others up to ``ingredients``."""
+
+        extra = [Ingredient(f"stock-{i}", "g") for i in range(ingredients - len(self.ingredients))]
+        return InMemoryInventory(
+            {ingredient: Decimal(10**12) for ingredient in self.ingredients + extra}
+        )
+
+    def fleet(self, size: int) -> list[Courier]:
+        vehicles = [Vehicle("bike", 1.0), Vehicle("scooter", 1.5), Vehicle("car", 2.0)]
+        return [
+            Courier(
+                f"k{i}",
+                Coordinates(self.rng.uniform(0, 10), self.rng.uniform(0, 10)),
+                self.rng.choice(vehicles),
+                True,
+            )
+            for i in range(size)
+        ]
+
+    def cycle(self, values: Iterable[Any], count: int = 1_024) -> Callable[[], Any]:
+        """``next`` of an endless shuffled sample of ``count`` values."""
+
+        values = list(values)
+        return itertools.cycle([self.rng.choice(values) for _ in range(count)]).__next__
+
+
+@case("menu.find_pizza_sku")
+def menu_find_pizza_sku(gen: DataGenerator, size: int) -> Operation:
+    """size = pizzas on the menu."""
+
+    menu = gen.menu(size)
+    find = menu.find_pizza_sku
+    sku = gen.cycle(pizza.sku.upper() for pizza in menu.list_pizzas())
+    return lambda: find(sku())
+
+
+@case("menu.find_pizza_name")
+def menu_find_pizza_name(gen: DataGenerator, size: int) -> Operation:
+    """size = pizzas on the menu; queries are name fragments matching one pizza."""
+
+    menu = gen.menu(size)
+    find = menu.find_pizza_name
+    name = gen.cycle(pizza.name[-6:] for pizza in menu.list_pizzas())
+    return lambda: find(name())
+
+
+@case("pizza.unit_price")
+def pizza_unit_price(gen: DataGenerator, size: int) -> Operation:
+    """size = distinct pizzas priced in rotation."""
+
+    pizza = gen.cycle(gen.menu(size, 0).list_pizzas())
+    pizza_size = gen.cycle(PizzaSize)
+    return lambda: pizza().unit_price(pizza_size())
+
+
+@case("pizza.requirements")
+def pizza_requirements(gen: DataGenerator, size: int) -> Operation:
+    """size = ingredients in the recipe (up to the generator's 16)."""
+
+    pizza = Pizza("Bench", gen.money(), "pz-bench", gen.recipe(size))
+    pizza_size = gen.cycle(PizzaSize)
+    return lambda: pizza.requirements(pizza_size())
+
+
+@case("order.add_item")
+def order_add_item(gen: DataGenerator, size: int) -> Operation:
+    """size = pizzas on the menu; every call adds one line with one topping, then clears."""
+
+    menu = gen.menu(size)
+    order = gen.order(menu, 0)
+    sku = gen.cycle(pizza.sku for pizza in menu.list_pizzas())
+    topping = gen.cycle([topping.sku] for topping in menu.list_toppings())
+
+    def operation() -> None:
+        order.add_item(sku(), PizzaSize.MEDIUM, 2, topping())
+        order.clear()
+
+    return operation
+
+
+@case("order.subtotal")
+def order_subtotal(gen: DataGenerator, size: int) -> Operation:
+    """size = order lines."""
+
+    return gen.order(gen.menu(50), size).subtotal
+
+
+def _pricing_case(name: str, strategy: Any, metadata: dict[str, Any] | None = None) -> None:
+    @case(f"pricing.{name}.apply")
+    def pricing_apply(gen: DataGenerator, size: int) -> Operation:
+        """size = order lines (each of 1-3 units); the OrderView is built once."""
+
+        order = gen.order(gen.menu(50), size)
+        order.metadata.update(metadata or {})
+        view = order.as_view()
+        return lambda: strategy.apply(view)
+
+
+_pricing_case("NoDiscount", NoDiscount())
+_pricing_case("PercentOff", PercentOff(Decimal("15")))
+_pricing_case("BuyNGetMFree", BuyNGetMFree(2, 1))
+_pricing_case(
+    "FirstOrderCoupon",
+    FirstOrderCoupon("WELCOME", Decimal("20")),
+    {"coupon_code": "WELCOME", "is_first_order": True},
+)
+
+
+@case("inventory.reserve_commit")
+def inventory_reserve_commit(gen: DataGenerator, size: int) -> Operation:
+    """size = ingredients in stock (at least 16); every reservation is a 4-ingredient recipe."""
+
+    inventory = gen.stock(size)
+    requirements = gen.cycle(
+        [{req.ingredient: req.amount for req in gen.recipe()} for _ in range(64)]
+    )
+    reserve, commit = inventory.reserve, inventory.commit
+    return lambda: commit(reserve(requirements()))
+
+
+@case("dispatcher.assign_release")
+def dispatcher_assign_release(gen: DataGenerator, size: int) -> Operation:
+    """size = couriers, all available; no strategy, so any free courier is taken."""
+
+    dispatcher = Dispatcher(gen.fleet(size))
+    assign, release = dispatcher.assign, dispatcher.release
+    return lambda: release(assign("o").courier_id)
+
+
+@case("repository.save")
+def repository_save(gen: DataGenerator, size: int) -> Operation:
+    """size = orders stored; every call re-saves (upserts) one of them."""
+
+    repository, orders = _repository(gen, size)
+    order = gen.cycle(orders)
+    return lambda: repository.save(order())
+
+
+@case("repository.get")
+def repository_get(gen: DataGenerator, size: int) -> Operation:
+    """size = orders stored."""
+
+    repository, orders = _repository(gen, size)
+    order_id = gen.cycle(str(order.id) for order in orders)
+    return lambda: repository.get(order_id())
+
+
+def _repository(gen: DataGenerator, size: int) -> tuple[InMemoryOrderRepository, list[Order]]:
+    menu = gen.menu(10)
+    repository = InMemoryOrderRepository()
+    orders = [gen.order(menu, 1) for _ in range(size)]
+    for order in orders:
+        repository.save(order)
+    return repository, orders
+
+
+@dataclass(frozen=True, slots=True)
+class Measurement:
+    """Timing of one case at one size.
+
+    Fields:
+      case: Registered case name.
+      size: Data size the case was set up with.
+      ns_per_op: Best round's time per call (what baselines are compared on).
+      median_ns: Median round's time per call.
+      number: Calls per round.
+      repeat: Rounds.
+    """
+
+    case: str
+    size: int
+    ns_per_op: float
+    median_ns: float
+    number: int
+    repeat: int
+
+
+@dataclass(frozen=True, slots=True)
+class Regression:
+    case: str
+    size: int
+    baseline_ns: float
+    ns_per_op: float
+
+    @property
+    def ratio(self) -> float:
+        return self.ns_per_op / self.baseline_ns
+
+
+def measure(
+    name: str, size: int, seed: int = 0, repeat: int = 5, min_time: float = 0.05
+) -> Measurement:
+    """Set the case up with fresh seeded data and time it."""
+
+    operation = CASES[name](DataGenerator(seed), size)
+    timer = timeit.Timer(operation)
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+    rounds = sorted(timer.repeat(repeat, number))
+    return Measurement(
+        name,
+        size,
+        rounds[0] / number * 1e9,
+        rounds[len(rounds) // 2] / number * 1e9,
+        number,
+        repeat,
+    )
+
+
+def run(
+    names: Iterable[str],
+    sizes: Iterable[int],
+    seed: int = 0,
+    repeat: int = 5,
+    min_time: float = 0.05,
+    progress: Callable[[Measurement], None] | None = None,
+) -> dict[str, Any]:
+    """Measure every case at every size; returns the JSON-ready result document."""
+
+    results = []
+    for name in names:
+        for size in sizes:
+            result = measure(name, size, seed, repeat, min_time)
+            results.append(result)
+            if progress is not None:
+                progress(result)
+    return {
+        "schema": SCHEMA,
+        "meta": {
+            "seed": seed,
+            "repeat": repeat,
+            "min_time": min_time,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": [asdict(result) for result in results],
+    }
+
+
+def compare(
+    current: dict[str, Any], baseline: dict[str, Any], threshold: float
+) -> list[Regression]:
+    """(case, size) pairs more than ``threshold`` (a fraction) slower than the baseline."""
+
+    if baseline.get("schema") != SCHEMA:
+        raise ValueError(f"baseline schema {baseline.get('schema')!r}, expected {SCHEMA}")
+    reference = {(r["case"], r["size"]): r["ns_per_op"] for r in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        before = reference.get((result["case"], result["size"]))
+        if before is not None and result["ns_per_op"] > before * (1 + threshold):
+            regressions.append(
+                Regression(result["case"], result["size"], before, result["ns_per_op"])
+            )
+    return regressions
+
+
+def select(patterns: Iterable[str]) -> list[str]:
+    names = [name for name in CASES if any(fnmatch.fnmatch(name, p) for p in patterns)]
+    if not names:
+        raise ValueError(f"no case matches {list(patterns)}; cases: {', '.join(CASES)}")
+    return names
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default=",".join(map(str, SIZES)))
+    parser.add_argument("--cases", default="*", help="comma-separated glob patterns")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.05, help="seconds per round")
+    parser.add_argument("--output", help="write the JSON results here (- for stdout)")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown")
+    parser.add_argument("--list", action="store_true", help="list the cases and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, setup in CASES.items():
+            print(f"{name:32} {(setup.__doc__ or '').strip()}")
+        return 0
+    baseline = None
+    if args.baseline is not None:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+
+    log = sys.stderr if args.output == "-" else sys.stdout
+    document = run(
+        select(args.cases.split(",")),
+        [int(size) for size in args.sizes.split(",")],
+        args.seed,
+        args.repeat,
+        args.min_time,
+        lambda r: print(f"{r.case:32} size={r.size:>7} {r.ns_per_op:>12,.0f} ns/op", file=log),
+    )
+    if args.output == "-":
+        json.dump(document, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    elif args.output is not None:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(document, file, indent=2)
+            file.write("\n")
+
+    if baseline is None:
+        return 0
+    regressions = compare(document, baseline, args.threshold)
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression.case} size={regression.size}: "
+            f"{regression.baseline_ns:,.0f} -> {regression.ns_per_op:,.0f} ns/op "
+            f"({regression.ratio:.2f}x, threshold {1 + args.threshold:.2f}x)",
+            file=log,
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
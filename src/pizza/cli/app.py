@@ -1 +1,231 @@
-"""Заглушка: CLI-каркас (команды: menu, order new, add-item, bake, dispatch и др.)."""
+"""Command-line interface: one-shot commands, a streaming batch mode and a daemon.
+
+Run: python -m src.pizza.cli.app [--config FILE] [--store FILE] COMMAND ...
+     python -m src.pizza.cli.app batch [FILE]     # "-" or no FILE reads stdin
+     python -m src.pizza.cli.app daemon [serve|stop|status] [--socket PATH]
+
+Every command prints one JSON line. Batch mode runs commands (words or JSON
+objects, one per line) against one warm Session and streams one result line per
+command, so replaying a file costs no process start per command.
+
+While a daemon is listening on the socket, one-shot commands are sent to it and
+only this module and cli/protocol.py are imported; the domain stays warm in the
+daemon. Commands given --config/--store/--couriers/--oven-capacity, and batch
+mode, always run in process; --no-daemon forces that for any command.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import TYPE_CHECKING, Any, TextIO
+
+from .protocol import DaemonClient, default_socket_path
+
+if TYPE_CHECKING:
+    import inspect
+
+    from .session import Session
+
+STATE_OPTIONS = ("config", "store", "couriers", "oven_capacity")
+"""Global options that shape the session state (a daemon has its own)."""
+
+
+class _RaisingParser(argparse.ArgumentParser):
+    """Parser for command lines received by the daemon: errors and -h raise instead of exiting.
+
+    The daemon's stdout is not the client's, so help comes back as the message of
+    a CommandError, and nothing a request contains can end the daemon process.
+    """
+
+    def error(self, message: str) -> None:  # type: ignore[override]
+        from .session import CommandError
+
+        raise CommandError(message)
+
+    def print_help(self, file: TextIO | None = None) -> None:
+        from .session import CommandError
+
+        raise CommandError(self.format_help())
+
+    def exit(self, status: int = 0, message: str | None = None) -> None:  # type: ignore[override]
+        from .session import CommandError
+
+        raise CommandError(message or f"{self.prog}: exit {status}")
+
+
+def global_options(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
+    parser.add_argument("--config", help="menu and stock JSON (default: built-in demo menu)")
+    parser.add_argument("--store", help="order log file (default: orders kept in memory)")
+    parser.add_argument("--couriers", type=int, default=None, help="fleet size (default 20)")
+    parser.add_argument("--oven-capacity", type=int, default=None, help="units per bake (8)")
+    parser.add_argument("--socket", default=None, help="daemon socket (default $PIZZA_SOCKET)")
+    parser.add_argument("--no-daemon", action="store_true", help="never use a running daemon")
+    return parser
+
+
+def build_parser(parser_class: type[argparse.ArgumentParser] = argparse.ArgumentParser):
+    from .session import COMMANDS, Session
+
+    parser = global_options(parser_class(prog="pizza", description="Pizza delivery CLI."))
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    batch = commands.add_parser("batch", help="run commands streamed from a file or stdin")
+    batch.add_argument("input", nargs="?", default="-", help="command file, - for stdin")
+    daemon = commands.add_parser("daemon", help="serve commands from a warm session")
+    daemon.add_argument("action", nargs="?", default="serve", choices=("serve", "stop", "status"))
+
+    order = commands.add_parser("order", help="order commands").add_subparsers(
+        dest="order_command", required=True
+    )
+    for name, method in COMMANDS.items():
+        target = order if name.startswith("order ") else commands
+        function = getattr(Session, method)
+        command = target.add_parser(
+            name.split(" ")[-1], help=(function.__doc__ or "").splitlines()[0]
+        )
+        for parameter in _parameters(function):
+            if parameter.kind is parameter.VAR_POSITIONAL:
+                command.add_argument(parameter.name, nargs="*")
+            elif parameter.default is parameter.empty:
+                command.add_argument(parameter.name)
+            else:
+                command.add_argument(parameter.name, nargs="?", default=parameter.default)
+    return parser
+
+
+def open_session(args: argparse.Namespace) -> "Session":
+    from .session import Session, load_config
+
+    menu, stock = load_config(args.config)
+    repository = None
+    if args.store is not None:
+        from ..infra.log_store import LogStructuredOrderRepository
+
+        repository = LogStructuredOrderRepository(args.store, menu)
+    return Session(
+        menu,
+        stock,
+        repository,
+        20 if args.couriers is None else args.couriers,
+        8 if args.oven_capacity is None else args.oven_capacity,
+    )
+
+
+def run_command(session: "Session", args: argparse.Namespace) -> dict[str, Any]:
+    """Run the parsed one-shot command on the session."""
+
+    from .session import COMMANDS, CommandError
+
+    if args.command in ("batch", "daemon"):
+        return {"ok": False, "error": "CommandError", "message": f"{args.command} runs locally"}
+    name = "order " + args.order_command if args.command == "order" else args.command
+    values: list = []
+    for parameter in _parameters(getattr(type(session), COMMANDS[name])):
+        value = getattr(args, parameter.name)
+        if parameter.kind is parameter.VAR_POSITIONAL:
+            values.extend(value)
+        else:
+            values.append(value)
+    try:
+        return session.call(name, values)
+    except CommandError as exc:
+        return {"ok": False, "error": "CommandError", "message": str(exc)}
+
+
+def execute(session: "Session", parser: argparse.ArgumentParser, argv: list[str]):
+    """Parse and run one command line (the daemon's request handler)."""
+
+    from .session import CommandError
+
+    try:
+        return run_command(session, parser.parse_args(argv))
+    except CommandError as exc:
+        return {"ok": False, "error": "CommandError", "message": str(exc)}
+
+
+def main(
+    argv: list[str] | None = None, stdin: TextIO | None = None, stdout: TextIO | None = None
+) -> int:
+    """Run the CLI; returns the exit status (1 if any command failed)."""
+
+    argv = sys.argv[1:] if argv is None else list(argv)
+    stdout = stdout or sys.stdout
+    options, words = global_options(argparse.ArgumentParser(add_help=False)).parse_known_args(argv)
+    path = options.socket or default_socket_path()
+    local = (
+        options.no_daemon
+        or not words
+        or words[0] in ("batch", "daemon", "-h", "--help")
+        or "-h" in words
+        or "--help" in words
+        or any(getattr(options, name) is not None for name in STATE_OPTIONS)
+    )
+    if not local:
+        client = DaemonClient.connect(path)
+        if client is not None:
+            with client:
+                result = client.request(words)
+            return _print(stdout, result)
+
+    args = build_parser().parse_args(argv)
+    if args.command == "daemon" and args.action != "serve":
+        client = DaemonClient.connect(path)
+        if client is None:
+            return _print(stdout, {"ok": False, "error": "NoDaemon", "message": path})
+        with client:
+            return _print(
+                stdout, client.send({"op": "ping" if args.action == "status" else "shutdown"})
+            )
+
+    session = open_session(args)
+    try:
+        if args.command == "daemon":
+            return _serve(session, path)
+        if args.command == "batch":
+            source = (
+                (stdin or sys.stdin) if args.input == "-" else open(args.input, encoding="utf-8")
+            )
+            try:
+                stdout.writelines(session.run_batch(source))
+            finally:
+                if source is not stdin and source is not sys.stdin:
+                    source.close()
+            return 1 if session.errors else 0
+        return _print(stdout, run_command(session, args))
+    finally:
+        close = getattr(session.repository, "close", None)
+        if close is not None:
+            close()
+
+
+def _serve(session: "Session", path: str) -> int:
+    import asyncio
+
+    from .daemon import CommandDaemon
+
+    parser = build_parser(_RaisingParser)
+    daemon = CommandDaemon(lambda argv: execute(session, parser, argv), path)
+    try:
+        asyncio.run(daemon.run())
+    except RuntimeError as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    return 0
+
+
+def _print(stdout: TextIO, result: dict[str, Any]) -> int:
+    import json
+
+    stdout.write(json.dumps(result, separators=(",", ":"), ensure_ascii=False) + "\n")
+    return 0 if result.get("ok") else 1
+
+
+def _parameters(function: object) -> list["inspect.Parameter"]:
+    import inspect
+
+    return list(inspect.signature(function).parameters.values())[1:]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
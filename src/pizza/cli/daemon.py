@@ -0,0 +1,131 @@
+"""Long-running daemon that serves CLI commands over a Unix domain socket."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import signal
+from typing import Any, Callable
+
+from .protocol import FRAME, MAX_FRAME, DaemonClient, ProtocolError, encode_frame
+
+Handler = Callable[[list[str]], dict[str, Any]]
+"""Runs one CLI command line and returns its JSON-ready result."""
+
+
+async def read_frame(reader: asyncio.StreamReader) -> Any | None:
+    """Next message from a stream, or None at a clean end of stream."""
+
+    try:
+        header = await reader.readexactly(FRAME.size)
+    except asyncio.IncompleteReadError as exc:
+        if exc.partial:
+            raise ProtocolError("connection closed inside a frame header") from None
+        return None
+    (length,) = FRAME.unpack(header)
+    if length > MAX_FRAME:
+        raise ProtocolError(f"frame of {length} bytes exceeds {MAX_FRAME}")
+    try:
+        return json.loads(await reader.readexactly(length))
+    except asyncio.IncompleteReadError:
+        raise ProtocolError("connection closed inside a frame") from None
+
+
+class CommandDaemon:
+    """Unix-socket server running every request through one ``handler`` on the event loop.
+
+    Requests are handled one at a time on the loop thread, so the handler's state
+    (a warm Session) needs no locking. The socket file is created with mode 0600
+    and removed on close; a stale file left by a crashed daemon is replaced, a
+    live daemon on the same path makes start() raise RuntimeError.
+
+    Usage:
+        daemon = CommandDaemon(lambda argv: execute(session, argv), path)
+        await daemon.run()          # until SIGINT/SIGTERM or a "shutdown" request
+    """
+
+    def __init__(self, handler: Handler, path: str) -> None:
+        self.handler = handler
+        self.path = path
+        self.requests = 0
+        self._server: asyncio.Server | None = None
+        self._stopped = asyncio.Event()
+        self._connections: dict[asyncio.Task, asyncio.StreamWriter] = {}
+
+    async def start(self) -> "CommandDaemon":
+        if os.path.exists(self.path):
+            client = DaemonClient.connect(self.path)
+            if client is not None:
+                client.close()
+                raise RuntimeError(f"a daemon is already listening on {self.path}")
+            os.unlink(self.path)
+        self._server = await asyncio.start_unix_server(self._serve, self.path)
+        os.chmod(self.path, 0o600)
+        return self
+
+    async def run(self) -> None:
+        """Serve until stop() is called, a shutdown request arrives or SIGINT/SIGTERM."""
+
+        if self._server is None:
+            await self.start()
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, self._stopped.set)
+        try:
+            await self._stopped.wait()
+        finally:
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                loop.remove_signal_handler(signum)
+            await self.close()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    async def close(self) -> None:
+        if self._server is None:
+            return
+        self._server.close()
+        for writer in self._connections.values():
+            writer.close()  # the handler sees end of stream and returns
+        await asyncio.gather(*self._connections, return_exceptions=True)
+        await self._server.wait_closed()
+        self._server = None
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+    def handle(self, message: Any) -> dict[str, Any]:
+        """Answer one request object."""
+
+        self.requests += 1
+        if not isinstance(message, dict):
+            return {"ok": False, "error": "ProtocolError", "message": "request must be an object"}
+        op = message.get("op")
+        if op == "ping":
+            return {"ok": True, "pid": os.getpid(), "requests": self.requests}
+        if op == "shutdown":
+            self._stopped.set()
+            return {"ok": True}
+        argv = message.get("argv")
+        if not isinstance(argv, list) or not all(isinstance(word, str) for word in argv):
+            return {"ok": False, "error": "ProtocolError", "message": "argv must be a list of str"}
+        try:
+            return self.handler(argv)
+        except Exception as exc:  # a failing command must not drop the connection
+            return {"ok": False, "error": type(exc).__name__, "message": str(exc)}
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        connection = asyncio.current_task()
+        if connection is not None:
+            self._connections[connection] = writer
+        try:
+            while (message := await read_frame(reader)) is not None:
+                writer.write(encode_frame(self.handle(message)))
+                await writer.drain()
+        except (ProtocolError, json.JSONDecodeError, ConnectionError):
+            pass  # drop the misbehaving connection; the daemon keeps serving others
+        finally:
+            self._connections.pop(connection, None)
+            writer.close()
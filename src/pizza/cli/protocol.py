@@ -0,0 +1,89 @@
+"""Framed JSON protocol between the CLI client and the daemon (stdlib only, fast to import).
+
+Every message is FRAME (payload length, big-endian u32) followed by a UTF-8 JSON
+payload. Requests are {"argv": [words...]} (a CLI command line), {"op": "ping"}
+or {"op": "shutdown"}; every request gets exactly one response object on the same
+connection, which may carry any number of requests.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import struct
+from typing import Any
+
+FRAME = struct.Struct(">I")
+MAX_FRAME = 16 * 2**20
+"""Largest accepted payload in bytes; longer frames are a protocol error."""
+
+
+class ProtocolError(Exception):
+    """Malformed or oversized frame, or the peer closed mid-frame."""
+
+
+def default_socket_path() -> str:
+    """$PIZZA_SOCKET, or a per-user socket in $XDG_RUNTIME_DIR, $TMPDIR or /tmp."""
+
+    directory = os.environ.get("XDG_RUNTIME_DIR") or os.environ.get("TMPDIR") or "/tmp"
+    return os.environ.get("PIZZA_SOCKET") or os.path.join(directory, f"pizza-{os.getuid()}.sock")
+
+
+def encode_frame(message: Any) -> bytes:
+    payload = json.dumps(message, separators=(",", ":"), ensure_ascii=False).encode()
+    if len(payload) > MAX_FRAME:
+        raise ProtocolError(f"frame of {len(payload)} bytes exceeds {MAX_FRAME}")
+    return FRAME.pack(len(payload)) + payload
+
+
+class DaemonClient:
+    """Blocking client for a running daemon.
+
+    Usage:
+        client = DaemonClient.connect()      # None if no daemon is listening
+        if client is not None:
+            with client:
+                result = client.request(["order", "new", "alice"])
+    """
+
+    def __init__(self, sock: socket.socket) -> None:
+        self._socket = sock
+        self._file = sock.makefile("rb")
+
+    @classmethod
+    def connect(cls, path: str | None = None, timeout: float = 5.0) -> "DaemonClient | None":
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(timeout)
+        try:
+            sock.connect(path or default_socket_path())
+        except (FileNotFoundError, ConnectionRefusedError):
+            sock.close()
+            return None
+        return cls(sock)
+
+    def __enter__(self) -> "DaemonClient":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._file.close()
+        self._socket.close()
+
+    def request(self, argv: list[str]) -> dict[str, Any]:
+        """Run one CLI command line on the daemon and return its result object."""
+
+        return self.send({"argv": argv})
+
+    def send(self, message: dict[str, Any]) -> dict[str, Any]:
+        self._socket.sendall(encode_frame(message))
+        header = self._file.read(FRAME.size)
+        if len(header) < FRAME.size:
+            raise ProtocolError("daemon closed the connection")
+        (length,) = FRAME.unpack(header)
+        payload = self._file.read(length)
+        if len(payload) < length:
+            raise ProtocolError("daemon closed the connection inside a frame")
+        return json.loads(payload)
@@ -0,0 +1,422 @@
+"""Warm in-process CLI state and the command handlers shared by all CLI front ends."""
+
+from __future__ import annotations
+
+import inspect
+import json
+import shlex
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Mapping
+
+from ..domain.delivery import Coordinates, Courier, Dispatcher, Vehicle
+from ..domain.errors import DomainError, PaymentAlreadyCaptured, PricingError
+from ..domain.inventory import BatchOven, Ingredient, IngredientRequirement, InMemoryInventory
+from ..domain.menu import Menu
+from ..domain.order import Order
+from ..domain.payment import CashPayment
+from ..domain.products import MULTIPLIERS, Pizza, PizzaSize, Topping
+from ..domain.repository import InMemoryOrderRepository, OrderRepository, PaymentRecord
+from ..domain.types import OrderId
+
+Result = dict[str, Any]
+
+_SCALARS = (str, int, float)
+"""JSON value types accepted as command arguments (null, booleans, lists and objects are
+not); variadic arguments such as toppings must be lists of strings."""
+
+DEFAULT_CONFIG: Mapping[str, Any] = {
+    "ingredients": {
+        "dough": {"unit": "kg", "stock": "1000000000"},
+        "tomato": {"unit": "kg", "stock": "1000000000"},
+        "mozzarella": {"unit": "kg", "stock": "1000000000"},
+        "pepperoni": {"unit": "kg", "stock": "1000000000"},
+        "basil": {"unit": "g", "stock": "1000000000"},
+        "olives": {"unit": "g", "stock": "1000000000"},
+    },
+    "pizzas": [
+        {
+            "sku": "pz-mar",
+            "name": "Margherita",
+            "price": "9.50",
+            "recipe": {"dough": "0.25", "tomato": "0.1", "mozzarella": "0.12"},
+        },
+        {
+            "sku": "pz-pep",
+            "name": "Pepperoni",
+            "price": "11.00",
+            "recipe": {"dough": "0.25", "tomato": "0.1", "mozzarella": "0.12", "pepperoni": "0.08"},
+        },
+    ],
+    "toppings": [
+        {"sku": "tp-basil", "name": "Basil", "price": "0.50", "requirements": {"basil": "5"}},
+        {"sku": "tp-olives", "name": "Olives", "price": "0.80", "requirements": {"olives": "20"}},
+    ],
+}
+"""Menu and stock used when no config file is given."""
+
+COMMANDS: Mapping[str, str] = {
+    "menu": "menu_command",
+    "order new": "order_new",
+    "add-item": "add_item",
+    "accept": "accept",
+    "bake": "bake",
+    "box": "box",
+    "dispatch": "dispatch",
+    "deliver": "deliver",
+    "cancel": "cancel",
+    "pay": "pay",
+    "show": "show",
+}
+"""Command name -> Session method; the method signature is the command's grammar."""
+
+LAST_ORDER = "@"
+"""Order reference meaning "the order most recently created in this session"."""
+
+
+class CommandError(ValueError):
+    """Malformed command: unknown name, wrong arguments or unparsable values."""
+
+
+def load_config(path: str | Path | None) -> tuple[Menu, dict[Ingredient, Decimal]]:
+    """Build the menu and initial stock from a JSON config (DEFAULT_CONFIG if None).
+
+    Format: {"ingredients": {name: {"unit", "stock"}}, "pizzas": [{"sku", "name",
+    "price", "recipe": {ingredient: amount}}], "toppings": [{"sku", "name", "price",
+    "requirements": {ingredient: amount}}]}; amounts and prices are decimal strings.
+    """
+
+    config = DEFAULT_CONFIG if path is None else json.loads(Path(path).read_text())
+    ingredients = {
+        name: Ingredient(name, spec["unit"]) for name, spec in config["ingredients"].items()
+    }
+
+    def requirements(amounts: Mapping[str, str]) -> list[IngredientRequirement]:
+        return [IngredientRequirement(ingredients[n], Decimal(a)) for n, a in amounts.items()]
+
+    menu = Menu(
+        pizzas=[
+            Pizza(p["name"], Decimal(p["price"]), p["sku"], requirements(p["recipe"]))
+            for p in config["pizzas"]
+        ],
+        toppings=[
+            Topping(t["name"], Decimal(t["price"]), t["sku"], requirements(t["requirements"]))
+            for t in config.get("toppings", ())
+        ],
+    )
+    stock = {
+        ingredients[name]: Decimal(spec.get("stock", "0"))
+        for name, spec in config["ingredients"].items()
+    }
+    return menu, stock
+
+
+class Session:
+    """Domain state kept warm across CLI commands.
+
+    Holds the menu, inventory, one oven stand-in, a dispatcher with ``couriers`` bikes
+    and an order repository (in memory unless one is passed, e.g. a log store).
+    Every command loads its order from the repository, mutates it and saves it
+    back, so the repository is the single source of truth.
+
+    Commands are plain-string calls, ``run(["add-item", "@", "pz-mar", "large", "2"])``,
+    or JSON objects, ``run_json({"cmd": "add-item", "order": "@", "sku": "pz-mar"})``;
+    both return a JSON-ready dict with ``"ok"``. Domain and usage errors are
+    reported as ``{"ok": false, "error": <class name>, "message": ...}``.
+    """
+
+    def __init__(
+        self,
+        menu: Menu,
+        stock: Mapping[Ingredient, Decimal],
+        repository: OrderRepository | None = None,
+        couriers: int = 20,
+        oven_capacity: int = 8,
+    ) -> None:
+        self.menu = menu
+        self.inventory = InMemoryInventory(stock)
+        self.oven = BatchOven(oven_capacity)
+        bike = Vehicle("bike", 1.0)
+        self.dispatcher = Dispatcher(
+            [Courier(f"courier-{i}", Coordinates(0, 0), bike, True) for i in range(couriers)]
+        )
+        self.repository = repository if repository is not None else InMemoryOrderRepository()
+        self.cash = CashPayment()
+        self.last_order: str | None = None
+        self._trips: dict[str, str] = {}
+        self._sizes = {size.value: size for size in PizzaSize}
+        self.errors = 0
+        self.dumps = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+        self.commands: dict[str, Callable[..., Result]] = {
+            name: getattr(self, method) for name, method in COMMANDS.items()
+        }
+        self._parameters = {
+            name: tuple(inspect.signature(handler).parameters.values())
+            for name, handler in self.commands.items()
+        }
+        self._arity = {name: _arity(parameters) for name, parameters in self._parameters.items()}
+
+    def run(self, argv: list[str]) -> Result:
+        """Run one command given as words; never raises for domain or usage errors."""
+
+        if not argv:
+            return _error(CommandError("empty command"))
+        name, args = argv[0], argv[1:]
+        if name == "order":
+            name, args = "order " + (args[0] if args else ""), args[1:]
+        return self.call(name, args)
+
+    def run_json(self, command: Mapping[str, Any]) -> Result:
+        """Run one command given as {"cmd": name, <parameter>: value, ...}."""
+
+        name = command.get("cmd")
+        parameters = self._parameters.get(name) if isinstance(name, str) else None
+        if parameters is None:
+            return _error(CommandError(f"unknown command {name!r}"))
+        args = []
+        for parameter in parameters:
+            if parameter.kind is parameter.VAR_POSITIONAL:
+                values = command.get(parameter.name, [])
+                if not isinstance(values, list) or not all(
+                    isinstance(value, str) for value in values
+                ):
+                    return _error(
+                        CommandError(f"{name}: {parameter.name!r} must be a list of strings")
+                    )
+                args.extend(values)
+            elif parameter.name in command:
+                value = command[parameter.name]
+                if isinstance(value, bool) or not isinstance(value, _SCALARS):
+                    return _error(
+                        CommandError(f"{name}: {parameter.name!r} must be a string or number")
+                    )
+                args.append(value)
+            elif parameter.default is not parameter.empty:
+                args.append(parameter.default)
+            else:
+                return _error(CommandError(f"{name}: missing {parameter.name!r}"))
+        return self.call(name, args)
+
+    def call(self, name: str, args: list[Any]) -> Result:
+        """Run a command with positional arguments in its method's parameter order."""
+
+        handler = self.commands.get(name)
+        if handler is None:
+            return _error(CommandError(f"unknown command {name!r}"))
+        low, high = self._arity[name]
+        if not low <= len(args) <= high:
+            return _error(CommandError(f"{name}: expected {low}..{high} arguments"))
+        try:
+            return handler(*args)
+        except (DomainError, PricingError, ValueError) as exc:
+            return _error(exc)
+
+    def run_line(self, line: str) -> Result | None:
+        """Run one batch line: JSON object or words (shell quoting allowed); None if blank."""
+
+        text = line.strip()
+        if not text or text[0] == "#":
+            return None
+        if text[0] == "{":
+            try:
+                command = json.loads(text)
+            except json.JSONDecodeError as exc:
+                return _error(CommandError(f"bad JSON: {exc}"))
+            if not isinstance(command, dict):
+                return _error(CommandError("JSON command must be an object"))
+            return self.run_json(command)
+        if '"' in text or "'" in text:
+            try:
+                return self.run(shlex.split(text))
+            except ValueError as exc:
+                return _error(CommandError(str(exc)))
+        return self.run(text.split())
+
+    def run_batch(self, lines: Iterable[str]) -> Iterator[str]:
+        """Yield one JSON result line per command line, numbered by input line.
+
+        Lines are consumed lazily, so input and output are both streamed;
+        failed commands are counted in ``errors``.
+        """
+
+        dumps = self.dumps
+        for number, line in enumerate(lines, 1):
+            result = self.run_line(line)
+            if result is not None:
+                if not result["ok"]:
+                    self.errors += 1
+                yield dumps({"line": number, **result}) + "\n"
+
+    # Commands. Arguments arrive as strings (words) or JSON values.
+
+    def menu_command(self) -> Result:
+        """List pizzas with prices per size, and toppings."""
+
+        return {
+            "ok": True,
+            "pizzas": [
+                {
+                    "sku": pizza.sku,
+                    "name": pizza.name,
+                    "prices": {size.value: str(pizza.unit_price(size)) for size in MULTIPLIERS},
+                }
+                for pizza in self.menu.list_pizzas()
+            ],
+            "toppings": [
+                {"sku": topping.sku, "name": topping.name, "price": str(topping.unit_price())}
+                for topping in self.menu.list_toppings()
+            ],
+        }
+
+    def order_new(self, customer: str, x: str = "0", y: str = "0", id: str = "") -> Result:
+        """Create an order; ``id`` (UUID) keeps IDs stable when replaying exports."""
+
+        order_id = OrderId.from_str(id) if id else OrderId.generate()
+        order = Order(
+            self.menu, order_id, customer, Coordinates(float(x), float(y)), [], None, None
+        )
+        self.last_order = self.repository.save(order)
+        return {"ok": True, "order": self.last_order}
+
+    def add_item(
+        self, order: str, sku: str, size: str = "medium", qty: str = "1", *toppings: str
+    ) -> Result:
+        """Add ``qty`` pizzas of one size with toppings (SKUs) to a NEW/ACCEPTED order."""
+
+        entity = self._load(order)
+        pizza_size = self._sizes.get(str(size).lower())
+        if pizza_size is None:
+            raise CommandError(f"unknown size {size!r}")
+        entity.add_item(sku, pizza_size, _whole(qty, "qty"), toppings)
+        self.repository.save(entity)
+        return {"ok": True, "order": str(entity.id), "subtotal": str(entity.subtotal())}
+
+    def accept(self, order: str) -> Result:
+        """NEW -> ACCEPTED."""
+
+        return self._transition(order, Order.accept)
+
+    def bake(self, order: str) -> Result:
+        """ACCEPTED -> BAKING, consuming ingredients."""
+
+        return self._transition(order, lambda o: o.bake(self.inventory, self.oven))
+
+    def box(self, order: str) -> Result:
+        """BAKING -> BOXED."""
+
+        return self._transition(order, Order.box)
+
+    def dispatch(self, order: str) -> Result:
+        """BOXED -> DISPATCHED with the next free courier."""
+
+        entity = self._load(order)
+        assignment = entity.dispatch(self.dispatcher)
+        order_id = self.repository.save(entity)
+        self.repository.link_courier(order_id, assignment.courier_id)
+        self._trips[order_id] = assignment.courier_id
+        return {
+            "ok": True,
+            "order": order_id,
+            "status": entity.status.value,
+            "courier": assignment.courier_id,
+            "eta": assignment.eta,
+        }
+
+    def deliver(self, order: str) -> Result:
+        """DISPATCHED -> DELIVERED; the courier becomes available again."""
+
+        result = self._transition(order, Order.deliver)
+        courier_id = self._trips.pop(result["order"], None)
+        if courier_id is not None:
+            self.dispatcher.release(courier_id)
+        return result
+
+    def cancel(self, order: str) -> Result:
+        """NEW/ACCEPTED -> CANCELED."""
+
+        return self._transition(order, Order.cancel)
+
+    def pay(self, order: str, method: str = "cash") -> Result:
+        """Authorize and capture the order total (only cash is handled in process)."""
+
+        if method != "cash":
+            raise CommandError(f"payment method {method!r} needs a provider; use cash")
+        entity = self._load(order)
+        order_id = str(entity.id)
+        previous = self.repository.payment_record(order_id)
+        if previous is not None and previous.status == "captured":
+            raise PaymentAlreadyCaptured()
+        authorized = self.cash.authorize(entity)
+        captured = self.cash.capture(entity, authorized.amount)
+        self.repository.record_payment(
+            order_id,
+            PaymentRecord(
+                captured.payment_id,
+                "cash",
+                str(authorized.amount),
+                str(captured.amount),
+                "0",
+                "captured",
+                ("authorize", "capture"),
+            ),
+        )
+        return {
+            "ok": True,
+            "order": order_id,
+            "payment": captured.payment_id,
+            "amount": str(captured.amount),
+            "status": "captured",
+        }
+
+    def show(self, order: str) -> Result:
+        """Order status, items and totals."""
+
+        entity = self._load(order)
+        return {
+            "ok": True,
+            "order": str(entity.id),
+            "customer": entity.customer,
+            "status": entity.status.value,
+            "items": [
+                {
+                    "sku": item.pizza.sku,
+                    "size": item.size.value,
+                    "qty": item.qty,
+                    "toppings": [topping.sku for topping in item.toppings],
+                }
+                for item in entity.items_view()
+            ],
+            "subtotal": str(entity.subtotal()),
+            "total": str(entity.final_total()),
+        }
+
+    def _load(self, order: str) -> Order:
+        if order == LAST_ORDER:
+            if self.last_order is None:
+                raise CommandError("no order created yet")
+            order = self.last_order
+        return self.repository.get(order)
+
+    def _transition(self, order: str, step: Callable[[Order], object]) -> Result:
+        entity = self._load(order)
+        step(entity)
+        order_id = self.repository.save(entity)
+        return {"ok": True, "order": order_id, "status": entity.status.value}
+
+
+def _error(exc: Exception) -> Result:
+    return {"ok": False, "error": type(exc).__name__, "message": str(exc)}
+
+
+def _whole(value: str | int | float, name: str) -> int:
+    """``value`` as an int; a float with a fractional part is an error, not truncated."""
+
+    if isinstance(value, float) and not value.is_integer():
+        raise CommandError(f"{name} must be a whole number, got {value!r}")
+    return int(value)
+
+
+def _arity(parameters: tuple[inspect.Parameter, ...]) -> tuple[int, float]:
+    required = sum(1 for p in parameters if p.default is p.empty and p.kind is not p.VAR_POSITIONAL)
+    variadic = any(p.kind is p.VAR_POSITIONAL for p in parameters)
+    return required, float("inf") if variadic else len(parameters)
@@ -0,0 +1,316 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Awaitable, Callable, Iterable, Literal, Sequence
+
+from .errors import EventBufferOverflow
+from .events import OrderEvent, add_sink
+from .status import OrderStatus
+
+if TYPE_CHECKING:
+    from .order import Order
+
+OverflowPolicy = Literal["drop-oldest", "drop-newest", "error"]
+Handler = Callable[[Sequence[OrderEvent]], "Awaitable[None] | None"]
+
+
+@dataclass(frozen=True, slots=True)
+class SubscriptionStats:
+    """Counters of one bus subscriber.
+
+    Fields:
+      received: Events accepted into the buffer.
+      delivered: Events handed to the handler.
+      dropped: Events discarded by the overflow policy.
+      batches: Handler calls.
+      errors: Handler calls that raised (the batch is not retried).
+      buffered: Events waiting for delivery now.
+    """
+
+    received: int
+    delivered: int
+    dropped: int
+    batches: int
+    errors: int
+    buffered: int
+
+
+class Subscription:
+    """A handler registered on an EventBus, with its own bounded buffer.
+
+    Events are handed over in batches of up to ``batch_size``, once the buffer holds
+    ``batch_size`` events or its oldest event is ``max_delay`` seconds old. Sync
+    handlers run inline in the publishing call when a batch is due; there is no
+    timer for them, so ``max_delay`` is checked when the next event is published
+    (call EventBus.flush() to deliver a quiet subscriber's leftovers). Coroutine
+    handlers run on a delivery task once the bus is started, which also enforces
+    ``max_delay`` between publishes. When ``max_buffer`` events are waiting,
+    ``overflow`` decides: "drop-oldest" evicts the oldest, "drop-newest" discards
+    the new event, "error" discards it and records an EventBufferOverflow that
+    EventBus.check() (and stop()) raises. Publishing never raises, so a transition
+    is never half-reported and bulk transitions run to the end.
+    """
+
+    def __init__(
+        self,
+        bus: EventBus,
+        handler: Handler,
+        name: str,
+        batch_size: int,
+        max_delay: float,
+        max_buffer: int,
+        overflow: OverflowPolicy,
+    ) -> None:
+        self.bus = bus
+        self.handler = handler
+        self.name = name
+        self.batch_size = batch_size
+        self.max_delay = max_delay
+        self.max_buffer = max_buffer
+        self.overflow = overflow
+        self.is_async = inspect.iscoroutinefunction(handler)
+        self._buffer: deque[OrderEvent] = deque()
+        self._ready = asyncio.Event()
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+        self._received = 0
+        self._delivered = 0
+        self._dropped = 0
+        self._batches = 0
+        self._errors = 0
+        self._overflow: EventBufferOverflow | None = None
+
+    def stats(self) -> SubscriptionStats:
+        return SubscriptionStats(
+            self._received,
+            self._delivered,
+            self._dropped,
+            self._batches,
+            self._errors,
+            len(self._buffer),
+        )
+
+    def flush(self) -> None:
+        """Deliver everything buffered now (sync handlers only)."""
+
+        if self.is_async:
+            raise TypeError(f"{self.name} has an async handler, use EventBus.drain()")
+        while self._buffer:
+            self._call(self._take())
+
+    def _offer(self, event: OrderEvent) -> None:
+        buffer = self._buffer
+        if len(buffer) >= self.max_buffer:
+            self._dropped += 1
+            if self.overflow == "drop-newest":
+                return
+            if self.overflow == "error":
+                self._overflow = EventBufferOverflow(self.name, self.max_buffer)
+                return
+            buffer.popleft()
+        buffer.append(event)
+        self._received += 1
+        due = len(buffer) >= self.batch_size or event.at - buffer[0].at >= self.max_delay
+        if self.is_async:
+            if due or len(buffer) == 1:
+                self._ready.set()
+        elif due:
+            self.flush()
+
+    def _take(self) -> list[OrderEvent]:
+        buffer = self._buffer
+        popleft = buffer.popleft
+        return [popleft() for _ in range(min(self.batch_size, len(buffer)))]
+
+    def _call(self, batch: list[OrderEvent]) -> None:
+        self._batches += 1
+        self._delivered += len(batch)
+        try:
+            self.handler(batch)
+        except Exception:
+            self._errors += 1
+
+    async def _deliver(self, batch: list[OrderEvent]) -> None:
+        self._batches += 1
+        self._delivered += len(batch)
+        try:
+            await self.handler(batch)  # type: ignore[misc]
+        except Exception:
+            self._errors += 1
+
+    async def _drain(self) -> None:
+        if not self.is_async:
+            self.flush()
+            return
+        async with self._lock:
+            while self._buffer:
+                await self._deliver(self._take())
+
+    async def _run(self) -> None:
+        buffer = self._buffer
+        ready = self._ready
+        clock = self.bus.clock
+        while True:
+            await ready.wait()
+            ready.clear()
+            while buffer:
+                if len(buffer) < self.batch_size:
+                    delay = buffer[0].at + self.max_delay - clock()
+                    if delay > 0:
+                        try:
+                            await asyncio.wait_for(ready.wait(), delay)
+                        except TimeoutError:
+                            pass
+                        ready.clear()
+                        continue
+                async with self._lock:
+                    if buffer:
+                        await self._deliver(self._take())
+
+
+class EventBus:
+    """In-process publish/subscribe bus for Order status changes.
+
+    Implements EventSink, so ``bus.track(order)`` (or ``order.events = bus``) makes
+    every transition publish an OrderEvent. Subscribers are indexed by the statuses
+    they care about, and a publish only appends the event to their buffers (see
+    Subscription), so its cost does not depend on what the handlers do unless a
+    sync handler's batch becomes due. Not thread-safe: publish from one thread
+    (the event loop's, when async subscribers are used).
+
+    Usage:
+        bus = EventBus()
+        bus.subscribe(kitchen_display, statuses=[OrderStatus.ACCEPTED])
+        bus.subscribe(analytics, batch_size=500, max_delay=1.0)   # async def analytics
+        await bus.start()
+        bus.track(order)
+        ...
+        await bus.stop()                                          # delivers the rest
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self.clock = clock
+        self._seq = 0
+        self._subscriptions: list[Subscription] = []
+        self._by_status: dict[OrderStatus, tuple[Subscription, ...]] = {
+            status: () for status in OrderStatus
+        }
+        self._started = False
+
+    def subscribe(
+        self,
+        handler: Handler,
+        *,
+        statuses: Iterable[OrderStatus] | None = None,
+        batch_size: int = 1,
+        max_delay: float = 0.05,
+        max_buffer: int = 10_000,
+        overflow: OverflowPolicy = "drop-oldest",
+        name: str | None = None,
+    ) -> Subscription:
+        """Register a handler called with lists of OrderEvents.
+
+        ``statuses`` limits the events to transitions into those statuses (default: all).
+        """
+
+        if batch_size <= 0 or max_buffer < batch_size:
+            raise ValueError("batch_size must be > 0 and max_buffer >= batch_size")
+        if max_delay < 0:
+            raise ValueError(f"max_delay must be >= 0, got {max_delay}")
+        if overflow not in ("drop-oldest", "drop-newest", "error"):
+            raise ValueError(f"unknown overflow policy {overflow!r}")
+        subscription = Subscription(
+            self,
+            handler,
+            name or getattr(handler, "__qualname__", repr(handler)),
+            batch_size,
+            max_delay,
+            max_buffer,
+            overflow,
+        )
+        self._subscriptions.append(subscription)
+        for status in OrderStatus if statuses is None else statuses:
+            self._by_status[status] += (subscription,)
+        if self._started and subscription.is_async:
+            subscription._task = asyncio.create_task(subscription._run())
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Stop routing events to the subscription; its buffered events are discarded."""
+
+        self._subscriptions.remove(subscription)
+        for status, targets in self._by_status.items():
+            self._by_status[status] = tuple(s for s in targets if s is not subscription)
+        if subscription._task is not None:
+            subscription._task.cancel()
+            subscription._task = None
+
+    def track(self, order: "Order") -> None:
+        """Publish the order's transitions from now on (alongside any sink it has)."""
+
+        add_sink(order, self)
+
+    def emit(self, order_id: str, previous: OrderStatus | None, status: OrderStatus) -> None:
+        seq = self._seq
+        self._seq = seq + 1
+        targets = self._by_status[status]
+        if not targets:
+            return
+        event = OrderEvent(seq, order_id, previous, status, self.clock())
+        for subscription in targets:
+            subscription._offer(event)
+
+    def check(self) -> None:
+        """Raise EventBufferOverflow if an "error"-policy subscriber dropped events.
+
+        Each overflow is reported once; the next check() only sees new ones.
+        """
+
+        for subscription in self._subscriptions:
+            overflow = subscription._overflow
+            if overflow is not None:
+                subscription._overflow = None
+                raise overflow
+
+    def flush(self) -> None:
+        """Deliver everything buffered for sync subscribers now."""
+
+        for subscription in self._subscriptions:
+            if not subscription.is_async:
+                subscription.flush()
+
+    async def start(self) -> None:
+        """Start delivery tasks for async subscribers (on the running loop)."""
+
+        self._started = True
+        for subscription in self._subscriptions:
+            if subscription.is_async and subscription._task is None:
+                subscription._task = asyncio.create_task(subscription._run())
+
+    async def drain(self) -> None:
+        """Deliver everything buffered for every subscriber."""
+
+        for subscription in list(self._subscriptions):
+            await subscription._drain()
+
+    async def stop(self) -> None:
+        """Drain all buffers, stop the delivery tasks, then check() for overflows."""
+
+        await self.drain()
+        self._started = False
+        tasks = [s._task for s in self._subscriptions if s._task is not None]
+        for subscription in self._subscriptions:
+            subscription._task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.check()
+
+    def stats(self) -> dict[str, SubscriptionStats]:
+        """Subscription name -> counters."""
+
+        return {s.name: s.stats() for s in self._subscriptions}
@@ -1,5 +1,12 @@
+import math
 from dataclasses import dataclass
-from typing import Literal, Protocol, Sequence
+from typing import Literal, Mapping, Protocol, Sequence
+
+from .errors import CourierUnavailable, NoCouriersAvailable
+from .metrics import instrumented
+
+BASE_SPEED = 20.0
+"""Distance units per hour covered by a vehicle with speed_coef == 1.0."""
 
 
 @dataclass(frozen=True, slots=True)
@@ -29,6 +36,18 @@ class Courier:
     current_load: int | None = None
 
 
+def distance(a: Coordinates, b: Coordinates) -> float:
+    """Straight-line distance between two points."""
+
+    return math.hypot(a.x - b.x, a.y - b.y)
+
+
+def travel_time(a: Coordinates, b: Coordinates, vehicle: Vehicle) -> float:
+    """Travel time in hours between two points for the given vehicle."""
+
+    return distance(a, b) / (BASE_SPEED * vehicle.speed_coef)
+
+
 class AssignmentStrategy(Protocol):
     """Interface for courier assignment strategies."""
 
@@ -50,23 +69,126 @@ class AssignmentResult:
 
 
 class Dispatcher:
-    """Dispatcher managing couriers and assignment strategy."""
+    """Dispatcher managing couriers and assignment strategy.
 
-    def __init__(self, couriers: list[Courier], strategy: AssignmentResult) -> None:
-        self.couriers = couriers
-        self.strategy = strategy
+    Index:
+      - _by_id: courier_id -> Courier
+      - _available: courier_id -> Courier for couriers free to take an order
 
-    def assign(self, order: str) -> AssignmentResult:
-        """Assign a courier to the order (allowed only if couriers available)."""
+    Availability changes must go through assign/release/mark_unavailable so the index
+    stays in sync with ``Courier.available``.
+    """
 
-        raise NotImplementedError
+    def __init__(self, couriers: list[Courier], strategy: AssignmentStrategy | None = None) -> None:
+        self.couriers = couriers
+        self.strategy = strategy
+        self._by_id: dict[str, Courier] = {courier.id: courier for courier in couriers}
+        self._available: dict[str, Courier] = {
+            courier.id: courier for courier in couriers if courier.available
+        }
+
+    @instrumented("dispatcher.assign")
+    def assign(self, order: str, address: Coordinates | None = None) -> AssignmentResult:
+        """Assign a courier to the order (allowed only if couriers available).
+
+        Without a strategy or address any available courier is taken in O(1); a strategy
+        only sees the available couriers, never the whole fleet.
+        """
+
+        if not self._available:
+            raise NoCouriersAvailable()
+
+        if self.strategy is None or address is None:
+            _, courier = self._available.popitem()
+            strategy_name = "any-available"
+        else:
+            courier = self.strategy.choose(address, tuple(self._available.values()))
+            if self._available.pop(courier.id, None) is None:
+                raise CourierUnavailable(courier.id)
+            strategy_name = type(self.strategy).__name__
+
+        courier.available = False
+        courier.current_load = (courier.current_load or 0) + 1
+        return AssignmentResult(
+            order_id=order,
+            courier_id=courier.id,
+            strategy_name=strategy_name,
+            eta=None
+            if address is None
+            else travel_time(courier.location, address, courier.vehicle),
+        )
 
     def set_strategy(self, strategy: AssignmentStrategy) -> None:
         """Change assignment strategy (does not affect past assignments)."""
 
-        raise NotImplementedError
+        self.strategy = strategy
+
+    def courier(self, courier_id: str) -> Courier:
+        """Return the courier by ID or raise CourierUnavailable."""
+
+        try:
+            return self._by_id[courier_id]
+        except KeyError:
+            raise CourierUnavailable(courier_id) from None
+
+    def has_available(self) -> bool:
+        """Return True if at least one courier can take an order."""
+
+        return bool(self._available)
+
+    def available_count(self) -> int:
+        """Number of couriers free to take an order."""
+
+        return len(self._available)
+
+    def available_couriers(self) -> Sequence[Courier]:
+        """Couriers free to take an order."""
+
+        return tuple(self._available.values())
+
+    def send_out(self, courier_id: str, orders: int) -> None:
+        """Send an available courier out with ``orders`` more deliveries.
+
+        Raise CourierUnavailable if the courier is unknown or not available.
+        """
+
+        courier = self._available.pop(courier_id, None)
+        if courier is None:
+            raise CourierUnavailable(courier_id)
+        courier.available = False
+        courier.current_load = (courier.current_load or 0) + orders
+
+    def release(self, courier_id: str) -> None:
+        """Courier returned from a trip: empty the load and make it available again."""
+
+        courier = self.courier(courier_id)
+        courier.current_load = 0
+        courier.available = True
+        self._available[courier_id] = courier
+
+    def mark_unavailable(self, courier_id: str) -> None:
+        """Take the courier out of rotation (shift end, breakdown)."""
+
+        courier = self.courier(courier_id)
+        courier.available = False
+        self._available.pop(courier_id, None)
 
     def update_courier_location(self, courier_id: str, new_location: Coordinates) -> None:
-        """Update courier coordinates (stub in v0.1.0)."""
+        """Update courier coordinates; raise CourierUnavailable for an unknown courier."""
 
-        raise NotImplementedError
+        self.courier(courier_id).location = new_location
+
+    def update_courier_locations(self, updates: Mapping[str, Coordinates]) -> int:
+        """Apply a batch of courier_id -> location updates; return how many were applied.
+
+        Unknown courier IDs are skipped.
+        """
+
+        by_id = self._by_id
+        applied = 0
+        for courier_id, location in updates.items():
+            courier = by_id.get(courier_id)
+            if courier is not None:
+                courier.location = location
+                applied += 1
+        return applied
@@ -166,6 +166,26 @@ class DuplicateOrderId(DomainError):
         return f"Duplicate order id: {self.order_id}"
 
 
+class StaleOrderVersion(DomainError):
+    """Optimistic concurrency conflict: the order changed since it was read."""
+
+    def __init__(self, order_id: str, expected: int, actual: int):
+        self.order_id = order_id
+        self.expected = expected
+        self.actual = actual
+
+    def __str__(self) -> str:
+        return (
+            f"Stale write of order {self.order_id}: version {self.expected}, stored {self.actual}"
+        )
+
+
+class OrderDecodeError(DomainError):
+    """Serialized order data is corrupt or written for another format/menu version."""
+
+    pass
+
+
 class InvalidOrderItem(DomainError):
     """Invalid order item."""
 
@@ -197,6 +217,16 @@ class PaymentAlreadyCaptured(PaymentError):
         return "Payment already captured"
 
 
+class PaymentAlreadyQueued(PaymentError):
+    """Order queued for settlement twice before settle()."""
+
+    def __init__(self, order_id: str):
+        self.order_id = order_id
+
+    def __str__(self) -> str:
+        return f"Payment of order {self.order_id} is already queued for settlement"
+
+
 class PaymentAmountMismatch(PaymentError):
     """Invalid capture amount (not within allowed bounds)."""
 
@@ -218,7 +248,45 @@ class RefundExceedsCapture(PaymentError):
         return f"Refund exceeds captured amount: {self.amount}"
 
 
+class PaymentProviderError(PaymentError):
+    """Payment provider failed or returned an unexpected response."""
+
+    def __init__(self, provider: str, reason: str):
+        self.provider = provider
+        self.reason = reason
+
+    def __str__(self) -> str:
+        return f"Payment provider {self.provider} error: {self.reason}"
+
+
+class PaymentTimeout(PaymentProviderError):
+    """Payment provider did not answer in time."""
+
+    def __init__(self, provider: str, timeout: float):
+        super().__init__(provider, f"no response within {timeout}s")
+        self.timeout = timeout
+
+
+class PaymentCircuitOpen(PaymentProviderError):
+    """Circuit breaker is open: provider calls are failing fast."""
+
+    def __init__(self, provider: str, retry_in: float):
+        super().__init__(provider, f"circuit open, retry in {retry_in:.1f}s")
+        self.retry_in = retry_in
+
+
 class DuplicateSku(DomainError):
     """Duplicate sku."""
 
     pass
+
+
+class EventBufferOverflow(DomainError):
+    """A bus subscriber's buffer is full and its overflow policy is "error"."""
+
+    def __init__(self, subscriber: str, capacity: int):
+        self.subscriber = subscriber
+        self.capacity = capacity
+
+    def __str__(self) -> str:
+        return f"Event buffer of {self.subscriber} is full ({self.capacity} events)"
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Mapping, Protocol, Sequence
+
+from .status import OrderStatus
+from .types import OrderId
+
+if TYPE_CHECKING:
+    from .order import Order
+
+
+@dataclass(frozen=True, slots=True)
+class OrderEvent:
+    """One order lifecycle step.
+
+    Fields:
+      seq: Position in the event log, from 0.
+      order_id: Order the event belongs to.
+      previous: Status before the step (None when the order is first tracked).
+      status: Status after the step.
+      at: Clock reading when the step happened (seconds).
+    """
+
+    seq: int
+    order_id: str
+    previous: OrderStatus | None
+    status: OrderStatus
+    at: float
+
+
+class EventSink(Protocol):
+    """Receiver of Order status changes (Order.events)."""
+
+    def emit(self, order_id: str, previous: OrderStatus | None, status: OrderStatus) -> None:
+        raise NotImplementedError
+
+
+class EventFanOut:
+    """EventSink forwarding every status change to several sinks, in order."""
+
+    def __init__(self, sinks: Iterable[EventSink]) -> None:
+        self.sinks: tuple[EventSink, ...] = tuple(sinks)
+
+    def emit(self, order_id: str, previous: OrderStatus | None, status: OrderStatus) -> None:
+        for sink in self.sinks:
+            sink.emit(order_id, previous, status)
+
+
+def add_sink(order: "Order", sink: EventSink) -> None:
+    """Make ``sink`` receive the order's transitions too, keeping any sink it has."""
+
+    current = order.events
+    if current is None or current is sink:
+        order.events = sink
+    elif isinstance(current, EventFanOut):
+        if sink not in current.sinks:
+            current.sinks += (sink,)
+    else:
+        order.events = EventFanOut((current, sink))
+
+
+class Projection(Protocol):
+    """Read model maintained incrementally from events."""
+
+    def apply(self, event: OrderEvent) -> None:
+        """Fold one event into the projection in O(1)."""
+        raise NotImplementedError
+
+    def reset(self) -> None:
+        """Forget everything applied so far."""
+        raise NotImplementedError
+
+
+class StatusCounts:
+    """Number of tracked orders currently in each status."""
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self._counts = dict.fromkeys(OrderStatus, 0)
+
+    def apply(self, event: OrderEvent) -> None:
+        if event.previous is not None:
+            self._counts[event.previous] -= 1
+        self._counts[event.status] += 1
+
+    def __getitem__(self, status: OrderStatus) -> int:
+        return self._counts[status]
+
+    def as_dict(self) -> Mapping[OrderStatus, int]:
+        return dict(self._counts)
+
+
+class TimeInStatus:
+    """Average time orders spent in each status they have left."""
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self._entered: dict[str, float] = {}
+        self._total = dict.fromkeys(OrderStatus, 0.0)
+        self._left = dict.fromkeys(OrderStatus, 0)
+
+    def apply(self, event: OrderEvent) -> None:
+        entered = self._entered.get(event.order_id)
+        if event.previous is not None and entered is not None:
+            self._total[event.previous] += event.at - entered
+            self._left[event.previous] += 1
+        if event.status in (OrderStatus.DELIVERED, OrderStatus.CANCELED):
+            self._entered.pop(event.order_id, None)
+        else:
+            self._entered[event.order_id] = event.at
+
+    def average(self, status: OrderStatus) -> float:
+        """Mean seconds spent in ``status`` (0.0 if no order has left it yet)."""
+
+        left = self._left[status]
+        return self._total[status] / left if left else 0.0
+
+
+class StuckOrders:
+    """Orders that have been in ``status`` for longer than ``threshold`` seconds.
+
+    Orders are kept in the order they entered the status, which is also the order
+    of their entry times, so stuck() stops at the first order that is not stuck.
+    """
+
+    def __init__(self, status: OrderStatus = OrderStatus.BAKING, threshold: float = 900.0) -> None:
+        self.status = status
+        self.threshold = threshold
+        self.reset()
+
+    def reset(self) -> None:
+        self._since: dict[str, float] = {}
+
+    def apply(self, event: OrderEvent) -> None:
+        if event.status is self.status:
+            self._since.pop(event.order_id, None)
+            self._since[event.order_id] = event.at
+        elif event.previous is self.status:
+            self._since.pop(event.order_id, None)
+
+    def stuck(self, now: float) -> Sequence[str]:
+        """Order IDs in the status since before ``now - threshold``, oldest first."""
+
+        limit = now - self.threshold
+        result = []
+        for order_id, since in self._since.items():
+            if since > limit:
+                break
+            result.append(order_id)
+        return result
+
+    def __len__(self) -> int:
+        return len(self._since)
+
+
+class OrderEventLog:
+    """Append-only log of order lifecycle events feeding projections.
+
+    Usage:
+        counts = StatusCounts()
+        log = OrderEventLog([counts])
+        log.track(order)   # records the current status, adds the log to order.events
+        order.accept()     # appends NEW -> ACCEPTED and updates counts
+    """
+
+    def __init__(
+        self,
+        projections: Iterable[Projection] = (),
+        clock: Callable[[], float] = time.time,
+        events: Iterable[OrderEvent] = (),
+    ) -> None:
+        self.projections = list(projections)
+        self._clock = clock
+        self._events: list[OrderEvent] = list(events)
+        self._tracked: set[str] = {event.order_id for event in self._events}
+        self.replay()
+
+    def track(self, order: "Order") -> None:
+        """Start recording an order's transitions (an order without ID gets one).
+
+        Sinks the order already has (e.g. an EventBus) keep receiving them too.
+        Idempotent per order ID: an order already in the log is re-attached without
+        a second ``None -> status`` event.
+        """
+
+        if order.id is None:
+            order.id = OrderId.generate()
+        add_sink(order, self)
+        order_id = str(order.id)
+        if order_id not in self._tracked:
+            self._tracked.add(order_id)
+            self.emit(order_id, None, order.status)
+
+    def emit(self, order_id: str, previous: OrderStatus | None, status: OrderStatus) -> None:
+        event = OrderEvent(len(self._events), order_id, previous, status, self._clock())
+        self._events.append(event)
+        for projection in self.projections:
+            projection.apply(event)
+
+    def replay(self, projections: Iterable[Projection] | None = None) -> None:
+        """Rebuild projections (default: the attached ones) from the whole log."""
+
+        targets = self.projections if projections is None else list(projections)
+        for projection in targets:
+            projection.reset()
+        for event in self._events:
+            for projection in targets:
+                projection.apply(event)
+
+    def events(self, after: int = -1) -> Iterator[OrderEvent]:
+        """Events with seq > ``after``, oldest first."""
+
+        return iter(self._events[after + 1 :])
+
+    def __len__(self) -> int:
+        return len(self._events)
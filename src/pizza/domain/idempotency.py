@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, TypeVar
+
+from .cache import TTLCache
+from .payment import (
+    Money,
+    Payment,
+    PaymentAuthResult,
+    PaymentCaptureResult,
+    PaymentRefundResult,
+)
+from .types import quantize_money
+
+if TYPE_CHECKING:
+    from .order import Order
+
+V = TypeVar("V")
+IdempotencyKey = tuple[str, str, str]
+"""(order id, operation, amount) of a payment call."""
+
+
+def idempotency_key(order_id: str, operation: str, amount: Money) -> IdempotencyKey:
+    """Key for one payment call; the amount is normalized to cents."""
+
+    return order_id, operation, str(quantize_money(amount))
+
+
+@dataclass(frozen=True, slots=True)
+class IdempotencyStats:
+    """Counters of an idempotency layer.
+
+    Fields:
+      hits: Repeated requests answered from the store.
+      misses: Requests that reached the provider.
+      coalesced: Requests that joined an identical in-flight call.
+      evictions: Entries dropped by the LRU bound.
+      expired: Entries dropped because their TTL passed.
+      size: Entries currently stored.
+    """
+
+    hits: int
+    misses: int
+    coalesced: int
+    evictions: int
+    expired: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of requests that did not reach the provider."""
+
+        total = self.hits + self.coalesced + self.misses
+        return (self.hits + self.coalesced) / total if total else 0.0
+
+
+class IdempotencyStore(TTLCache[V]):
+    """TTLCache of payment results, by default sized for a day of calls."""
+
+    def __init__(
+        self,
+        max_entries: int = 100_000,
+        ttl: float = 24 * 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(max_entries, ttl, clock)
+
+
+class _Counters:
+    __slots__ = ("hits", "misses", "coalesced")
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def snapshot(self, store: IdempotencyStore) -> IdempotencyStats:
+        return IdempotencyStats(
+            hits=self.hits,
+            misses=self.misses,
+            coalesced=self.coalesced,
+            evictions=store.evictions,
+            expired=store.expired,
+            size=len(store),
+        )
+
+
+class IdempotentPayment:
+    """Payment wrapper that answers repeated calls from an IdempotencyStore.
+
+    Calls are keyed on (order id, operation, amount). Successful results are stored;
+    errors are not, so a retry after a failure reaches the provider again. Identical
+    calls running concurrently in other threads wait for the first one instead of
+    calling the provider. Note that two refunds of the same amount within the TTL are
+    treated as one retried refund.
+    """
+
+    def __init__(self, inner: Payment, store: IdempotencyStore | None = None) -> None:
+        self.inner = inner
+        self.method = inner.method
+        self.store: IdempotencyStore = store if store is not None else IdempotencyStore()
+        self._counters = _Counters()
+        self._inflight: dict[IdempotencyKey, Future] = {}
+        self._lock = threading.Lock()
+
+    def authorize(self, order: "Order") -> PaymentAuthResult:
+        key = idempotency_key(str(order.id), "authorize", order.final_total())
+        return self._once(key, lambda: self.inner.authorize(order))
+
+    def capture(self, order: "Order", amount: Money) -> PaymentCaptureResult:
+        key = idempotency_key(str(order.id), "capture", amount)
+        return self._once(key, lambda: self.inner.capture(order, amount))
+
+    def refund(self, order: "Order", amount: Money) -> PaymentRefundResult:
+        key = idempotency_key(str(order.id), "refund", amount)
+        return self._once(key, lambda: self.inner.refund(order, amount))
+
+    def stats(self) -> IdempotencyStats:
+        """Return hit/miss/coalescing counters and store size."""
+
+        return self._counters.snapshot(self.store)
+
+    def _once(self, key: IdempotencyKey, call: Callable[[], Any]) -> Any:
+        with self._lock:
+            cached = self.store.get(key)
+            if cached is not None:
+                self._counters.hits += 1
+                return cached
+            pending = self._inflight.get(key)
+            if pending is None:
+                pending = self._inflight[key] = Future()
+                owner = True
+                self._counters.misses += 1
+            else:
+                owner = False
+                self._counters.coalesced += 1
+
+        if not owner:
+            return pending.result()
+
+        try:
+            result = call()
+        except BaseException as exc:
+            pending.set_exception(exc)
+            raise
+        else:
+            self.store.put(key, result)
+            pending.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+
+class AsyncIdempotentPayment:
+    """Asyncio counterpart of IdempotentPayment for clients with async authorize/capture/refund.
+
+    Concurrent identical calls share one provider round-trip via a shared asyncio future.
+    """
+
+    def __init__(self, inner: Any, store: IdempotencyStore | None = None) -> None:
+        self.inner = inner
+        self.method = inner.method
+        self.store: IdempotencyStore = store if store is not None else IdempotencyStore()
+        self._counters = _Counters()
+        self._inflight: dict[IdempotencyKey, asyncio.Future] = {}
+
+    async def authorize(self, order: "Order") -> PaymentAuthResult:
+        key = idempotency_key(str(order.id), "authorize", order.final_total())
+        return await self._once(key, lambda: self.inner.authorize(order))
+
+    async def capture(self, order: "Order", amount: Money) -> PaymentCaptureResult:
+        key = idempotency_key(str(order.id), "capture", amount)
+        return await self._once(key, lambda: self.inner.capture(order, amount))
+
+    async def refund(self, order: "Order", amount: Money) -> PaymentRefundResult:
+        key = idempotency_key(str(order.id), "refund", amount)
+        return await self._once(key, lambda: self.inner.refund(order, amount))
+
+    def stats(self) -> IdempotencyStats:
+        """Return hit/miss/coalescing counters and store size."""
+
+        return self._counters.snapshot(self.store)
+
+    async def _once(self, key: IdempotencyKey, call: Callable[[], Awaitable[Any]]) -> Any:
+        cached = self.store.get(key)
+        if cached is not None:
+            self._counters.hits += 1
+            return cached
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self._counters.coalesced += 1
+            return await asyncio.shield(pending)
+
+        self._counters.misses += 1
+        pending = self._inflight[key] = asyncio.get_running_loop().create_future()
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            pending.cancel()
+            raise
+        except BaseException as exc:
+            pending.set_exception(exc)
+            pending.exception()  # mark retrieved when nobody else is waiting
+            raise
+        else:
+            self.store.put(key, result)
+            pending.set_result(result)
+            return result
+        finally:
+            del self._inflight[key]
@@ -1,9 +1,17 @@
 from __future__ import annotations
 
+import itertools
 from dataclasses import dataclass
 from decimal import Decimal
 from typing import TYPE_CHECKING, Mapping, Protocol, Sequence
 
+from .errors import (
+    InsufficientIngredients,
+    OvenCapacityExceeded,
+    OvenUnavailable,
+    ReservationError,
+)
+
 if TYPE_CHECKING:
     from .order import OrderUnit
 
@@ -50,3 +58,94 @@ class Oven(Protocol):
 
     def bake_batch(self, items: Sequence[OrderUnit]) -> None:
         raise NotImplementedError
+
+
+class InMemoryInventory:
+    """Inventory kept in a dict; reserved amounts are held back until commit/release.
+
+    Storage:
+      - _stock: ingredient -> amount on hand (reserved amounts included).
+      - _reserved: ingredient -> total amount held by open reservations.
+      - _tokens: reservation id -> requirements it holds.
+    """
+
+    def __init__(self, stock: Mapping[Ingredient, Decimal]) -> None:
+        self._stock: dict[Ingredient, Decimal] = dict(stock)
+        self._reserved: dict[Ingredient, Decimal] = {}
+        self._tokens: dict[str, Mapping[Ingredient, Decimal]] = {}
+        self._ids = itertools.count()
+
+    def availability(self, requirements: Mapping[Ingredient, Decimal]) -> bool:
+        """Return True if every requirement is covered by unreserved stock."""
+
+        return self._shortage(requirements) is None
+
+    def reserve(self, requirements: Mapping[Ingredient, Decimal]) -> ReservationToken:
+        """Hold the amounts for a later commit; raise InsufficientIngredients if short."""
+
+        shortage = self._shortage(requirements)
+        if shortage is not None:
+            raise InsufficientIngredients(*shortage)
+        snapshot = dict(requirements)
+        reserved = self._reserved
+        for ingredient, amount in snapshot.items():
+            reserved[ingredient] = reserved.get(ingredient, 0) + amount
+        token = ReservationToken(str(next(self._ids)), snapshot)
+        self._tokens[token.id] = snapshot
+        return token
+
+    def commit(self, token: ReservationToken) -> None:
+        """Consume the reserved amounts from stock."""
+
+        stock = self._stock
+        for ingredient, amount in self._close(token).items():
+            stock[ingredient] -= amount
+
+    def release(self, token: ReservationToken) -> None:
+        """Return the reserved amounts to the available stock."""
+
+        self._close(token)
+
+    def current_stock(self) -> Mapping[Ingredient, Decimal]:
+        return dict(self._stock)
+
+    def _shortage(
+        self, requirements: Mapping[Ingredient, Decimal]
+    ) -> tuple[Mapping[str, Decimal], Mapping[str, Decimal]] | None:
+        needed = {}
+        available = {}
+        for ingredient, amount in requirements.items():
+            free = self._stock.get(ingredient, 0) - self._reserved.get(ingredient, 0)
+            if free < amount:
+                needed[ingredient.name] = amount
+                available[ingredient.name] = free
+        return (needed, available) if needed else None
+
+    def _close(self, token: ReservationToken) -> Mapping[Ingredient, Decimal]:
+        snapshot = self._tokens.pop(token.id, None)
+        if snapshot is None:
+            raise ReservationError(f"unknown or closed reservation {token.id}")
+        reserved = self._reserved
+        for ingredient, amount in snapshot.items():
+            reserved[ingredient] -= amount
+        return snapshot
+
+
+class BatchOven:
+    """Oven stand-in that accepts batches of up to ``capacity`` units and counts them."""
+
+    def __init__(self, capacity: int) -> None:
+        if capacity < 0:
+            raise ValueError(f"capacity must be >= 0, got {capacity}")
+        self.capacity = capacity
+        self.baked = 0
+
+    def can_bake(self, count: int) -> bool:
+        return 0 < count <= self.capacity
+
+    def bake_batch(self, items: Sequence[OrderUnit]) -> None:
+        if not self.capacity:
+            raise OvenUnavailable("capacity is 0")
+        if len(items) > self.capacity:
+            raise OvenCapacityExceeded(len(items), self.capacity)
+        self.baked += len(items)
@@ -0,0 +1,404 @@
+"""Hot-path instrumentation: per-thread latency histograms, error counters, Prometheus text.
+
+Instrumentation is off unless enable() is called (or PIZZA_METRICS=1 is set at
+import). Methods are marked with ``@instrumented("order.add_item")``; while
+metrics are disabled the class holds the undecorated function, so a disabled
+call costs exactly what it did before. enable() swaps timing wrappers in and
+disable() swaps the originals back. ``with timer("name"):`` times any block;
+disabled, it costs one call returning a shared no-op context manager.
+
+Every thread records into histograms and error counters of its own, so the
+recording path takes no lock; snapshot() merges them (counts are read while
+other threads may still be writing, which can only make a snapshot miss the
+samples in flight). When a thread ends, its measurements are folded into a
+shared aggregate so thread churn does not grow the registry.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import itertools
+import os
+import sys
+import threading
+import weakref
+from collections import deque
+from dataclasses import dataclass
+from time import perf_counter_ns
+from typing import Any, Callable, TypeVar
+
+from . import errors
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+PROMETHEUS_BUCKETS = tuple(
+    mantissa * 10.0**exponent for exponent in range(-6, 1) for mantissa in (1, 2.5, 5)
+) + (10.0,)
+"""Exported ``le`` bounds in seconds, 1µs to 10s."""
+
+
+class Histogram:
+    """HDR-style log-linear histogram of nanosecond durations.
+
+    Values below 16ns get a bucket each; above, every power of two is split into
+    8 buckets, so a bucket's upper bound overstates its values by at most 12.5%.
+    Values of 2^40ns (~18 minutes) and more share the last (overflow) bucket.
+    """
+
+    SUB_BITS = 3
+    SUB = 1 << SUB_BITS
+    BUCKETS = (40 - SUB_BITS + 1) * SUB + 1
+
+    __slots__ = ("counts", "total", "max")
+
+    def __init__(self) -> None:
+        self.counts = [0] * self.BUCKETS
+        self.total = 0
+        self.max = 0
+
+    @classmethod
+    def index(cls, value: int) -> int:
+        if value < 2 * cls.SUB:
+            return max(value, 0)
+        shift = value.bit_length() - cls.SUB_BITS - 1
+        return min((shift << cls.SUB_BITS) + (value >> shift), cls.BUCKETS - 1)
+
+    @classmethod
+    def upper_bound(cls, index: int) -> int:
+        """Largest value (ns) that falls into bucket ``index``."""
+
+        if index < 2 * cls.SUB:
+            return index
+        if index == cls.BUCKETS - 1:
+            return sys.maxsize
+        shift = index // cls.SUB - 1
+        return ((index % cls.SUB + cls.SUB + 1) << shift) - 1
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def record(self, nanoseconds: int) -> None:
+        # index() inlined for SUB_BITS == 3: this runs on every instrumented call
+        if nanoseconds < 16:
+            index = nanoseconds if nanoseconds > 0 else 0
+        else:
+            shift = nanoseconds.bit_length() - 4
+            index = (shift << 3) + (nanoseconds >> shift)
+            if index >= 305:
+                index = 304
+        self.counts[index] += 1
+        self.total += nanoseconds
+        if nanoseconds > self.max:
+            self.max = nanoseconds
+
+    def merge(self, other: Histogram) -> None:
+        counts = self.counts
+        for index, count in enumerate(other.counts):
+            if count:
+                counts[index] += count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def percentile(self, q: float) -> int:
+        """Nanoseconds below which ``q`` percent of samples fall (bucket upper bound)."""
+
+        count = self.count
+        if not count:
+            return 0
+        rank = max(1, -(-q * count // 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(self.upper_bound(index), self.max)
+        return self.max
+
+
+@dataclass(frozen=True, slots=True)
+class Snapshot:
+    """Merged view of every thread's measurements.
+
+    Fields:
+      histograms: operation -> latency histogram (ns).
+      errors: (operation, error class name) -> exceptions raised. Classes from
+        errors.py are counted by name, any other exception as "other".
+    """
+
+    histograms: dict[str, Histogram]
+    errors: dict[tuple[str, str], int]
+
+
+class _Target:
+    __slots__ = ("owner", "attribute", "function", "wrapper")
+
+    def __init__(self, owner: type, attribute: str, function: Callable, wrapper: Callable):
+        self.owner = owner
+        self.attribute = attribute
+        self.function = function
+        self.wrapper = wrapper
+
+
+class Registry:
+    """Instrumented methods and the per-thread measurements they produce.
+
+    Storage:
+      - _targets: methods marked with @instrumented (original and wrapper).
+      - _local: this thread's {"histograms": {...}, "errors": {...}} and a token
+        whose finalizer queues the thread's key in _ended when the thread dies.
+      - _threads: key -> a live thread's dicts, for snapshot() and reset().
+      - _retired: ended threads' measurements, folded in from _threads by _prune().
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self._targets: list[_Target] = []
+        self._local = threading.local()
+        self._threads: dict[int, tuple[dict[str, Histogram], dict[tuple[str, str], int]]] = {}
+        self._retired: tuple[dict[str, Histogram], dict[tuple[str, str], int]] = ({}, {})
+        self._ended: deque[int] = deque()
+        self._keys = itertools.count()
+        self._lock = threading.Lock()
+
+    def enable(self) -> None:
+        with self._lock:
+            self.enabled = True
+            for target in self._targets:
+                setattr(target.owner, target.attribute, target.wrapper)
+
+    def disable(self) -> None:
+        with self._lock:
+            self.enabled = False
+            for target in self._targets:
+                setattr(target.owner, target.attribute, target.function)
+
+    def instrumented(self, operation: str) -> Callable[[F], F]:
+        """Method decorator timing every call as ``operation`` while enabled."""
+
+        def decorate(function: F) -> F:
+            return _Instrumented(self, operation, function)  # type: ignore[return-value]
+
+        return decorate
+
+    def timer(self, operation: str) -> Any:
+        """Context manager timing its block as ``operation`` while enabled."""
+
+        if not self.enabled:
+            return _DISABLED
+        return _Timer(self, operation)
+
+    def snapshot(self) -> Snapshot:
+        histograms: dict[str, Histogram] = {}
+        error_counts: dict[tuple[str, str], int] = {}
+        with self._lock:
+            self._prune()
+            threads = [self._retired, *self._threads.values()]
+        for thread_histograms, thread_errors in threads:
+            for operation, histogram in list(thread_histograms.items()):
+                histograms.setdefault(operation, Histogram()).merge(histogram)
+            for key, count in list(thread_errors.items()):
+                error_counts[key] = error_counts.get(key, 0) + count
+        return Snapshot(histograms, error_counts)
+
+    def reset(self) -> None:
+        """Forget all measurements (instrumented methods stay as they are)."""
+
+        with self._lock:
+            self._prune()
+            for thread_histograms, thread_errors in [self._retired, *self._threads.values()]:
+                thread_histograms.clear()
+                thread_errors.clear()
+
+    def prometheus_text(self, prefix: str = "pizza") -> str:
+        """Snapshot in the Prometheus text exposition format (version 0.0.4)."""
+
+        snapshot = self.snapshot()
+        name = f"{prefix}_operation_duration_seconds"
+        lines = [
+            f"# HELP {name} Wall time of instrumented domain operations.",
+            f"# TYPE {name} histogram",
+        ]
+        bounds = [round(bound * 1e9) for bound in PROMETHEUS_BUCKETS]
+        for operation, histogram in sorted(snapshot.histograms.items()):
+            label = f'operation="{_escape(operation)}"'
+            cumulative = [0] * len(bounds)
+            for index, count in enumerate(histogram.counts):
+                if count:
+                    upper = Histogram.upper_bound(index)
+                    for slot, bound in enumerate(bounds):
+                        if upper <= bound:
+                            cumulative[slot] += count
+                            break
+            running = 0
+            for bound, count in zip(PROMETHEUS_BUCKETS, cumulative):
+                running += count
+                lines.append(f'{name}_bucket{{{label},le="{bound:g}"}} {running}')
+            lines.append(f'{name}_bucket{{{label},le="+Inf"}} {histogram.count}')
+            lines.append(f"{name}_sum{{{label}}} {histogram.total / 1e9:.9f}")
+            lines.append(f"{name}_count{{{label}}} {histogram.count}")
+
+        name = f"{prefix}_domain_errors_total"
+        lines += [
+            f"# HELP {name} Exceptions raised by instrumented operations, by class.",
+            f"# TYPE {name} counter",
+        ]
+        for (operation, error), count in sorted(snapshot.errors.items()):
+            lines.append(
+                f'{name}{{operation="{_escape(operation)}",error="{_escape(error)}"}} {count}'
+            )
+        return "\n".join(lines) + "\n"
+
+    def _register(self, target: _Target) -> None:
+        with self._lock:
+            self._targets.append(target)
+            setattr(
+                target.owner,
+                target.attribute,
+                target.wrapper if self.enabled else target.function,
+            )
+
+    def _histogram(self, operation: str) -> Histogram:
+        try:
+            return self._local.histograms[operation]
+        except AttributeError:
+            self._local.histograms = {}
+            self._local.errors = {}
+            self._local.token = token = _ThreadToken()
+            with self._lock:
+                self._prune()
+                key = next(self._keys)
+                self._threads[key] = (self._local.histograms, self._local.errors)
+            # threading.local drops the token when the thread ends; appending to a
+            # deque is atomic, so the finalizer never waits for the lock.
+            weakref.finalize(token, self._ended.append, key)
+        except KeyError:
+            pass
+        histogram = self._local.histograms[operation] = Histogram()
+        return histogram
+
+    def _prune(self) -> None:
+        """Fold the measurements of ended threads into _retired (caller holds _lock)."""
+
+        retired_histograms, retired_errors = self._retired
+        while self._ended:
+            thread_histograms, thread_errors = self._threads.pop(self._ended.popleft())
+            for operation, histogram in thread_histograms.items():
+                retired_histograms.setdefault(operation, Histogram()).merge(histogram)
+            for key, count in thread_errors.items():
+                retired_errors[key] = retired_errors.get(key, 0) + count
+
+    def _error(self, operation: str, exc: BaseException) -> None:
+        self._histogram(operation)  # makes sure this thread is registered
+        cls = type(exc)
+        key = (operation, cls.__name__ if cls.__module__ == errors.__name__ else "other")
+        thread_errors = self._local.errors
+        thread_errors[key] = thread_errors.get(key, 0) + 1
+
+    def _wrap(self, operation: str, function: Callable) -> Callable:
+        local = self._local
+        histogram = self._histogram
+
+        if inspect.iscoroutinefunction(function):
+
+            @functools.wraps(function)
+            async def timed_async(*args: Any, **kwargs: Any) -> Any:
+                started = perf_counter_ns()
+                try:
+                    return await function(*args, **kwargs)
+                except Exception as exc:
+                    self._error(operation, exc)
+                    raise
+                finally:
+                    elapsed = perf_counter_ns() - started
+                    try:
+                        local.histograms[operation].record(elapsed)
+                    except (AttributeError, KeyError):
+                        histogram(operation).record(elapsed)
+
+            return timed_async
+
+        @functools.wraps(function)
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            started = perf_counter_ns()
+            try:
+                return function(*args, **kwargs)
+            except Exception as exc:
+                self._error(operation, exc)
+                raise
+            finally:
+                elapsed = perf_counter_ns() - started
+                try:
+                    local.histograms[operation].record(elapsed)
+                except (AttributeError, KeyError):
+                    histogram(operation).record(elapsed)
+
+        return timed
+
+
+class _ThreadToken:
+    """Weak-referenceable marker kept in a thread's local storage."""
+
+    __slots__ = ("__weakref__",)
+
+
+class _Instrumented:
+    """Placeholder left in a class body by @instrumented; replaced at class creation."""
+
+    def __init__(self, registry: Registry, operation: str, function: Callable) -> None:
+        self.registry = registry
+        self.operation = operation
+        self.function = function
+
+    def __set_name__(self, owner: type, attribute: str) -> None:
+        wrapper = self.registry._wrap(self.operation, self.function)
+        self.registry._register(_Target(owner, attribute, self.function, wrapper))
+
+
+class _Timer:
+    __slots__ = ("registry", "operation", "started")
+
+    def __init__(self, registry: Registry, operation: str) -> None:
+        self.registry = registry
+        self.operation = operation
+
+    def __enter__(self) -> None:
+        self.started = perf_counter_ns()
+
+    def __exit__(self, cls: type | None, exc: BaseException | None, tb: object) -> None:
+        elapsed = perf_counter_ns() - self.started
+        if isinstance(exc, Exception):
+            self.registry._error(self.operation, exc)
+        self.registry._histogram(self.operation).record(elapsed)
+
+
+class _Disabled:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+
+_DISABLED = _Disabled()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+REGISTRY = Registry()
+"""Process-wide registry used by the domain and infra modules."""
+
+instrumented = REGISTRY.instrumented
+timer = REGISTRY.timer
+enable = REGISTRY.enable
+disable = REGISTRY.disable
+snapshot = REGISTRY.snapshot
+reset = REGISTRY.reset
+prometheus_text = REGISTRY.prometheus_text
+
+if os.environ.get("PIZZA_METRICS", "") not in ("", "0"):
+    enable()
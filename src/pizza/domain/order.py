@@ -1,19 +1,31 @@
 from __future__ import annotations
 
 from decimal import Decimal
-from typing import TYPE_CHECKING, Mapping, Protocol, Sequence
-
-from .delivery import Coordinates, Dispatcher
-from .errors import InvalidOrderItem, InvalidQuantity
+from typing import TYPE_CHECKING, Any, Iterable, Mapping, Protocol, Sequence
+
+from .delivery import AssignmentResult, Coordinates, Dispatcher
+from .errors import (
+    AlreadyFinalized,
+    InvalidOrderItem,
+    InvalidOrderState,
+    InvalidPricingOperation,
+    InvalidQuantity,
+    InvalidTransition,
+    OvenUnavailable,
+)
 from .menu import Menu
+from .metrics import instrumented
 from .pricing import Money, OrderView, PricingStrategy
 from .products import Pizza, PizzaSize, Topping
-from .status import OrderStatus
+from .status import OUTCOMES, OrderStatus, TransitionOutcome
 from .types import OrderId, quantize_money
 
 if TYPE_CHECKING:
+    from .events import EventSink
     from .inventory import Ingredient, Inventory, Oven
 
+_APPLIED = TransitionOutcome.APPLIED
+
 
 class OrderItem:
     """Single order line: one pizza and its quantity."""
@@ -59,7 +71,10 @@ class Order:
         self._items = list(items)
         self.status = status or OrderStatus.NEW
         self.pricing_strategy = pricing_strategy
+        self.events: EventSink | None = None
+        self.metadata: dict[str, Any] = {}
 
+    @instrumented("order.add_item")
     def add_item(
         self, pizza_sku: str, size: PizzaSize, qty: int, toppings_sku: Sequence[str]
     ) -> None:
@@ -96,52 +111,94 @@ class Order:
 
     def can_accept(self) -> bool:
         """Return True if order can move NEW -> ACCEPTED."""
+        return OUTCOMES[self.status][OrderStatus.ACCEPTED] is _APPLIED
 
     def can_bake(self) -> bool:
         """Return True if order can move ACCEPTED -> BAKING."""
+        return OUTCOMES[self.status][OrderStatus.BAKING] is _APPLIED
 
     def can_box(self) -> bool:
         """Return True if order can move BAKING -> BOXED."""
+        return OUTCOMES[self.status][OrderStatus.BOXED] is _APPLIED
 
     def can_dispatch(self) -> bool:
         """Return True if order can move BOXED -> DISPATCHED."""
+        return OUTCOMES[self.status][OrderStatus.DISPATCHED] is _APPLIED
 
     def can_deliver(self) -> bool:
         """Return True if order can move DISPATCHED -> DELIVERED."""
+        return OUTCOMES[self.status][OrderStatus.DELIVERED] is _APPLIED
 
     def can_cancel(self) -> bool:
         """Return True if order can move to 'CANCELED' (only from NEW or ACCEPTED)."""
+        return OUTCOMES[self.status][OrderStatus.CANCELED] is _APPLIED
 
     def accept(self) -> None:
         """Set status to ACCEPTED (only from NEW).
         Raise AlreadyFinalized if DELIVERED or CANCELED.
         Raise InvalidTransition otherwise.
         """
+        self._ensure_transition(OrderStatus.ACCEPTED)
+        self._set_status(OrderStatus.ACCEPTED)
 
     def box(self) -> None:
         """Set status to BOXED (only from BAKING).
         Raise AlreadyFinalized if DELIVERED or CANCELED.
         Raise InvalidTransition otherwise.
         """
+        self._ensure_transition(OrderStatus.BOXED)
+        self._set_status(OrderStatus.BOXED)
 
-    def dispatch(self, dispatcher: "Dispatcher") -> None:
-        """Set status to DISPATCHED (only from BOXED).
+    def dispatch(self, dispatcher: "Dispatcher") -> AssignmentResult:
+        """Set status to DISPATCHED (only from BOXED) and return the courier assignment.
         Raise AlreadyFinalized if DELIVERED or CANCELED.
         Raise InvalidTransition otherwise.
+        Status is unchanged if the dispatcher cannot assign a courier.
         """
-        raise NotImplementedError
+        self._ensure_transition(OrderStatus.DISPATCHED)
+        result = dispatcher.assign(str(self.id), self.delivery_address)
+        self._set_status(OrderStatus.DISPATCHED)
+        return result
+
+    def dispatch_with(self, courier_id: str, strategy_name: str) -> AssignmentResult:
+        """Set status to DISPATCHED (only from BOXED) on a courier already sent out.
+        For planners that reserve couriers themselves (route batching).
+        Raise AlreadyFinalized if DELIVERED or CANCELED.
+        Raise InvalidTransition otherwise.
+        """
+        self._ensure_transition(OrderStatus.DISPATCHED)
+        self._set_status(OrderStatus.DISPATCHED)
+        return AssignmentResult(str(self.id), courier_id, strategy_name)
 
     def deliver(self) -> None:
         """Set status to DELIVERED (only from DISPATCHED).
         Raise AlreadyFinalized if DELIVERED or CANCELED.
         Raise InvalidTransition otherwise.
         """
+        self._ensure_transition(OrderStatus.DELIVERED)
+        self._set_status(OrderStatus.DELIVERED)
 
     def cancel(self) -> None:
         """Set status to CANCELED (only from NEW or ACCEPTED).
         Raise AlreadyFinalized if DELIVERED or CANCELED.
         Raise InvalidTransition otherwise.
         """
+        self._ensure_transition(OrderStatus.CANCELED)
+        self._set_status(OrderStatus.CANCELED)
+
+    def _set_status(self, status: OrderStatus) -> None:
+        previous = self.status
+        self.status = status
+        if self.events is not None:
+            self.events.emit(str(self.id), previous, status)
+
+    def _ensure_transition(self, target: OrderStatus) -> None:
+        outcome = OUTCOMES[self.status][target]
+        if outcome is _APPLIED:
+            return
+        if outcome is TransitionOutcome.FINALIZED:
+            raise AlreadyFinalized(f"Order is {self.status.name}, cannot move to {target.name}")
+        raise InvalidTransition(f"{self.status.name} -> {target.name}")
 
     def set_pricing_strategy(self, strategy: PricingStrategy) -> None:
         """
@@ -151,40 +208,173 @@ class Order:
         Otherwise, InvalidPricingOperation.
         """
 
-        raise NotImplementedError
+        if self.status not in (OrderStatus.NEW, OrderStatus.ACCEPTED):
+            raise InvalidPricingOperation(f"Order is {self.status.name}, pricing is fixed")
+        self.pricing_strategy = strategy
 
+    @instrumented("order.final_total")
     def final_total(self) -> Money:
         """Total sum taking into account pricing strategy."""
-
-        raise NotImplementedError
+        if self.pricing_strategy is None:
+            return self.subtotal()
+        return quantize_money(self.pricing_strategy.apply(self.as_view()).final_total)
 
     def as_view(self) -> "OrderView":
         """
         Return read-only order representation."""
 
-        raise NotImplementedError
+        return _PricingView(self)
 
     def to_units(self) -> Sequence[OrderUnit]:
         """
         Give order units individually to oven.
         """
-        raise NotImplementedError
+        return [
+            PizzaUnit(item.pizza, item.size, item.toppings)
+            for item in self._items
+            for _ in range(item.qty)
+        ]
 
     def compute_total_requirements(self) -> Mapping["Ingredient", Decimal]:
-        raise NotImplementedError
-
+        """Ingredients needed to bake every unit of the order."""
+        total: dict[Ingredient, Decimal] = {}
+        for item in self._items:
+            line = _unit_requirements(item.pizza, item.size, item.toppings)
+            for ingredient, amount in line.items():
+                total[ingredient] = total.get(ingredient, 0) + amount * item.qty
+        return total
+
+    @instrumented("order.bake")
     def bake(self, inventory: "Inventory", oven: "Oven") -> None:
         """Set status to BAKING (only from ACCEPTED).
         Raise AlreadyFinalized if DELIVERED or CANCELED.
         Raise InvalidTransition otherwise.
+        Raise InvalidOrderState for an order without items, OvenUnavailable if the oven
+        cannot take all units, InsufficientIngredients if stock is short.
+        Ingredients are reserved, then committed once the oven accepted the batch
+        (released if it did not); status is unchanged on any error.
         """
-        raise NotImplementedError
+        self._ensure_transition(OrderStatus.BAKING)
+        units = self.to_units()
+        if not units:
+            raise InvalidOrderState(self.status.name, "bake an empty order")
+        if not oven.can_bake(len(units)):
+            raise OvenUnavailable(f"cannot take {len(units)} units")
+        token = inventory.reserve(self.compute_total_requirements())
+        try:
+            oven.bake_batch(units)
+        except BaseException:
+            inventory.release(token)
+            raise
+        inventory.commit(token)
+        self._set_status(OrderStatus.BAKING)
 
     delivery_coordinates: "Coordinates"
 
 
+_BULK_TARGETS = frozenset(
+    {OrderStatus.ACCEPTED, OrderStatus.BOXED, OrderStatus.DELIVERED, OrderStatus.CANCELED}
+)
+
+
+def transition_all(orders: Iterable[Order], target: OrderStatus) -> list[TransitionOutcome]:
+    """Move every order that allows it to ``target`` in one pass.
+
+    Returns one outcome per order, in input order; rejected orders are left
+    unchanged and no exception is raised for them. BAKING and DISPATCHED need
+    an oven/dispatcher and are not available in bulk.
+    """
+
+    if target not in _BULK_TARGETS:
+        raise ValueError(f"bulk transition to {target.name} is not supported")
+    outcomes = []
+    append = outcomes.append
+    for order in orders:
+        outcome = OUTCOMES[order.status][target]
+        if outcome is _APPLIED:
+            order._set_status(target)
+        append(outcome)
+    return outcomes
+
+
+def accept_all(orders: Iterable[Order]) -> list[TransitionOutcome]:
+    """Bulk NEW -> ACCEPTED; see transition_all."""
+    return transition_all(orders, OrderStatus.ACCEPTED)
+
+
+def box_all(orders: Iterable[Order]) -> list[TransitionOutcome]:
+    """Bulk BAKING -> BOXED; see transition_all."""
+    return transition_all(orders, OrderStatus.BOXED)
+
+
+def deliver_all(orders: Iterable[Order]) -> list[TransitionOutcome]:
+    """Bulk DISPATCHED -> DELIVERED; see transition_all."""
+    return transition_all(orders, OrderStatus.DELIVERED)
+
+
+def cancel_all(orders: Iterable[Order]) -> list[TransitionOutcome]:
+    """Bulk NEW/ACCEPTED -> CANCELED; see transition_all."""
+    return transition_all(orders, OrderStatus.CANCELED)
+
+
+class _PricedUnit:
+    """One unit of an order line as seen by pricing."""
+
+    __slots__ = ("sku", "unit_price", "pizza_price")
+
+    def __init__(self, sku: str, unit_price: Money, pizza_price: Money):
+        self.sku = sku
+        self.unit_price = unit_price
+        self.pizza_price = pizza_price
+
+
+class _PricingView:
+    """OrderView snapshot: subtotal, unit-level items and metadata of an order."""
+
+    __slots__ = ("_subtotal", "items", "metadata")
+
+    def __init__(self, order: Order):
+        self._subtotal = order.subtotal()
+        units: list[_PricedUnit] = []
+        for item in order._items:
+            unit = _PricedUnit(item.pizza.sku, item.unit_price(), item.pizza.unit_price(item.size))
+            units.extend([unit] * item.qty)
+        self.items = tuple(units)
+        self.metadata = dict(order.metadata)
+
+    def subtotal(self) -> Money:
+        return self._subtotal
+
+
 class OrderUnit(Protocol):
     """One baked unit: pizza + size + toppings."""
 
     def requirements(self) -> Mapping["Ingredient", Decimal]:
         raise NotImplementedError
+
+
+class PizzaUnit:
+    """One pizza of an order line, as handed to the oven."""
+
+    __slots__ = ("pizza", "size", "toppings")
+
+    def __init__(self, pizza: Pizza, size: PizzaSize, toppings: tuple[Topping, ...]):
+        self.pizza = pizza
+        self.size = size
+        self.toppings = toppings
+
+    def requirements(self) -> Mapping["Ingredient", Decimal]:
+        return _unit_requirements(self.pizza, self.size, self.toppings)
+
+
+def _unit_requirements(
+    pizza: Pizza, size: PizzaSize, toppings: tuple[Topping, ...]
+) -> dict["Ingredient", Decimal]:
+    """Recipe scaled to the size plus one portion of every topping."""
+    result: dict[Ingredient, Decimal] = {}
+    for req in pizza.requirements(size):
+        result[req.ingredient] = result.get(req.ingredient, 0) + req.amount
+    for topping in toppings:
+        for req in topping.requirements:
+            result[req.ingredient] = result.get(req.ingredient, 0) + req.amount
+    return result
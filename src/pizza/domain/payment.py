@@ -4,6 +4,8 @@ from dataclasses import dataclass
 from decimal import Decimal
 from typing import Literal, Protocol, Sequence
 
+from .errors import PaymentAmountMismatch, RefundExceedsCapture
+from .metrics import instrumented
 from .order import Order
 
 Money = Decimal
@@ -71,20 +73,27 @@ class CashPayment:
 
     method: Literal["cash"] = "cash"
 
+    @instrumented("payment.cash.authorize")
     def authorize(self, order: "Order") -> PaymentAuthResult:
         """Optional: mark as authorized; usually skipped for cash."""
 
-        raise NotImplementedError
+        return PaymentAuthResult(_cash_id(order), "authorized", order.final_total(), "cash")
 
+    @instrumented("payment.cash.capture")
     def capture(self, order: "Order", amount: Money) -> PaymentCaptureResult:
         """Mark order as paid in cash."""
 
-        raise NotImplementedError
+        if amount <= 0 or amount > order.final_total():
+            raise PaymentAmountMismatch(str(amount), f"order total is {order.final_total()}")
+        return PaymentCaptureResult(_cash_id(order), "captured", amount, "cash")
 
+    @instrumented("payment.cash.refund")
     def refund(self, order: "Order", amount: Money) -> PaymentRefundResult:
         """Refund cash (theoretical in v0.1.0)."""
 
-        raise NotImplementedError
+        if amount > order.final_total():
+            raise RefundExceedsCapture(str(amount))
+        return PaymentRefundResult(_cash_id(order), "refunded", amount, "cash")
 
 
 class CardPayment:
@@ -133,3 +142,7 @@ class OnlinePayment:
         """Refund online charge within captured amount."""
 
         raise NotImplementedError
+
+
+def _cash_id(order: "Order") -> str:
+    return f"cash-{order.id}"
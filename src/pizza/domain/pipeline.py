@@ -0,0 +1,294 @@
+"""Staged asyncio order pipeline with bounded queues, and the kitchen-to-door stages."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Awaitable, Callable, Iterable, Sequence
+
+from .errors import NoCouriersAvailable
+from .metrics import Histogram
+
+if TYPE_CHECKING:
+    from .delivery import Dispatcher
+    from .inventory import Inventory, Oven
+    from .order import Order
+
+
+@dataclass(frozen=True, slots=True)
+class Stage:
+    """One step of an OrderPipeline.
+
+    Fields:
+      name: Label used in stats and failures.
+      handle: Coroutine function run once per order; raising fails the order.
+      workers: Orders handled concurrently by this stage.
+      queue_size: Bound of the stage's input queue; a full queue blocks upstream.
+    """
+
+    name: str
+    handle: Callable[["Order"], Awaitable[None]]
+    workers: int = 1
+    queue_size: int = 100
+
+
+@dataclass(frozen=True, slots=True)
+class StageStats:
+    """Snapshot of one pipeline stage.
+
+    Fields:
+      name: Stage name.
+      workers: Configured concurrency.
+      processed: Orders the stage handled successfully.
+      failed: Orders whose handler raised.
+      queue_depth: Orders waiting in the input queue now.
+      max_queue_depth: Highest input queue depth seen.
+      throughput: Processed orders per second between the first start and last finish.
+      p50_latency: Median seconds spent in the handler.
+      p99_latency: 99th percentile seconds spent in the handler.
+      p99_wait: 99th percentile seconds spent waiting in the input queue.
+    """
+
+    name: str
+    workers: int
+    processed: int
+    failed: int
+    queue_depth: int
+    max_queue_depth: int
+    throughput: float
+    p50_latency: float
+    p99_latency: float
+    p99_wait: float
+
+
+@dataclass(frozen=True, slots=True)
+class PipelineFailure:
+    """An order that left the pipeline early because a stage raised."""
+
+    order: "Order"
+    stage: str
+    error: Exception
+
+
+class _StageState:
+    __slots__ = (
+        "processed",
+        "failed",
+        "max_depth",
+        "first_start",
+        "last_finish",
+        "latency",
+        "wait",
+    )
+
+    def __init__(self) -> None:
+        self.processed = 0
+        self.failed = 0
+        self.max_depth = 0
+        self.first_start: float | None = None
+        self.last_finish = 0.0
+        self.latency = Histogram()  # nanoseconds
+        self.wait = Histogram()
+
+
+class OrderPipeline:
+    """Staged asyncio pipeline with a bounded queue and a worker pool per stage.
+
+    Each stage reads (order, enqueued_at) from its own queue and hands the order to
+    the next stage's queue when done. Queues are bounded, so a slow stage (ovens,
+    couriers) fills its queue, upstream workers block on put(), and eventually
+    submit() blocks: memory stays at sum(queue_size + workers) orders.
+    Orders whose handler raises are recorded in ``failures`` and dropped.
+
+    Usage:
+        pipeline = OrderPipeline(kitchen_stages(inventory, ovens, dispatcher))
+        await pipeline.run(orders)        # or start(); submit() ...; join(); stop()
+        pipeline.stats()
+    """
+
+    def __init__(
+        self, stages: Sequence[Stage], clock: Callable[[], float] = time.perf_counter
+    ) -> None:
+        if not stages:
+            raise ValueError("pipeline needs at least one stage")
+        for stage in stages:
+            if stage.workers <= 0 or stage.queue_size <= 0:
+                raise ValueError(f"stage {stage.name}: workers and queue_size must be > 0")
+        self.stages = list(stages)
+        self.failures: list[PipelineFailure] = []
+        self.completed = 0
+        self._clock = clock
+        self._state = [_StageState() for _ in self.stages]
+        self._queues: list[asyncio.Queue[tuple[Order, float]]] = []
+        self._workers: list[asyncio.Task[None]] = []
+
+    async def start(self) -> None:
+        """Create the queues and worker tasks (on the running loop)."""
+
+        if self._workers:
+            return
+        self._queues = [asyncio.Queue(stage.queue_size) for stage in self.stages]
+        self._workers = [
+            asyncio.create_task(self._work(index), name=f"{stage.name}-{worker}")
+            for index, stage in enumerate(self.stages)
+            for worker in range(stage.workers)
+        ]
+
+    async def submit(self, order: "Order") -> None:
+        """Enqueue an order at the first stage, waiting while its queue is full."""
+
+        await self._put(0, order)
+
+    async def join(self) -> None:
+        """Wait until every submitted order has completed or failed."""
+
+        for queue in self._queues:
+            await queue.join()
+
+    async def stop(self) -> None:
+        """Cancel the workers; orders still queued are abandoned."""
+
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def run(self, orders: Iterable["Order"]) -> list[StageStats]:
+        """Push all orders through and return the final stats."""
+
+        await self.start()
+        try:
+            for order in orders:
+                await self.submit(order)
+            await self.join()
+        finally:
+            await self.stop()
+        return self.stats()
+
+    def stats(self) -> list[StageStats]:
+        result = []
+        for index, (stage, state) in enumerate(zip(self.stages, self._state)):
+            elapsed = state.last_finish - (state.first_start or 0.0)
+            result.append(
+                StageStats(
+                    name=stage.name,
+                    workers=stage.workers,
+                    processed=state.processed,
+                    failed=state.failed,
+                    queue_depth=self._queues[index].qsize() if self._queues else 0,
+                    max_queue_depth=state.max_depth,
+                    throughput=state.processed / elapsed if elapsed > 0 else 0.0,
+                    p50_latency=state.latency.percentile(50) / 1e9,
+                    p99_latency=state.latency.percentile(99) / 1e9,
+                    p99_wait=state.wait.percentile(99) / 1e9,
+                )
+            )
+        return result
+
+    async def _put(self, index: int, order: "Order") -> None:
+        queue = self._queues[index]
+        await queue.put((order, self._clock()))
+        state = self._state[index]
+        if queue.qsize() > state.max_depth:
+            state.max_depth = queue.qsize()
+
+    async def _work(self, index: int) -> None:
+        stage = self.stages[index]
+        state = self._state[index]
+        inbox = self._queues[index]
+        last = index == len(self.stages) - 1
+        clock = self._clock
+        while True:
+            order, enqueued = await inbox.get()
+            try:
+                started = clock()
+                if state.first_start is None:
+                    state.first_start = started
+                state.wait.record(int((started - enqueued) * 1e9))
+                try:
+                    await stage.handle(order)
+                except Exception as exc:
+                    state.failed += 1
+                    self.failures.append(PipelineFailure(order, stage.name, exc))
+                    continue
+                finished = clock()
+                state.latency.record(int((finished - started) * 1e9))
+                state.last_finish = finished
+                state.processed += 1
+                if last:
+                    self.completed += 1
+                else:
+                    await self._put(index + 1, order)
+            finally:
+                inbox.task_done()
+
+
+def kitchen_stages(
+    inventory: "Inventory",
+    ovens: Sequence["Oven"],
+    dispatcher: "Dispatcher",
+    bake_time: float = 0.0,
+    trip_time: float = 0.0,
+    queue_size: int = 100,
+) -> list[Stage]:
+    """Stages accept -> bake -> box -> dispatch -> deliver for OrderPipeline.
+
+    Every oven bakes one order at a time for ``bake_time`` seconds, so the bake
+    stage runs one worker per oven. Dispatch waits for a free courier instead of
+    failing with NoCouriersAvailable; the courier is released after delivering,
+    ``trip_time`` seconds later. Size the fleet with couriers available up front:
+    raise NoCouriersAvailable if none is (dispatch would wait forever), and
+    ValueError without ovens.
+    """
+
+    if not ovens:
+        raise ValueError("kitchen_stages needs at least one oven")
+    if not dispatcher.has_available():
+        raise NoCouriersAvailable()
+    free_ovens: asyncio.Queue[Oven] = asyncio.Queue()
+    for oven in ovens:
+        free_ovens.put_nowait(oven)
+    couriers = asyncio.Semaphore(dispatcher.available_count())
+    trips: dict[int, str] = {}
+
+    async def accept(order: "Order") -> None:
+        order.accept()
+
+    async def bake(order: "Order") -> None:
+        oven = await free_ovens.get()
+        try:
+            order.bake(inventory, oven)
+            if bake_time:
+                await asyncio.sleep(bake_time)
+        finally:
+            free_ovens.put_nowait(oven)
+
+    async def box(order: "Order") -> None:
+        order.box()
+
+    async def dispatch(order: "Order") -> None:
+        await couriers.acquire()
+        try:
+            trips[id(order)] = order.dispatch(dispatcher).courier_id
+        except BaseException:
+            couriers.release()
+            raise
+
+    async def deliver(order: "Order") -> None:
+        courier_id = trips.pop(id(order))
+        try:
+            if trip_time:
+                await asyncio.sleep(trip_time)
+            order.deliver()
+        finally:
+            dispatcher.release(courier_id)
+            couriers.release()
+
+    return [
+        Stage("accept", accept, 1, queue_size),
+        Stage("bake", bake, len(ovens), queue_size),
+        Stage("box", box, 1, queue_size),
+        Stage("dispatch", dispatch, 1, queue_size),
+        Stage("deliver", deliver, dispatcher.available_count(), queue_size),
+    ]
@@ -5,6 +5,8 @@ from datetime import date
 from decimal import ROUND_HALF_EVEN, Decimal, getcontext
 from typing import Any, Mapping, Protocol, Sequence
 
+from .errors import CouponExpired, CouponNotFirstOrder, InvalidPricingOperation
+
 Money = Decimal
 MONEY_QUANT = Decimal("0.01")
 MONEY_ROUNDING = ROUND_HALF_EVEN
@@ -62,6 +64,15 @@ class OrderItemView(Protocol):
         """SKU identifier of the product."""
         ...
 
+    @property
+    def pizza_price(self) -> Money:
+        """Price of the pizza alone at its size, toppings excluded."""
+        ...
+
+
+def _quantize(value: Money) -> Money:
+    return value.quantize(MONEY_QUANT, rounding=MONEY_ROUNDING)
+
 
 class NoDiscount(PricingStrategy):
     """Default strategy: no discount applied."""
@@ -69,7 +80,7 @@ class NoDiscount(PricingStrategy):
     def apply(self, order: OrderView) -> PricingResult:
         """Return subtotal as final_total with discount=0."""
 
-        raise NotImplementedError
+        return PricingResult(_quantize(order.subtotal()), Money("0.00"), "NoDiscount")
 
 
 class PercentOff(PricingStrategy):
@@ -78,34 +89,94 @@ class PercentOff(PricingStrategy):
     def __init__(self, percentage: Decimal) -> None:
         """Initialize with percentage in [0, 100]."""
 
+        if not 0 <= percentage <= 100:
+            raise ValueError(f"percentage must be in [0, 100], got {percentage}")
         self._percentage = percentage
 
     def apply(self, order: OrderView) -> PricingResult:
         """Apply percentage discount, respecting rounding rules."""
 
-        raise NotImplementedError
+        subtotal = _quantize(order.subtotal())
+        discount = _quantize(subtotal * self._percentage / 100)
+        return PricingResult(
+            subtotal - discount, discount, "PercentOff", (f"{self._percentage}% off",)
+        )
 
 
 class BuyNGetMFree(PricingStrategy):
-    """Buy-N-Get-M-Free discount based on item scope."""
+    """Buy-N-Get-M-Free discount based on item scope.
+
+    Scope "pizza_only" ranks units by their pizza price and gives away the pizza
+    but still charges its toppings; "all" ranks by full unit price and gives the
+    whole unit away.
+    """
+
+    SCOPES = ("pizza_only", "all")
 
     def __init__(self, n: int, m: int, scope: str = "pizza_only") -> None:
+        if n <= 0 or m <= 0:
+            raise ValueError(f"n and m must be > 0, got n={n} m={m}")
+        if scope not in self.SCOPES:
+            raise ValueError(f"unknown scope {scope!r}")
         self._n = n
         self._m = m
         self._scope = scope
 
     def apply(self, order: OrderView) -> PricingResult:
-        """Apply discount: in each group, mark M the cheapest items free."""
-
-        raise NotImplementedError
+        """Apply discount: in each group, mark M the cheapest items free.
+
+        Units are ranked by price, most expensive first, and cut into groups of N+M;
+        the M cheapest of every complete group are free.
+        """
+
+        group = self._n + self._m
+        if self._scope == "all":
+            prices = sorted((item.unit_price for item in order.items), reverse=True)
+        else:
+            prices = sorted((item.pizza_price for item in order.items), reverse=True)
+        complete = len(prices) - len(prices) % group
+        discount = _quantize(
+            sum(
+                (prices[i] for i in range(complete) if i % group >= self._n),
+                Money(0),
+            )
+        )
+        subtotal = _quantize(order.subtotal())
+        return PricingResult(
+            subtotal - discount,
+            discount,
+            "BuyNGetMFree",
+            (f"buy {self._n} get {self._m} free: {complete // group} group(s)",),
+        )
 
 
 class FirstOrderCoupon(PricingStrategy):
     """Coupon discount for first-time orders."""
 
-    def __init__(self, code: str, percent: Decimal, expires_at: "date|None" = None) -> None: ...
+    def __init__(self, code: str, percent: Decimal, expires_at: "date|None" = None) -> None:
+        if not 0 <= percent <= 100:
+            raise ValueError(f"percent must be in [0, 100], got {percent}")
+        self._code = code
+        self._percent = percent
+        self._expires_at = expires_at
 
     def apply(self, order: OrderView) -> PricingResult:
-        """Apply coupon if order is first and coupon is valid; else error."""
-
-        raise NotImplementedError
+        """Apply coupon if order is first and coupon is valid; else error.
+
+        Reads metadata "coupon_code", "is_first_order" and optionally "today" (a date,
+        default date.today()) so that pricing the same order stays repeatable.
+        """
+
+        metadata = order.metadata
+        if metadata.get("coupon_code") != self._code:
+            raise InvalidPricingOperation(f"coupon {self._code} was not presented")
+        if not metadata.get("is_first_order"):
+            raise CouponNotFirstOrder(f"coupon {self._code} is for first orders only")
+        today = metadata.get("today") or date.today()
+        if self._expires_at is not None and today > self._expires_at:
+            raise CouponExpired(f"coupon {self._code} expired on {self._expires_at}")
+        subtotal = _quantize(order.subtotal())
+        discount = _quantize(subtotal * self._percent / 100)
+        return PricingResult(
+            subtotal - discount, discount, "FirstOrderCoupon", (f"coupon {self._code}",)
+        )
@@ -1,13 +1,10 @@
 from decimal import Decimal
 from enum import Enum
-from typing import TYPE_CHECKING
 
 from .errors import InvalidProductData
+from .inventory import IngredientRequirement
 from .types import Money, quantize_money
 
-if TYPE_CHECKING:
-    from .inventory import IngredientRequirement
-
 
 class PizzaSize(Enum):
     """
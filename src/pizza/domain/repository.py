@@ -1,9 +1,19 @@
 from __future__ import annotations
 
+import asyncio
+import copy
+import threading
+import time
+from bisect import bisect_left, insort
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Protocol, Sequence
+from typing import Any, AsyncIterator, Callable, Iterator, Mapping, Protocol, Sequence
 
+from .cache import TTLCache
+from .errors import OrderNotFound, StaleOrderVersion
+from .events import add_sink
 from .order import Order, OrderStatus
+from .types import OrderId
 
 
 @dataclass(frozen=True, slots=True)
@@ -16,7 +26,7 @@ class PaymentRecord:
       authorized_amount: Total authorized (string for v0.1.0).
       captured_amount: Total captured (string).
       refunded_amount: Total refunded (string).
-      status: "new" | "authorized" | "captured" | "refunded".
+      status: "new" | "authorized" | "captured" | "partial-refund" | "refunded".
       history: Free-form audit trail lines.
     """
 
@@ -29,6 +39,65 @@ class PaymentRecord:
     history: Sequence[str] = ()
 
 
+@dataclass(frozen=True, slots=True)
+class Page:
+    """One page of a keyset-paginated order listing.
+
+    Fields:
+      orders: Up to ``limit`` orders, in the repository's stable listing order.
+      cursor: Opaque token resuming right after the last order, or None at the end.
+    """
+
+    orders: Sequence["Order"]
+    cursor: str | None
+
+
+def iter_pages(fetch: Callable[[str | None], Page], cursor: str | None = None) -> Iterator["Order"]:
+    """Stream orders page by page from ``fetch(cursor)``; only one page is held at a time."""
+
+    while True:
+        page = fetch(cursor)
+        yield from page.orders
+        if page.cursor is None:
+            return
+        cursor = page.cursor
+
+
+class StatusPositions:
+    """Listing positions of orders per status, kept sorted for keyset paging by status.
+
+    A position is an order's index in its repository's first-save sequence, so a
+    page is a bisect to the cursor plus a slice: O(log n + page size) instead of a
+    scan over every order saved before the cursor.
+    """
+
+    def __init__(self) -> None:
+        self._positions: dict[OrderStatus, list[int]] = {status: [] for status in OrderStatus}
+
+    def move(self, position: int, previous: OrderStatus | None, status: OrderStatus) -> None:
+        """Record that the order at ``position`` went from ``previous`` to ``status``."""
+
+        if previous is not None:
+            positions = self._positions[previous]
+            del positions[bisect_left(positions, position)]
+        positions = self._positions[status]
+        if not positions or positions[-1] < position:
+            positions.append(position)  # new orders have the highest position
+        else:
+            insort(positions, position)
+
+    def page(
+        self, status: OrderStatus, cursor: str | None, limit: int
+    ) -> tuple[list[int], str | None]:
+        """Positions of the next ``limit`` orders with the status, and the next cursor."""
+
+        positions = self._positions[status]
+        start = bisect_left(positions, int(cursor or 0))
+        page = positions[start : start + limit]
+        more = start + limit < len(positions)
+        return page, str(page[-1] + 1) if more else None
+
+
 class OrderRepository(Protocol):
     """Repository contract for orders (v0.1.0: in-memory, synchronous).
 
@@ -54,56 +123,686 @@ class OrderRepository(Protocol):
         """Return all stored orders (unspecified ordering)."""
         raise NotImplementedError
 
+    def page_all(self, cursor: str | None = None, limit: int = 1000) -> Page:
+        """Return the next page of all orders after ``cursor``, in a stable order.
+
+        Orders saved while paging appear in later pages or not at all; an order
+        is never returned twice.
+        """
+        raise NotImplementedError
+
+    def page_by_status(
+        self, status: "OrderStatus", cursor: str | None = None, limit: int = 1000
+    ) -> Page:
+        """Like page_all(), restricted to orders with the given status."""
+        raise NotImplementedError
+
     def link_courier(self, order_id: str, courier_id: str) -> None:
         """Associate an order with a courier (simple link)."""
         raise NotImplementedError
 
+    def record_payment(self, order_id: str, record: PaymentRecord) -> None:
+        """Store the order's current PaymentRecord or raise OrderNotFound."""
+        raise NotImplementedError
+
     def payment_record(self, order_id: str) -> PaymentRecord | None:
         """Return the current PaymentRecord for the order, if any."""
         raise NotImplementedError
 
 
+class AsyncOrderRepository(Protocol):
+    """Asyncio mirror of OrderRepository with the same semantics."""
+
+    async def save(self, order: "Order") -> str:
+        """Insert or update an order; returns the order ID."""
+        raise NotImplementedError
+
+    async def get(self, order_id: str) -> "Order":
+        """Fetch an order by ID or raise OrderNotFound."""
+        raise NotImplementedError
+
+    async def find_by_status(self, status: "OrderStatus") -> Sequence["Order"]:
+        """Return all orders with the given status."""
+        raise NotImplementedError
+
+    async def list_all(self) -> Sequence["Order"]:
+        """Return all stored orders (unspecified ordering)."""
+        raise NotImplementedError
+
+    async def page_all(self, cursor: str | None = None, limit: int = 1000) -> Page:
+        """Return the next page of all orders after ``cursor``, in a stable order."""
+        raise NotImplementedError
+
+    async def page_by_status(
+        self, status: "OrderStatus", cursor: str | None = None, limit: int = 1000
+    ) -> Page:
+        """Like page_all(), restricted to orders with the given status."""
+        raise NotImplementedError
+
+    async def link_courier(self, order_id: str, courier_id: str) -> None:
+        """Associate an order with a courier (simple link)."""
+        raise NotImplementedError
+
+    async def record_payment(self, order_id: str, record: PaymentRecord) -> None:
+        """Store the order's current PaymentRecord or raise OrderNotFound."""
+        raise NotImplementedError
+
+    async def payment_record(self, order_id: str) -> PaymentRecord | None:
+        """Return the current PaymentRecord for the order, if any."""
+        raise NotImplementedError
+
+
 class InMemoryOrderRepository:
     """Simple in-memory repository for development/tests.
 
     Storage:
       - _orders: order_id -> Order
+      - _sequence: order IDs in first-save order (page cursors are positions in it)
       - _courier_links: order_id -> courier_id
       - _payments: order_id -> PaymentRecord
+      - _by_status: status -> {order_id: Order}
+      - _position: order_id -> index in _sequence; _status_positions: StatusPositions
+      - _by_courier: courier_id -> {order_id: None}
+      - _by_customer: customer -> {order_id: None}
+
+    Secondary indexes are dicts used as insertion-ordered sets, so moving an order
+    between buckets is O(1) and find_by_* cost O(result size).
 
     Notes:
       - No disk persistence.
+      - Orders are stored by reference. save() also adds the repository to the
+        order's event sinks (see events.add_sink), so a transition of a stored order
+        moves it in the status index right away, without another save().
       - Not thread-safe (single-process test use).
     """
 
     def __init__(self) -> None:
         self._orders: dict[str, "Order"] = {}
+        self._sequence: list[str] = []
+        self._position: dict[str, int] = {}
+        self._status_positions = StatusPositions()
         self._courier_links: dict[str, str] = {}
         self._payments: dict[str, PaymentRecord] = {}
+        self._status_of: dict[str, OrderStatus] = {}
+        self._customer_of: dict[str, str] = {}
+        self._by_status: dict[OrderStatus, dict[str, "Order"]] = {
+            status: {} for status in OrderStatus
+        }
+        self._by_courier: dict[str, dict[str, None]] = {}
+        self._by_customer: dict[str, dict[str, None]] = {}
 
     def save(self, order: "Order") -> str:
-        """Upsert an order and return its ID."""
-        raise NotImplementedError
+        """Upsert an order and return its ID; an order without ID gets a fresh one."""
+
+        if order.id is None:
+            order.id = OrderId.generate()
+        order_id = str(order.id)
+        if order_id not in self._position:
+            self._position[order_id] = len(self._sequence)
+            self._sequence.append(order_id)
+
+        self._index_status(order_id, order)
+        add_sink(order, self)
+
+        customer = self._customer_of.get(order_id)
+        if customer != order.customer:
+            if customer is not None:
+                _discard(self._by_customer, customer, order_id)
+            self._customer_of[order_id] = order.customer
+            self._by_customer.setdefault(order.customer, {})[order_id] = None
+
+        self._orders[order_id] = order
+        return order_id
+
+    def emit(self, order_id: str, previous: OrderStatus | None, status: OrderStatus) -> None:
+        """EventSink: re-index a stored order on its status change."""
+
+        order = self._orders.get(order_id)
+        if order is not None and order.status is status:
+            self._index_status(order_id, order)
 
     def get(self, order_id: str) -> "Order":
         """Return the order by ID or raise OrderNotFound."""
-        raise NotImplementedError
+
+        try:
+            return self._orders[order_id]
+        except KeyError:
+            raise OrderNotFound(order_id) from None
+
+    def find_by_status(self, status: "OrderStatus") -> Sequence["Order"]:
+        """List orders filtered by status, in order of their last status change."""
+
+        return tuple(self._by_status[status].values())
+
+    def find_by_courier(self, courier_id: str) -> Sequence["Order"]:
+        """List orders currently linked to the courier."""
+
+        orders = self._orders
+        return tuple(orders[order_id] for order_id in self._by_courier.get(courier_id, ()))
+
+    def find_by_customer(self, customer: str) -> Sequence["Order"]:
+        """List orders of one customer, oldest first."""
+
+        orders = self._orders
+        return tuple(orders[order_id] for order_id in self._by_customer.get(customer, ()))
+
+    def count_by_status(self) -> Mapping["OrderStatus", int]:
+        """Number of orders per status, without materializing them."""
+
+        return {status: len(bucket) for status, bucket in self._by_status.items()}
+
+    def list_all(self) -> Sequence["Order"]:
+        """List all stored orders."""
+
+        return tuple(self._orders.values())
+
+    def page_all(self, cursor: str | None = None, limit: int = 1000) -> Page:
+        """Next ``limit`` orders in first-save order."""
+
+        start = int(cursor or 0)
+        stop = start + limit
+        orders = self._orders
+        page = tuple(orders[order_id] for order_id in self._sequence[start:stop])
+        return Page(page, str(stop) if stop < len(self._sequence) else None)
+
+    def page_by_status(
+        self, status: "OrderStatus", cursor: str | None = None, limit: int = 1000
+    ) -> Page:
+        """Next ``limit`` orders with the status, in first-save order (see StatusPositions)."""
+
+        positions, next_cursor = self._status_positions.page(status, cursor, limit)
+        orders = self._orders
+        sequence = self._sequence
+        return Page(tuple(orders[sequence[position]] for position in positions), next_cursor)
+
+    def iter_all(self, cursor: str | None = None, page_size: int = 1000) -> Iterator["Order"]:
+        return iter_pages(lambda after: self.page_all(after, page_size), cursor)
+
+    def iter_by_status(
+        self, status: "OrderStatus", cursor: str | None = None, page_size: int = 1000
+    ) -> Iterator["Order"]:
+        return iter_pages(lambda after: self.page_by_status(status, after, page_size), cursor)
+
+    def link_courier(self, order_id: str, courier_id: str) -> None:
+        """Link courier to order (overwrites previous link)."""
+
+        if order_id not in self._orders:
+            raise OrderNotFound(order_id)
+        previous = self._courier_links.get(order_id)
+        if previous is not None:
+            _discard(self._by_courier, previous, order_id)
+        self._courier_links[order_id] = courier_id
+        self._by_courier.setdefault(courier_id, {})[order_id] = None
+
+    def record_payment(self, order_id: str, record: PaymentRecord) -> None:
+        """Store the current PaymentRecord of an order (replaces the previous one)."""
+
+        if order_id not in self._orders:
+            raise OrderNotFound(order_id)
+        self._payments[order_id] = record
+
+    def payment_record(self, order_id: str) -> PaymentRecord | None:
+        """Get PaymentRecord for order, or None if not set."""
+
+        return self._payments.get(order_id)
+
+    def _index_status(self, order_id: str, order: "Order") -> None:
+        status = order.status
+        previous = self._status_of.get(order_id)
+        if previous is not status:
+            if previous is not None:
+                del self._by_status[previous][order_id]
+            self._status_of[order_id] = status
+            self._status_positions.move(self._position[order_id], previous, status)
+        self._by_status[status][order_id] = order
+
+
+class _Shard:
+    __slots__ = ("lock", "repo", "versions")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.repo = InMemoryOrderRepository()
+        self.versions: dict[str, int] = {}
+
+
+class ShardedOrderRepository:
+    """Thread-safe repository partitioned by order ID into independently locked shards.
+
+    Storage:
+      - _shards: InMemoryOrderRepository + order_id -> version, one lock each.
+
+    Every save() bumps the order's version (first save: 1). Passing
+    ``expected_version`` makes the save conditional: it raises StaleOrderVersion
+    unless the stored version still matches (0 means "must not exist yet").
+    Orders are copied in and out (items and metadata included, event sinks not):
+    the store only changes through save(), so a rejected save leaves the stored
+    order as it was, and callers never share an order object across threads.
+    Cross-shard reads (find_by_*, list_all) lock one shard at a time, so they see
+    each shard consistently but not a global snapshot.
+    """
+
+    def __init__(self, shards: int = 16) -> None:
+        if shards <= 0:
+            raise ValueError(f"shards must be > 0, got {shards}")
+        self._shards = tuple(_Shard() for _ in range(shards))
+
+    def save(self, order: "Order", expected_version: int | None = None) -> str:
+        """Upsert an order and return its ID; raise StaleOrderVersion on a stale write."""
+
+        if order.id is None:
+            order.id = OrderId.generate()
+        order_id = str(order.id)
+        shard = self._shard(order_id)
+        with shard.lock:
+            current = shard.versions.get(order_id, 0)
+            if expected_version is not None and expected_version != current:
+                raise StaleOrderVersion(order_id, expected_version, current)
+            shard.repo.save(_snapshot(order))
+            shard.versions[order_id] = current + 1
+        return order_id
+
+    def get(self, order_id: str) -> "Order":
+        """Return the order by ID or raise OrderNotFound."""
+
+        shard = self._shard(order_id)
+        with shard.lock:
+            return _snapshot(shard.repo.get(order_id))
+
+    def get_versioned(self, order_id: str) -> tuple["Order", int]:
+        """Return the order and its current version, for a later conditional save()."""
+
+        shard = self._shard(order_id)
+        with shard.lock:
+            return _snapshot(shard.repo.get(order_id)), shard.versions[order_id]
+
+    def version(self, order_id: str) -> int:
+        """Current version of the order (0 if it was never saved)."""
+
+        shard = self._shard(order_id)
+        with shard.lock:
+            return shard.versions.get(order_id, 0)
 
     def find_by_status(self, status: "OrderStatus") -> Sequence["Order"]:
         """List orders filtered by status."""
-        raise NotImplementedError
+
+        return self._gather(lambda repo: repo.find_by_status(status))
+
+    def find_by_courier(self, courier_id: str) -> Sequence["Order"]:
+        """List orders currently linked to the courier."""
+
+        return self._gather(lambda repo: repo.find_by_courier(courier_id))
+
+    def find_by_customer(self, customer: str) -> Sequence["Order"]:
+        """List orders of one customer."""
+
+        return self._gather(lambda repo: repo.find_by_customer(customer))
 
     def list_all(self) -> Sequence["Order"]:
         """List all stored orders."""
 
-        raise NotImplementedError
+        return self._gather(InMemoryOrderRepository.list_all)
+
+    def page_all(self, cursor: str | None = None, limit: int = 1000) -> Page:
+        """Next ``limit`` orders, shard by shard; cursor is "shard:position"."""
+
+        return self._page(lambda repo, after, n: repo.page_all(after, n), cursor, limit)
+
+    def page_by_status(
+        self, status: "OrderStatus", cursor: str | None = None, limit: int = 1000
+    ) -> Page:
+        """Next ``limit`` orders with the status, shard by shard."""
+
+        return self._page(
+            lambda repo, after, n: repo.page_by_status(status, after, n), cursor, limit
+        )
+
+    def iter_all(self, cursor: str | None = None, page_size: int = 1000) -> Iterator["Order"]:
+        return iter_pages(lambda after: self.page_all(after, page_size), cursor)
+
+    def iter_by_status(
+        self, status: "OrderStatus", cursor: str | None = None, page_size: int = 1000
+    ) -> Iterator["Order"]:
+        return iter_pages(lambda after: self.page_by_status(status, after, page_size), cursor)
 
     def link_courier(self, order_id: str, courier_id: str) -> None:
         """Link courier to order (overwrites previous link)."""
 
-        raise NotImplementedError
+        shard = self._shard(order_id)
+        with shard.lock:
+            shard.repo.link_courier(order_id, courier_id)
+
+    def record_payment(self, order_id: str, record: PaymentRecord) -> None:
+        """Store the current PaymentRecord of an order (replaces the previous one)."""
+
+        shard = self._shard(order_id)
+        with shard.lock:
+            shard.repo.record_payment(order_id, record)
 
     def payment_record(self, order_id: str) -> PaymentRecord | None:
         """Get PaymentRecord for order, or None if not set."""
 
-        raise NotImplementedError
+        shard = self._shard(order_id)
+        with shard.lock:
+            return shard.repo.payment_record(order_id)
+
+    def __len__(self) -> int:
+        return sum(len(shard.versions) for shard in self._shards)
+
+    def _shard(self, order_id: str) -> _Shard:
+        return self._shards[hash(order_id) % len(self._shards)]
+
+    def _page(
+        self,
+        fetch: Callable[[InMemoryOrderRepository, str | None, int], Page],
+        cursor: str | None,
+        limit: int,
+    ) -> Page:
+        index, _, position = (cursor or "0:0").partition(":")
+        shard_no = int(index)
+        after: str | None = position
+        orders: list["Order"] = []
+        while shard_no < len(self._shards) and len(orders) < limit:
+            shard = self._shards[shard_no]
+            with shard.lock:
+                page = fetch(shard.repo, after, limit - len(orders))
+                orders.extend(map(_snapshot, page.orders))
+            if page.cursor is not None:
+                return Page(tuple(orders), f"{shard_no}:{page.cursor}")
+            shard_no += 1
+            after = None
+        more = shard_no < len(self._shards)
+        return Page(tuple(orders), f"{shard_no}:0" if more else None)
+
+    def _gather(
+        self, query: Callable[[InMemoryOrderRepository], Sequence["Order"]]
+    ) -> Sequence["Order"]:
+        result: list["Order"] = []
+        for shard in self._shards:
+            with shard.lock:
+                result.extend(map(_snapshot, query(shard.repo)))
+        return tuple(result)
+
+
+def _snapshot(order: "Order") -> "Order":
+    """Copy of the order that shares no mutable state (and no event sinks) with it."""
+
+    clone = copy.copy(order)
+    clone._items = list(order._items)
+    clone.metadata = dict(order.metadata)
+    clone.events = None
+    return clone
+
+
+class ExecutorOrderRepository:
+    """AsyncOrderRepository running a sync OrderRepository on a bounded thread pool.
+
+    Concurrent get()s of the same order ID share one executor call; the caller
+    that started it gets the inner repository's order and every joining caller a
+    copy of its own, so no two callers mutate the same object. A save() or
+    link_courier() of an order detaches its in-flight get, so reads issued after a
+    write completes never see the pre-write state.
+    ``max_workers`` must be 1 for repositories that are not thread-safe
+    (InMemoryOrderRepository); ShardedOrderRepository and SQLiteOrderRepository
+    can use more.
+    """
+
+    def __init__(self, inner: OrderRepository, max_workers: int = 4) -> None:
+        if max_workers <= 0:
+            raise ValueError(f"max_workers must be > 0, got {max_workers}")
+        self.inner = inner
+        self.coalesced = 0
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix="order-repo")
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    async def save(self, order: "Order") -> str:
+        order_id = await self._run(self.inner.save, order)
+        self._inflight.pop(order_id, None)
+        return order_id
+
+    async def get(self, order_id: str) -> "Order":
+        pending = self._inflight.get(order_id)
+        if pending is not None:
+            self.coalesced += 1
+            return _snapshot(await asyncio.shield(pending))
+
+        pending = asyncio.ensure_future(self._run(self.inner.get, order_id))
+        self._inflight[order_id] = pending
+        try:
+            return await asyncio.shield(pending)
+        finally:
+            if self._inflight.get(order_id) is pending:
+                del self._inflight[order_id]
+
+    async def find_by_status(self, status: "OrderStatus") -> Sequence["Order"]:
+        return await self._run(self.inner.find_by_status, status)
+
+    async def list_all(self) -> Sequence["Order"]:
+        return await self._run(self.inner.list_all)
+
+    async def page_all(self, cursor: str | None = None, limit: int = 1000) -> Page:
+        return await self._run(self.inner.page_all, cursor, limit)
+
+    async def page_by_status(
+        self, status: "OrderStatus", cursor: str | None = None, limit: int = 1000
+    ) -> Page:
+        return await self._run(self.inner.page_by_status, status, cursor, limit)
+
+    async def iter_all(
+        self, cursor: str | None = None, page_size: int = 1000
+    ) -> AsyncIterator["Order"]:
+        """Stream all orders; each page is fetched on the executor when needed."""
+
+        while True:
+            page = await self.page_all(cursor, page_size)
+            for order in page.orders:
+                yield order
+            if page.cursor is None:
+                return
+            cursor = page.cursor
+
+    async def iter_by_status(
+        self, status: "OrderStatus", cursor: str | None = None, page_size: int = 1000
+    ) -> AsyncIterator["Order"]:
+        while True:
+            page = await self.page_by_status(status, cursor, page_size)
+            for order in page.orders:
+                yield order
+            if page.cursor is None:
+                return
+            cursor = page.cursor
+
+    async def link_courier(self, order_id: str, courier_id: str) -> None:
+        await self._run(self.inner.link_courier, order_id, courier_id)
+        self._inflight.pop(order_id, None)
+
+    async def record_payment(self, order_id: str, record: PaymentRecord) -> None:
+        await self._run(self.inner.record_payment, order_id, record)
+
+    async def payment_record(self, order_id: str) -> PaymentRecord | None:
+        return await self._run(self.inner.payment_record, order_id)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    async def _run(self, call: Callable[..., Any], *args: Any) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, call, *args)
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    """Counters of a CachingOrderRepository.
+
+    Fields:
+      hits: get() answered with a cached order.
+      negative_hits: get() answered with a cached OrderNotFound.
+      misses: get() calls that reached the inner repository.
+      evictions: Entries dropped by the LRU bound.
+      expired: Entries dropped because their TTL passed.
+      size: Orders currently cached.
+    """
+
+    hits: int
+    negative_hits: int
+    misses: int
+    evictions: int
+    expired: int
+    size: int
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of get() calls that did not reach the inner repository."""
+
+        total = self.hits + self.negative_hits + self.misses
+        return (self.hits + self.negative_hits) / total if total else 0.0
+
+
+class CachingOrderRepository:
+    """Read-through cache for get() in front of any OrderRepository.
+
+    Found orders are kept in a size-bounded LRU with ``ttl``; OrderNotFound is
+    cached separately for ``negative_ttl`` so polling unknown IDs stays cheap.
+    save() writes through (the saved order replaces the cached one) and
+    link_courier() invalidates. All other calls go straight to the inner repository.
+    Cached orders are shared objects: mutate them only to save() them back.
+
+    A get() that misses fills the cache only if no save() or invalidation of the
+    same order happened while it was reading the inner repository, so a slow read
+    cannot cache the pre-write order (or a stale OrderNotFound) for a whole TTL.
+
+    Storage:
+      - _fills: order_id -> get() calls currently reading it from the inner repository
+      - _written: order IDs written while one of those reads was in flight
+    """
+
+    def __init__(
+        self,
+        inner: OrderRepository,
+        max_entries: int = 10_000,
+        ttl: float = 5.0,
+        negative_ttl: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.inner = inner
+        self._orders: TTLCache["Order"] = TTLCache(max_entries, ttl, clock)
+        self._missing: TTLCache[bool] = TTLCache(max_entries, negative_ttl, clock)
+        self._lock = threading.Lock()
+        self._fills: dict[str, int] = {}
+        self._written: set[str] = set()
+        self._hits = 0
+        self._negative_hits = 0
+        self._misses = 0
+
+    def save(self, order: "Order") -> str:
+        order_id = self.inner.save(order)
+        with self._lock:
+            self._mark_written(order_id)
+            self._missing.discard(order_id)
+            self._orders.put(order_id, order)
+        return order_id
+
+    def get(self, order_id: str) -> "Order":
+        order = self._orders.get(order_id)
+        if order is not None:
+            with self._lock:
+                self._hits += 1
+            return order
+        if self._missing.get(order_id):
+            with self._lock:
+                self._negative_hits += 1
+            raise OrderNotFound(order_id)
+
+        with self._lock:
+            self._misses += 1
+            self._fills[order_id] = self._fills.get(order_id, 0) + 1
+        try:
+            order = self.inner.get(order_id)
+        except OrderNotFound:
+            self._end_fill(order_id, self._missing, True)
+            raise
+        except BaseException:
+            self._end_fill(order_id, None, None)
+            raise
+        self._end_fill(order_id, self._orders, order)
+        return order
+
+    def invalidate(self, order_id: str) -> None:
+        """Forget any cached answer for the order."""
+
+        with self._lock:
+            self._mark_written(order_id)
+            self._orders.discard(order_id)
+            self._missing.discard(order_id)
+
+    def find_by_courier(self, courier_id: str) -> Sequence["Order"]:
+        return self.inner.find_by_courier(courier_id)  # type: ignore[attr-defined]
+
+    def find_by_customer(self, customer: str) -> Sequence["Order"]:
+        return self.inner.find_by_customer(customer)  # type: ignore[attr-defined]
+
+    def find_by_status(self, status: "OrderStatus") -> Sequence["Order"]:
+        return self.inner.find_by_status(status)
+
+    def list_all(self) -> Sequence["Order"]:
+        return self.inner.list_all()
+
+    def page_all(self, cursor: str | None = None, limit: int = 1000) -> Page:
+        return self.inner.page_all(cursor, limit)
+
+    def page_by_status(
+        self, status: "OrderStatus", cursor: str | None = None, limit: int = 1000
+    ) -> Page:
+        return self.inner.page_by_status(status, cursor, limit)
+
+    def iter_all(self, cursor: str | None = None, page_size: int = 1000) -> Iterator["Order"]:
+        return iter_pages(lambda after: self.page_all(after, page_size), cursor)
+
+    def iter_by_status(
+        self, status: "OrderStatus", cursor: str | None = None, page_size: int = 1000
+    ) -> Iterator["Order"]:
+        return iter_pages(lambda after: self.page_by_status(status, after, page_size), cursor)
+
+    def link_courier(self, order_id: str, courier_id: str) -> None:
+        self.inner.link_courier(order_id, courier_id)
+        self.invalidate(order_id)
+
+    def record_payment(self, order_id: str, record: PaymentRecord) -> None:
+        self.inner.record_payment(order_id, record)
+
+    def payment_record(self, order_id: str) -> PaymentRecord | None:
+        return self.inner.payment_record(order_id)
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                negative_hits=self._negative_hits,
+                misses=self._misses,
+                evictions=self._orders.evictions + self._missing.evictions,
+                expired=self._orders.expired + self._missing.expired,
+                size=len(self._orders),
+            )
+
+    def _mark_written(self, order_id: str) -> None:
+        if order_id in self._fills:
+            self._written.add(order_id)
+
+    def _end_fill(self, order_id: str, cache: TTLCache | None, value: Any) -> None:
+        """Finish one read of the order, caching ``value`` unless it was written meanwhile."""
+
+        with self._lock:
+            if cache is not None and order_id not in self._written:
+                cache.put(order_id, value)
+            remaining = self._fills[order_id] - 1
+            if remaining:
+                self._fills[order_id] = remaining
+            else:
+                del self._fills[order_id]
+                self._written.discard(order_id)
+
+
+def _discard(index: dict[str, dict[str, None]], key: str, order_id: str) -> None:
+    bucket = index[key]
+    del bucket[order_id]
+    if not bucket:
+        del index[key]
@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Literal
+
+from .errors import (
+    DomainError,
+    PaymentCircuitOpen,
+    PaymentProviderError,
+    PaymentTimeout,
+    PricingError,
+)
+from .metrics import Histogram
+from .payment import (
+    Money,
+    Payment,
+    PaymentAuthResult,
+    PaymentCaptureResult,
+    PaymentRefundResult,
+)
+
+if TYPE_CHECKING:
+    from .order import Order
+
+Operation = Literal["authorize", "capture", "refund"]
+CircuitState = Literal["closed", "open", "half-open"]
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with half-open probing.
+
+    closed -> open after ``failure_threshold`` consecutive failures;
+    open -> half-open after ``reset_timeout`` seconds, letting ``half_open_probes``
+    calls through; a successful probe closes the circuit, a failed one reopens it.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        half_open_probes: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if failure_threshold <= 0 or half_open_probes <= 0:
+            raise ValueError("failure_threshold and half_open_probes must be > 0")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state: CircuitState = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def allow(self) -> float:
+        """Return 0 if a call may proceed, otherwise seconds until the next probe."""
+
+        with self._lock:
+            self._maybe_half_open()
+            if self._state == "closed":
+                return 0.0
+            if self._state == "half-open" and self._probes < self.half_open_probes:
+                self._probes += 1
+                return 0.0
+            if self._state == "half-open":
+                return self.reset_timeout  # probes in flight; their outcome decides
+            return self._opened_at + self.reset_timeout - self._clock()
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._state = "closed"
+
+    def release(self) -> None:
+        """Give back a half-open probe slot without judging the provider.
+
+        For calls that ended in an error that says nothing about the provider
+        (a bug in the caller); in any other state it does nothing.
+        """
+
+        with self._lock:
+            if self._state == "half-open" and self._probes:
+                self._probes -= 1
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == "half-open" or self._failures >= self.failure_threshold:
+                self._state = "open"
+                self._opened_at = self._clock()
+
+    def _maybe_half_open(self) -> None:
+        if self._state == "open" and self._clock() - self._opened_at >= self.reset_timeout:
+            self._state = "half-open"
+            self._probes = 0
+
+
+class RetryBudget:
+    """Retries allowed as a share of calls: each call deposits ``ratio`` tokens.
+
+    Keeps retries from multiplying load on a provider that is already struggling.
+    """
+
+    def __init__(self, ratio: float = 0.1, initial: float = 10.0, cap: float = 100.0) -> None:
+        self.ratio = ratio
+        self.cap = cap
+        self._tokens = min(initial, cap)
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._tokens = min(self._tokens + self.ratio, self.cap)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+
+@dataclass(frozen=True, slots=True)
+class ResilienceStats:
+    """Counters of a ResilientPayment."""
+
+    calls: int
+    failures: int
+    retries: int
+    hedges: int
+    hedge_wins: int
+    short_circuited: int
+
+
+class ResilientPayment:
+    """Payment wrapper with a circuit breaker, budgeted retries and hedged requests.
+
+    Only PaymentProviderError (transport failures, timeouts) counts as a failure;
+    business errors such as PaymentNotAuthorized are passed through untouched.
+    Retries and hedges are used only for ``idempotent`` operations (provider-side
+    authorize and capture answer repeats with "already-*"); refunds run once.
+
+    With ``hedge_after`` set, a second identical request is sent if the first has not
+    answered within that many seconds, and the first successful answer wins.
+    With ``deadline`` set, a call that has not answered in time raises PaymentTimeout.
+    """
+
+    def __init__(
+        self,
+        inner: Payment,
+        provider: str,
+        breaker: CircuitBreaker | None = None,
+        retries: int = 1,
+        budget: RetryBudget | None = None,
+        hedge_after: float | None = None,
+        deadline: float | None = None,
+        idempotent: frozenset[str] = frozenset({"authorize", "capture"}),
+        max_workers: int = 32,
+    ) -> None:
+        self.inner = inner
+        self.method = inner.method
+        self.provider = provider
+        self.breaker = breaker or CircuitBreaker()
+        self.retries = retries
+        self.budget = budget or RetryBudget()
+        self.hedge_after = hedge_after
+        self.deadline = deadline
+        self.idempotent = idempotent
+        self._executor = (
+            ThreadPoolExecutor(max_workers, thread_name_prefix=f"pay-{provider}")
+            if hedge_after is not None or deadline is not None
+            else None
+        )
+        self._lock = threading.Lock()
+        self._histograms: dict[tuple[str, str], Histogram] = {}
+        self._counts = dict.fromkeys(ResilienceStats.__slots__, 0)
+
+    def authorize(self, order: "Order") -> PaymentAuthResult:
+        return self._call("authorize", lambda: self.inner.authorize(order))
+
+    def capture(self, order: "Order", amount: Money) -> PaymentCaptureResult:
+        return self._call("capture", lambda: self.inner.capture(order, amount))
+
+    def refund(self, order: "Order", amount: Money) -> PaymentRefundResult:
+        return self._call("refund", lambda: self.inner.refund(order, amount))
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def histograms(self) -> dict[tuple[str, str], Histogram]:
+        """(provider, operation) -> latency histogram (ns) of calls as seen by the caller."""
+
+        with self._lock:
+            return dict(self._histograms)
+
+    def stats(self) -> ResilienceStats:
+        with self._lock:
+            return ResilienceStats(**self._counts)
+
+    def _call(self, operation: Operation, call: Callable[[], Any]) -> Any:
+        started = time.perf_counter_ns()
+        self._count("calls")
+        self.budget.deposit()
+        safe = operation in self.idempotent
+        attempt = 0
+        try:
+            while True:
+                retry_in = self.breaker.allow()
+                if retry_in:
+                    self._count("short_circuited")
+                    raise PaymentCircuitOpen(self.provider, retry_in)
+                try:
+                    result = self._attempt(call, hedge=safe)
+                except PaymentProviderError:
+                    self.breaker.record_failure()
+                    self._count("failures")
+                    if not safe or attempt >= self.retries or not self.budget.withdraw():
+                        raise
+                    attempt += 1
+                    self._count("retries")
+                    continue
+                except (DomainError, PricingError):
+                    # a business error still means the provider answered: it must
+                    # close the circuit, or a half-open probe would hold its slot
+                    self.breaker.record_success()
+                    raise
+                except Exception:
+                    self.breaker.release()  # a bug, not an answer: no verdict
+                    raise
+                self.breaker.record_success()
+                return result
+        finally:
+            self._observe(operation, time.perf_counter_ns() - started)
+
+    def _attempt(self, call: Callable[[], Any], hedge: bool) -> Any:
+        if self._executor is None:
+            return call()
+
+        primary = self._executor.submit(call)
+        pending: set[Future] = {primary}
+        started = time.perf_counter()
+        hedge_after = self.hedge_after if hedge else None
+        error: BaseException | None = None
+        while pending:
+            elapsed = time.perf_counter() - started
+            timeouts = [] if self.deadline is None else [self.deadline - elapsed]
+            if hedge_after is not None and len(pending) == 1 and primary in pending:
+                timeouts.append(hedge_after - elapsed)
+            timeout = max(min(timeouts), 0.0) if timeouts else None
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    return future.result()
+                error = future.exception()
+            if self.deadline is not None and time.perf_counter() - started >= self.deadline:
+                raise PaymentTimeout(self.provider, self.deadline)
+            if hedge_after is not None and not done and primary in pending:
+                self._count("hedges")
+                hedged = self._executor.submit(call)
+                hedged.add_done_callback(self._hedge_done(primary))
+                pending.add(hedged)
+                hedge_after = None
+        assert error is not None
+        raise error
+
+    def _hedge_done(self, primary: Future) -> Callable[[Future], None]:
+        def done(hedged: Future) -> None:
+            if hedged.exception() is None and not (primary.done() and primary.exception() is None):
+                self._count("hedge_wins")
+
+        return done
+
+    def _observe(self, operation: str, nanoseconds: int) -> None:
+        with self._lock:
+            key = (self.provider, operation)
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.record(nanoseconds)
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counts[name] += 1
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Sequence
+
+from .delivery import BASE_SPEED, Coordinates, Dispatcher, distance
+from .status import OrderStatus
+
+if TYPE_CHECKING:
+    from .order import Order
+
+
+def tour_length(depot: Coordinates, stops: Sequence[Coordinates]) -> float:
+    """Length of the closed tour depot -> stops -> depot."""
+
+    total = 0.0
+    prev = depot
+    for stop in stops:
+        total += distance(prev, stop)
+        prev = stop
+    return total + distance(prev, depot)
+
+
+def plan_route(depot: Coordinates, stops: Sequence[Coordinates]) -> list[int]:
+    """Return the visiting order of stops (indices) for a trip starting at the depot.
+
+    Nearest-neighbour construction followed by 2-opt improvement on the closed tour.
+    """
+
+    remaining = list(range(len(stops)))
+    route: list[int] = []
+    current = depot
+    while remaining:
+        nearest = min(remaining, key=lambda i: distance(current, stops[i]))
+        remaining.remove(nearest)
+        route.append(nearest)
+        current = stops[nearest]
+
+    if len(route) < 3:
+        return route
+
+    points = [depot] + [stops[i] for i in route] + [depot]
+    improved = True
+    while improved:
+        improved = False
+        for i in range(1, len(points) - 2):
+            for k in range(i + 1, len(points) - 1):
+                delta = (
+                    distance(points[i - 1], points[k])
+                    + distance(points[i], points[k + 1])
+                    - distance(points[i - 1], points[i])
+                    - distance(points[k], points[k + 1])
+                )
+                if delta < -1e-12:
+                    points[i : k + 1] = reversed(points[i : k + 1])
+                    route[i - 1 : k] = reversed(route[i - 1 : k])
+                    improved = True
+    return route
+
+
+@dataclass(frozen=True, slots=True)
+class Trip:
+    """Multi-drop trip: one courier, orders in stop order, closed-tour length and duration."""
+
+    courier_id: str
+    order_ids: Sequence[str]
+    stops: Sequence[Coordinates]
+    distance: float
+    duration: float
+
+
+@dataclass(frozen=True, slots=True)
+class BatchPlan:
+    """Result of batching: planned trips and orders left for the next round."""
+
+    trips: Sequence[Trip]
+    unassigned: Sequence["Order"] = ()
+
+    @property
+    def deliveries(self) -> int:
+        return sum(len(trip.order_ids) for trip in self.trips)
+
+
+class RouteBatcher:
+    """Route-batching dispatcher: groups nearby BOXED orders into multi-drop trips.
+
+    Rules:
+      - Couriers pick orders up at the depot (restaurant).
+      - A courier takes at most ``capacity - current_load`` orders per trip.
+      - Every drop must be reached within ``max_detour`` extra distance compared to
+        driving straight from the depot to that customer.
+
+    Chosen couriers are sent out through Dispatcher.send_out, which raises their
+    ``current_load`` and takes them out of the available index, and every planned
+    order is dispatched on its trip's courier, so the next plan() skips it.
+    """
+
+    def __init__(self, depot: Coordinates, capacity: int = 3, max_detour: float = 2.0) -> None:
+        if capacity <= 0:
+            raise ValueError(f"capacity must be > 0, got {capacity}")
+        if max_detour < 0:
+            raise ValueError(f"max_detour must be >= 0, got {max_detour}")
+        self.depot = depot
+        self.capacity = capacity
+        self.max_detour = max_detour
+
+    def plan(self, orders: Sequence["Order"], dispatcher: Dispatcher) -> BatchPlan:
+        """Build trips for dispatch-ready orders using the dispatcher's available couriers."""
+
+        depot = self.depot
+        pending = sorted(  # nearest first: seeds are popped from the far end
+            (order for order in orders if order.status is OrderStatus.BOXED),
+            key=lambda order: distance(depot, order.delivery_address),
+        )
+        fleet = sorted(
+            dispatcher.available_couriers(),
+            key=lambda courier: distance(courier.location, depot),
+        )
+
+        trips: list[Trip] = []
+        for courier in fleet:
+            if not pending:
+                break
+            load = courier.current_load or 0
+            spare = self.capacity - load
+            if spare <= 0:
+                continue
+
+            seed = pending.pop()
+            group, route = self._grow(seed, pending, spare)
+            stops = [group[i].delivery_address for i in route]
+            length = tour_length(depot, stops)
+            trips.append(
+                Trip(
+                    courier_id=courier.id,
+                    order_ids=tuple(str(group[i].id) for i in route),
+                    stops=tuple(stops),
+                    distance=length,
+                    duration=length / (BASE_SPEED * courier.vehicle.speed_coef),
+                )
+            )
+            dispatcher.send_out(courier.id, len(group))
+            for order in group:
+                order.dispatch_with(courier.id, type(self).__name__)
+
+        return BatchPlan(trips=tuple(trips), unassigned=tuple(reversed(pending)))
+
+    def _grow(
+        self, seed: "Order", pending: list["Order"], spare: int
+    ) -> tuple[list["Order"], list[int]]:
+        """Add the nearest pending orders to the seed while constraints hold."""
+
+        group = [seed]
+        route = [0]
+        if spare == 1:
+            return group, route
+
+        origin = seed.delivery_address
+        nearby = [
+            (gap, order)
+            for order in pending
+            if (gap := distance(origin, order.delivery_address)) <= self.max_detour
+        ]
+        nearby.sort(key=lambda pair: pair[0])
+        for _, candidate in nearby:
+            if len(group) >= spare:
+                break
+            trial = group + [candidate]
+            trial_route = plan_route(self.depot, [order.delivery_address for order in trial])
+            if self._within_detour(trial, trial_route):
+                group, route = trial, trial_route
+                pending.remove(candidate)
+        return group, route
+
+    def _within_detour(self, group: Sequence["Order"], route: Sequence[int]) -> bool:
+        travelled = 0.0
+        prev = self.depot
+        for i in route:
+            stop = group[i].delivery_address
+            travelled += distance(prev, stop)
+            if travelled - distance(self.depot, stop) > self.max_detour:
+                return False
+            prev = stop
+        return True
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import TYPE_CHECKING, Mapping, Protocol, Sequence
+
+from .errors import (
+    PaymentAlreadyQueued,
+    PaymentAmountMismatch,
+    PaymentError,
+    PaymentProviderError,
+)
+from .payment import Money, PaymentAuthResult, PaymentCaptureResult
+from .types import quantize_money
+
+if TYPE_CHECKING:
+    from .order import Order
+
+
+class BatchCaptureProvider(Protocol):
+    """Provider able to capture many authorized payments in one call."""
+
+    async def capture_batch(
+        self, items: Sequence[tuple["Order", Money]]
+    ) -> Sequence[PaymentCaptureResult | PaymentError]:
+        """Return one capture result or payment error per item, in input order."""
+        raise NotImplementedError
+
+
+@dataclass(frozen=True, slots=True)
+class SettlementReport:
+    """Outcome of one settlement run reconciled against Order.final_total().
+
+    Fields:
+      batches: Provider calls made.
+      captured: order_id -> capture result.
+      failed: order_id -> payment error (provider or local validation).
+      expected_total: Sum of final_total() over all queued orders.
+      captured_total: Sum of captured amounts.
+      discrepancies: Orders whose captured amount differs from final_total().
+    """
+
+    batches: int
+    captured: Mapping[str, PaymentCaptureResult]
+    failed: Mapping[str, PaymentError]
+    expected_total: Money
+    captured_total: Money
+    discrepancies: Sequence[str] = ()
+
+    @property
+    def reconciled(self) -> bool:
+        """True if every order was captured at exactly its final total."""
+
+        return (
+            not self.failed
+            and not self.discrepancies
+            and self.captured_total == self.expected_total
+        )
+
+
+@dataclass(slots=True)
+class _Queued:
+    order: "Order"
+    amount: Money
+    auth: PaymentAuthResult
+
+
+class SettlementEngine:
+    """Queue authorized payments and capture them in bulk at end of day.
+
+    Capture amount is ``order.final_total()``; orders whose total exceeds the authorized
+    amount fail locally with PaymentAmountMismatch and never reach the provider.
+    A batch-level provider failure, or a batch answered with the wrong number of
+    results, marks every order of that batch as failed with the same error; other
+    batches are unaffected. An order can be queued once per settle().
+    """
+
+    def __init__(
+        self, provider: BatchCaptureProvider, batch_size: int = 500, concurrency: int = 4
+    ) -> None:
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be > 0, got {batch_size}")
+        if concurrency <= 0:
+            raise ValueError(f"concurrency must be > 0, got {concurrency}")
+        self.provider = provider
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self._queue: list[_Queued] = []
+        self._rejected: dict[str, PaymentError] = {}
+        self._expected: Money = Decimal("0")
+        self._order_ids: set[str] = set()
+
+    def enqueue(self, order: "Order", auth: PaymentAuthResult) -> None:
+        """Queue an authorized order for capture.
+
+        Raise PaymentAlreadyQueued if the order is already waiting for settle().
+        """
+
+        order_id = str(order.id)
+        if order_id in self._order_ids:
+            raise PaymentAlreadyQueued(order_id)
+        amount = order.final_total()
+        self._order_ids.add(order_id)
+        self._expected += amount
+        if amount > auth.amount:
+            reason = f"final total exceeds authorized {auth.amount}"
+            self._rejected[order_id] = PaymentAmountMismatch(str(amount), reason)
+            return
+        self._queue.append(_Queued(order, amount, auth))
+
+    def pending(self) -> int:
+        """Number of orders waiting for the next settle()."""
+
+        return len(self._queue)
+
+    async def settle(self) -> SettlementReport:
+        """Capture everything queued so far and reset the queue."""
+
+        queue, self._queue = self._queue, []
+        failed, self._rejected = self._rejected, {}
+        expected, self._expected = self._expected, Decimal("0")
+        self._order_ids = set()
+        size = self.batch_size
+        batches = [queue[i : i + size] for i in range(0, len(queue), size)]
+
+        gate = asyncio.Semaphore(self.concurrency)
+
+        async def run(batch: list[_Queued]) -> Sequence[PaymentCaptureResult | PaymentError]:
+            async with gate:
+                try:
+                    results = await self.provider.capture_batch(
+                        [(item.order, item.amount) for item in batch]
+                    )
+                except PaymentError as exc:
+                    return [exc] * len(batch)
+                if len(results) != len(batch):
+                    reason = f"{len(results)} capture results for {len(batch)} orders"
+                    return [PaymentProviderError("batch", reason)] * len(batch)
+                return results
+
+        outcomes = await asyncio.gather(*(run(batch) for batch in batches))
+
+        captured: dict[str, PaymentCaptureResult] = {}
+        discrepancies: list[str] = []
+        captured_total = Decimal("0")
+        for batch, results in zip(batches, outcomes, strict=True):
+            for item, result in zip(batch, results, strict=True):
+                order_id = str(item.order.id)
+                if isinstance(result, PaymentError):
+                    failed[order_id] = result
+                    continue
+                captured[order_id] = result
+                captured_total += result.amount
+                if result.amount != item.amount:
+                    discrepancies.append(order_id)
+
+        return SettlementReport(
+            batches=len(batches),
+            captured=captured,
+            failed=failed,
+            expected_total=quantize_money(expected),
+            captured_total=quantize_money(captured_total),
+            discrepancies=tuple(discrepancies),
+        )
@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import Mapping
 
 
 class OrderStatus(Enum):
@@ -24,3 +25,41 @@ class OrderStatus(Enum):
     """Order delivered."""
     CANCELED = "canceled"
     """Order canceled."""
+
+
+class TransitionOutcome(Enum):
+    """Result of checking one status transition."""
+
+    APPLIED = "applied"
+    """Transition is allowed."""
+    INVALID = "invalid"
+    """Not allowed from the current status (InvalidTransition)."""
+    FINALIZED = "finalized"
+    """Order is DELIVERED or CANCELED (AlreadyFinalized)."""
+
+
+TRANSITIONS: Mapping[OrderStatus, frozenset[OrderStatus]] = {
+    OrderStatus.NEW: frozenset({OrderStatus.ACCEPTED, OrderStatus.CANCELED}),
+    OrderStatus.ACCEPTED: frozenset({OrderStatus.BAKING, OrderStatus.CANCELED}),
+    OrderStatus.BAKING: frozenset({OrderStatus.BOXED}),
+    OrderStatus.BOXED: frozenset({OrderStatus.DISPATCHED}),
+    OrderStatus.DISPATCHED: frozenset({OrderStatus.DELIVERED}),
+    OrderStatus.DELIVERED: frozenset(),
+    OrderStatus.CANCELED: frozenset(),
+}
+"""Allowed targets per status, as described in the OrderStatus docstring."""
+
+FINAL_STATUSES = frozenset({OrderStatus.DELIVERED, OrderStatus.CANCELED})
+
+OUTCOMES: Mapping[OrderStatus, Mapping[OrderStatus, TransitionOutcome]] = {
+    current: {
+        target: TransitionOutcome.FINALIZED
+        if current in FINAL_STATUSES
+        else TransitionOutcome.APPLIED
+        if target in TRANSITIONS[current]
+        else TransitionOutcome.INVALID
+        for target in OrderStatus
+    }
+    for current in OrderStatus
+}
+"""Precomputed OUTCOMES[current][target] for every pair of statuses."""
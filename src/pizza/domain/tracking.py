@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import AsyncIterable, Callable
+
+from .delivery import Coordinates, Dispatcher
+
+
+@dataclass(frozen=True, slots=True)
+class IngestStats:
+    """Counters of the location ingestion pipeline.
+
+    Fields:
+      received: Pings accepted by submit().
+      applied: Positions written to the dispatcher.
+      coalesced: Pings superseded by a newer ping for the same courier before a tick.
+      dropped: Pings rejected because the pending buffer was full.
+      unknown: Positions for couriers the dispatcher does not know.
+      batches: Non-empty ticks flushed to the dispatcher.
+      mean_lag: Average seconds from ping to flush, over every flushed position
+        (applied and unknown alike).
+      max_lag: Worst seconds from ping to flush.
+    """
+
+    received: int
+    applied: int
+    coalesced: int
+    dropped: int
+    unknown: int
+    batches: int
+    mean_lag: float
+    max_lag: float
+
+
+class LocationIngestor:
+    """Asyncio pipeline for courier GPS pings with per-tick coalescing.
+
+    Pings are buffered as courier_id -> latest position; every ``tick`` seconds the
+    buffer is applied to the dispatcher as one batch. At most ``max_pending`` distinct
+    couriers are buffered between ticks, pings for new couriers beyond that are dropped.
+    """
+
+    def __init__(
+        self,
+        dispatcher: Dispatcher,
+        tick: float = 0.1,
+        max_pending: int = 100_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if tick <= 0:
+            raise ValueError(f"tick must be > 0, got {tick}")
+        if max_pending <= 0:
+            raise ValueError(f"max_pending must be > 0, got {max_pending}")
+        self.dispatcher = dispatcher
+        self.tick = tick
+        self.max_pending = max_pending
+        self._clock = clock
+        self._pending: dict[str, tuple[Coordinates, float]] = {}
+        self._running = False
+
+        self._received = 0
+        self._applied = 0
+        self._coalesced = 0
+        self._dropped = 0
+        self._unknown = 0
+        self._batches = 0
+        self._lag_total = 0.0
+        self._lag_max = 0.0
+
+    def submit(self, courier_id: str, location: Coordinates, sent_at: float | None = None) -> bool:
+        """Buffer one ping; return False if it was dropped.
+
+        ``sent_at`` is the ping timestamp on the ingestor clock (defaults to now).
+        """
+
+        pending = self._pending
+        if courier_id in pending:
+            self._coalesced += 1
+        elif len(pending) >= self.max_pending:
+            self._dropped += 1
+            return False
+        pending[courier_id] = (location, self._clock() if sent_at is None else sent_at)
+        self._received += 1
+        return True
+
+    async def consume(self, updates: AsyncIterable[tuple[str, Coordinates]]) -> None:
+        """Feed a stream of (courier_id, location) pings into the buffer."""
+
+        async for courier_id, location in updates:
+            self.submit(courier_id, location)
+
+    def flush(self) -> int:
+        """Apply buffered positions to the dispatcher now; return how many were applied."""
+
+        if not self._pending:
+            return 0
+        batch, self._pending = self._pending, {}
+        applied = self.dispatcher.update_courier_locations(
+            {courier_id: location for courier_id, (location, _) in batch.items()}
+        )
+
+        now = self._clock()
+        for _, sent_at in batch.values():
+            lag = now - sent_at
+            self._lag_total += lag
+            if lag > self._lag_max:
+                self._lag_max = lag
+        self._applied += applied
+        self._unknown += len(batch) - applied
+        self._batches += 1
+        return applied
+
+    async def run(self) -> None:
+        """Flush every tick until stop() is called; flushes once more on exit."""
+
+        self._running = True
+        try:
+            while self._running:
+                await asyncio.sleep(self.tick)
+                self.flush()
+        finally:
+            self.flush()
+
+    def stop(self) -> None:
+        """Ask run() to finish after the current tick."""
+
+        self._running = False
+
+    def stats(self) -> IngestStats:
+        """Return a snapshot of pipeline counters."""
+
+        flushed = self._applied + self._unknown
+        return IngestStats(
+            received=self._received,
+            applied=self._applied,
+            coalesced=self._coalesced,
+            dropped=self._dropped,
+            unknown=self._unknown,
+            batches=self._batches,
+            mean_lag=self._lag_total / flushed if flushed else 0.0,
+            max_lag=self._lag_max,
+        )
@@ -0,0 +1,144 @@
+"""Versioned compact binary encoding of Order that references products by SKU id."""
+
+from __future__ import annotations
+
+import struct
+import uuid
+import zlib
+
+from ..domain.delivery import Coordinates
+from ..domain.errors import InvalidQuantity, OrderDecodeError
+from ..domain.menu import Menu
+from ..domain.order import Order, OrderItem
+from ..domain.products import PizzaSize
+from ..domain.status import OrderStatus
+from ..domain.types import OrderId
+
+FORMAT_VERSION = 1
+
+HEADER = struct.Struct("<BI16sBddHH")
+"""format version, menu version, order id (nil UUID = no id), status code, x, y,
+item count, customer length in bytes; followed by the UTF-8 customer and the items."""
+
+ITEM = struct.Struct("<HBIB")
+"""pizza id, size code, qty, topping count; followed by one u16 id per topping."""
+
+_STATUSES = tuple(OrderStatus)
+_STATUS_CODE = {status: code for code, status in enumerate(_STATUSES)}
+_SIZES = tuple(PizzaSize)
+_SIZE_CODE = {size: code for code, size in enumerate(_SIZES)}
+_NIL = bytes(16)
+
+
+class OrderCodec:
+    """Encode/decode Orders against one menu version.
+
+    Pizzas and toppings are written as u16 ids: their positions in
+    ``menu.list_pizzas()``/``list_toppings()``. By default the menu version is
+    menu_fingerprint(menu), so reordering, adding or removing products changes
+    it; an explicit ``menu_version`` must be bumped by hand on such changes.
+    Decoding data written for another version raises OrderDecodeError, as does
+    any corrupt or truncated data. Pricing strategies are not encoded.
+
+    decode() accepts any buffer (bytes, bytearray, memoryview, mmap) and reads it
+    in place with struct.unpack_from; only the customer string is materialized.
+    """
+
+    def __init__(self, menu: Menu, menu_version: int | None = None) -> None:
+        self.menu = menu
+        self.menu_version = menu_fingerprint(menu) if menu_version is None else menu_version
+        self._pizzas = tuple(menu.list_pizzas())
+        self._toppings = tuple(menu.list_toppings())
+        self._pizza_id = {pizza.sku: index for index, pizza in enumerate(self._pizzas)}
+        self._topping_id = {topping.sku: index for index, topping in enumerate(self._toppings)}
+
+    def encode(self, order: Order) -> bytes:
+        items = order.items_view()
+        customer = order.customer.encode()
+        address = order.delivery_address
+        parts = [
+            HEADER.pack(
+                FORMAT_VERSION,
+                self.menu_version,
+                _NIL if order.id is None else order.id.value.bytes,
+                _STATUS_CODE[order.status],
+                address.x,
+                address.y,
+                len(items),
+                len(customer),
+            ),
+            customer,
+        ]
+        topping_id = self._topping_id
+        for item in items:
+            toppings = [topping_id[topping.sku] for topping in item.toppings]
+            parts.append(
+                ITEM.pack(
+                    self._pizza_id[item.pizza.sku], _SIZE_CODE[item.size], item.qty, len(toppings)
+                )
+            )
+            if toppings:
+                parts.append(struct.pack(f"<{len(toppings)}H", *toppings))
+        return b"".join(parts)
+
+    def decode(self, data: bytes | bytearray | memoryview, offset: int = 0) -> Order:
+        """Decode one order starting at ``offset`` of ``data``."""
+
+        try:
+            version, menu_version, key, status, x, y, count, customer_len = HEADER.unpack_from(
+                data, offset
+            )
+        except struct.error as exc:
+            raise OrderDecodeError(f"truncated header: {exc}") from None
+        if version != FORMAT_VERSION:
+            raise OrderDecodeError(f"unsupported format version {version}")
+        if menu_version != self.menu_version:
+            raise OrderDecodeError(
+                f"encoded for menu version {menu_version}, codec has {self.menu_version}"
+            )
+
+        position = offset + HEADER.size
+        pizzas = self._pizzas
+        toppings = self._toppings
+        items = []
+        try:
+            raw = memoryview(data)[position : position + customer_len]
+            if len(raw) != customer_len:
+                raise OrderDecodeError(f"truncated customer: {len(raw)} of {customer_len} bytes")
+            customer = str(raw, "utf-8")
+            position += customer_len
+            order_status = _STATUSES[status]
+            for _ in range(count):
+                pizza, size, qty, topping_count = ITEM.unpack_from(data, position)
+                position += ITEM.size
+                topping_ids = struct.unpack_from(f"<{topping_count}H", data, position)
+                position += 2 * topping_count
+                items.append(
+                    OrderItem(
+                        pizzas[pizza],
+                        qty,
+                        _SIZES[size],
+                        tuple(toppings[topping] for topping in topping_ids),
+                    )
+                )
+        except (struct.error, IndexError, ValueError, InvalidQuantity) as exc:
+            raise OrderDecodeError(f"corrupt order data: {exc}") from None
+
+        return Order(
+            self.menu,
+            None if key == _NIL else OrderId(uuid.UUID(bytes=key)),
+            customer,
+            Coordinates(x, y),
+            items,
+            order_status,
+            None,
+        )
+
+
+def menu_fingerprint(menu: Menu) -> int:
+    """CRC-32 of the menu's SKUs in id order: changes whenever the product ids would."""
+
+    skus = [pizza.sku for pizza in menu.list_pizzas()]
+    skus.append("")
+    skus += [topping.sku for topping in menu.list_toppings()]
+    return zlib.crc32("\n".join(skus).encode())
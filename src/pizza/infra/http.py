@@ -0,0 +1,34 @@
+"""Minimal HTTP/1.1 framing over asyncio streams (keep-alive, JSON bodies only)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any
+
+
+async def read_message(reader: asyncio.StreamReader) -> tuple[str, dict[str, str], Any] | None:
+    """Read one request/response; return (start line, headers, JSON body) or None on EOF."""
+
+    start = await reader.readline()
+    if not start:
+        return None
+    headers: dict[str, str] = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    length = int(headers.get("content-length", "0"))
+    body = json.loads(await reader.readexactly(length)) if length else None
+    return start.decode("latin-1").strip(), headers, body
+
+
+def encode_message(start: str, body: Any, headers: dict[str, str] | None = None) -> bytes:
+    """Serialize a start line, optional extra headers and a JSON body."""
+
+    payload = json.dumps(body, separators=(",", ":")).encode()
+    lines = [start, "Content-Type: application/json", f"Content-Length: {len(payload)}"]
+    lines.extend(f"{name}: {value}" for name, value in (headers or {}).items())
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + payload
@@ -0,0 +1,240 @@
+"""Append-only binary payment ledger with memory-mapped reads."""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Literal, Sequence
+
+from ..domain.payment import Money, PaymentAuthResult, PaymentCaptureResult, PaymentRefundResult
+from ..domain.repository import PaymentRecord
+from ..domain.types import quantize_money
+
+EventKind = Literal["authorize", "capture", "refund"]
+Method = Literal["cash", "card", "online"]
+
+RECORD = struct.Struct("<16sBBqq32s16s")
+"""order id (16 raw bytes), kind, method, amount in cents, unix time in µs, payment id,
+request id (16 raw bytes)."""
+
+_KINDS: tuple[EventKind, ...] = ("authorize", "capture", "refund")
+_METHODS: tuple[Method, ...] = ("cash", "card", "online")
+_KIND_CODE = {kind: code for code, kind in enumerate(_KINDS)}
+_METHOD_CODE = {method: code for code, method in enumerate(_METHODS)}
+
+
+@dataclass(frozen=True, slots=True)
+class LedgerEntry:
+    """One decoded ledger record."""
+
+    order_id: str
+    kind: EventKind
+    method: Method
+    amount_cents: int
+    at_us: int
+    payment_id: str
+    request_id: str
+
+    @property
+    def amount(self) -> Money:
+        return Decimal(self.amount_cents).scaleb(-2)
+
+
+def to_cents(amount: Money) -> int:
+    return int(quantize_money(amount).scaleb(2))
+
+
+class PaymentLedger:
+    """Fixed-width append-only log of authorize/capture/refund events.
+
+    Storage:
+      - file: RECORD.size bytes per event, appended in arrival order.
+      - _index: 16-byte order id -> record numbers of its events.
+
+    Reads go through a read-only mmap of the file, remapped when it has grown.
+    Every event carries the id of the request that produced it: a fresh one per
+    append unless the caller passes the id of the call it is recording again.
+    PaymentRecords are not stored; payment_record() rebuilds one from the events,
+    counting each request id once, so replayed calls do not add up while two
+    separate refunds of the same amount both do.
+    A torn final record (crash mid-append) is truncated on open.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = os.fspath(path)
+        self._file = open(self.path, "a+b")
+        size = os.fstat(self._file.fileno()).st_size
+        torn = size % RECORD.size
+        if torn:
+            self._file.truncate(size - torn)
+        self._count = (size - torn) // RECORD.size
+        self._map: mmap.mmap | None = None
+        self._mapped = 0
+        self._index: dict[bytes, list[int]] = {}
+        self._rebuild_index()
+
+    def __enter__(self) -> "PaymentLedger":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def append(
+        self,
+        order_id: str,
+        kind: EventKind,
+        amount: Money,
+        method: Method,
+        payment_id: str = "",
+        at_us: int | None = None,
+        request_id: str | None = None,
+    ) -> None:
+        """Append one event; it is readable immediately.
+
+        ``request_id`` (a UUID string) names the operation; events appended again
+        with the same id are replays. None gives the event an id of its own.
+        """
+
+        key = uuid.UUID(order_id).bytes
+        request = uuid.uuid4().bytes if request_id is None else uuid.UUID(request_id).bytes
+        encoded_id = payment_id.encode()
+        if len(encoded_id) > 32:
+            raise ValueError(f"payment_id longer than 32 bytes: {payment_id!r}")
+        self._file.write(
+            RECORD.pack(
+                key,
+                _KIND_CODE[kind],
+                _METHOD_CODE[method],
+                to_cents(amount),
+                time.time_ns() // 1000 if at_us is None else at_us,
+                encoded_id,
+                request,
+            )
+        )
+        self._index.setdefault(key, []).append(self._count)
+        self._count += 1
+
+    def record_authorize(
+        self, order_id: str, result: PaymentAuthResult, request_id: str | None = None
+    ) -> None:
+        self.append(
+            order_id, "authorize", result.amount, result.method, result.payment_id, None, request_id
+        )
+
+    def record_capture(
+        self, order_id: str, result: PaymentCaptureResult, request_id: str | None = None
+    ) -> None:
+        self.append(
+            order_id, "capture", result.amount, result.method, result.payment_id, None, request_id
+        )
+
+    def record_refund(
+        self, order_id: str, result: PaymentRefundResult, request_id: str | None = None
+    ) -> None:
+        self.append(
+            order_id, "refund", result.amount, result.method, result.payment_id, None, request_id
+        )
+
+    def flush(self) -> None:
+        """Flush buffered appends to the OS and fsync them."""
+
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def events(self, order_id: str) -> Sequence[LedgerEntry]:
+        """Events of one order in append order (empty if unknown)."""
+
+        numbers = self._index.get(uuid.UUID(order_id).bytes)
+        if not numbers:
+            return ()
+        view = self._view()
+        return tuple(self._decode(view, number) for number in numbers)
+
+    def payment_record(self, order_id: str) -> PaymentRecord | None:
+        """Rebuild the PaymentRecord of an order from its events, or None if it has none."""
+
+        events = self.events(order_id)
+        if not events:
+            return None
+        totals = {"authorize": 0, "capture": 0, "refund": 0}
+        seen = set()
+        history = []
+        for event in events:
+            at = datetime.fromtimestamp(event.at_us / 1e6, timezone.utc).isoformat()
+            if event.request_id in seen:
+                history.append(f"{at} {event.kind} {event.amount} replay")
+                continue
+            seen.add(event.request_id)
+            totals[event.kind] += event.amount_cents
+            history.append(f"{at} {event.kind} {event.amount}")
+
+        if totals["refund"] and totals["refund"] < totals["capture"]:
+            status = "partial-refund"
+        elif totals["refund"]:
+            status = "refunded"
+        elif totals["capture"]:
+            status = "captured"
+        elif totals["authorize"]:
+            status = "authorized"
+        else:
+            status = "new"
+        last = events[-1]
+        return PaymentRecord(
+            payment_id=last.payment_id,
+            method=last.method,
+            authorized_amount=str(Decimal(totals["authorize"]).scaleb(-2)),
+            captured_amount=str(Decimal(totals["capture"]).scaleb(-2)),
+            refunded_amount=str(Decimal(totals["refund"]).scaleb(-2)),
+            status=status,
+            history=tuple(history),
+        )
+
+    def _view(self) -> mmap.mmap:
+        needed = self._count * RECORD.size
+        if self._mapped < needed:
+            self._file.flush()
+            if self._map is not None:
+                self._map.close()
+            self._map = mmap.mmap(self._file.fileno(), needed, access=mmap.ACCESS_READ)
+            self._mapped = needed
+        assert self._map is not None
+        return self._map
+
+    def _decode(self, view: mmap.mmap, number: int) -> LedgerEntry:
+        key, kind, method, cents, at_us, payment_id, request = RECORD.unpack_from(
+            view, number * RECORD.size
+        )
+        return LedgerEntry(
+            order_id=str(uuid.UUID(bytes=key)),
+            kind=_KINDS[kind],
+            method=_METHODS[method],
+            amount_cents=cents,
+            at_us=at_us,
+            payment_id=payment_id.rstrip(b"\0").decode(),
+            request_id=str(uuid.UUID(bytes=request)),
+        )
+
+    def _rebuild_index(self) -> None:
+        if not self._count:
+            return
+        view = self._view()
+        index = self._index
+        size = RECORD.size
+        for number in range(self._count):
+            key = view[number * size : number * size + 16]
+            index.setdefault(key, []).append(number)
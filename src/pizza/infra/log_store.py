@@ -0,0 +1,372 @@
+"""Append-only log-structured order repository with mmap reads and compaction."""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import threading
+import uuid
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Sequence
+
+from ..domain.errors import OrderNotFound
+from ..domain.menu import Menu
+from ..domain.order import Order
+from ..domain.repository import Page, PaymentRecord, StatusPositions, iter_pages
+from ..domain.status import OrderStatus
+from ..domain.types import OrderId
+from .codec import OrderCodec
+
+HEADER = struct.Struct("<IIBB16s")
+"""crc32 of everything after it, payload length, record kind, order status code, order id."""
+
+ORDER, LINK, PAYMENT = 0, 1, 2
+
+_STATUSES = tuple(OrderStatus)
+_STATUS_CODE = {status: code for code, status in enumerate(_STATUSES)}
+
+
+@dataclass(frozen=True, slots=True)
+class LogStats:
+    """Size of a log store.
+
+    Fields:
+      records: Live records (latest version per order and kind).
+      file_bytes: Current log size.
+      garbage_bytes: Bytes held by superseded records, reclaimable by compact().
+    """
+
+    records: int
+    file_bytes: int
+    garbage_bytes: int
+
+
+class LogStructuredOrderRepository:
+    """OrderRepository backed by one append-only file.
+
+    Storage:
+      - file: HEADER + payload per save/link_courier/record_payment, in write order.
+      - _offsets: (kind, 16-byte order id) -> (offset, size) of the latest record.
+      - _by_status: status -> {order id bytes: None}, from the header status byte.
+      - _sequence: order ids in first-save order (page cursors are positions in it);
+        compaction writes live records in this order so it survives reopening.
+      - _position: order id bytes -> index in _sequence; _status_positions:
+        StatusPositions, so page_by_status() does not scan.
+
+    get() decodes the latest record straight from a read-only mmap of the file.
+    Superseded records stay on disk until compact(), which rewrites live records
+    into a new file (optionally on a background thread while writes continue)
+    and atomically replaces the log; only the copy of records appended meanwhile and
+    the file swap hold the lock. On open the index is rebuilt by scanning;
+    a torn or corrupt tail (crash mid-append) is truncated.
+    Orders are stored with OrderCodec, so ``menu``/``menu_version`` must match the
+    ones they were written with (by default the version is the menu's
+    fingerprint, so a reordered menu fails loudly instead of misreading orders).
+    """
+
+    def __init__(self, path: str | Path, menu: Menu, menu_version: int | None = None) -> None:
+        self.path = Path(path)
+        self.menu = menu
+        self._codec = OrderCodec(menu, menu_version)
+        self._lock = threading.RLock()
+        self._compacting = False
+        self._map: mmap.mmap | None = None
+        self._mapped = 0
+        self._open()
+
+    def __enter__(self) -> "LogStructuredOrderRepository":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._unmap()
+            self._file.close()
+
+    def save(self, order: Order) -> str:
+        """Append the order as its new latest version; returns the order ID."""
+
+        if order.id is None:
+            order.id = OrderId.generate()
+        key = order.id.value.bytes
+        with self._lock:
+            self._index(key, order.status)
+            self._append(ORDER, key, self._encode(order), _STATUS_CODE[order.status])
+        return str(order.id)
+
+    def get(self, order_id: str) -> Order:
+        """Return the latest saved version of the order or raise OrderNotFound."""
+
+        key = _key(order_id)
+        with self._lock:
+            entry = self._offsets.get((ORDER, key))
+            if entry is None:
+                raise OrderNotFound(order_id)
+            return self._decode(key, self._payload(entry[0]))
+
+    def find_by_status(self, status: OrderStatus) -> Sequence[Order]:
+        """List orders whose latest version has the given status."""
+
+        with self._lock:
+            return tuple(
+                self._decode(key, self._payload(self._offsets[(ORDER, key)][0]))
+                for key in self._by_status[status]
+            )
+
+    def list_all(self) -> Sequence[Order]:
+        """List the latest version of every order."""
+
+        with self._lock:
+            return tuple(
+                self._decode(key, self._payload(offset))
+                for (kind, key), (offset, _) in self._offsets.items()
+                if kind == ORDER
+            )
+
+    def page_all(self, cursor: str | None = None, limit: int = 1000) -> Page:
+        """Next ``limit`` orders in first-save order."""
+
+        with self._lock:
+            start = int(cursor or 0)
+            stop = start + limit
+            page = tuple(self._load(key) for key in self._sequence[start:stop])
+            return Page(page, str(stop) if stop < len(self._sequence) else None)
+
+    def page_by_status(
+        self, status: OrderStatus, cursor: str | None = None, limit: int = 1000
+    ) -> Page:
+        """Next ``limit`` orders with the status, in first-save order."""
+
+        with self._lock:
+            positions, next_cursor = self._status_positions.page(status, cursor, limit)
+            sequence = self._sequence
+            page = tuple(self._load(sequence[position]) for position in positions)
+            return Page(page, next_cursor)
+
+    def iter_all(self, cursor: str | None = None, page_size: int = 1000) -> Iterator[Order]:
+        return iter_pages(lambda after: self.page_all(after, page_size), cursor)
+
+    def iter_by_status(
+        self, status: OrderStatus, cursor: str | None = None, page_size: int = 1000
+    ) -> Iterator[Order]:
+        return iter_pages(lambda after: self.page_by_status(status, after, page_size), cursor)
+
+    def link_courier(self, order_id: str, courier_id: str) -> None:
+        """Link courier to order (overwrites previous link)."""
+
+        key = _key(order_id)
+        with self._lock:
+            if (ORDER, key) not in self._offsets:
+                raise OrderNotFound(order_id)
+            self._append(LINK, key, courier_id.encode())
+
+    def courier_of(self, order_id: str) -> str | None:
+        """Courier linked to the order, or None."""
+
+        with self._lock:
+            entry = self._offsets.get((LINK, _key(order_id)))
+            return None if entry is None else bytes(self._payload(entry[0])).decode()
+
+    def record_payment(self, order_id: str, record: PaymentRecord) -> None:
+        """Store the current PaymentRecord of an order (replaces the previous one)."""
+
+        key = _key(order_id)
+        fields = [
+            record.payment_id,
+            record.method,
+            record.authorized_amount,
+            record.captured_amount,
+            record.refunded_amount,
+            record.status,
+            list(record.history),
+        ]
+        with self._lock:
+            if (ORDER, key) not in self._offsets:
+                raise OrderNotFound(order_id)
+            self._append(PAYMENT, key, json.dumps(fields, separators=(",", ":")).encode())
+
+    def payment_record(self, order_id: str) -> PaymentRecord | None:
+        """Get PaymentRecord for order, or None if not set."""
+
+        with self._lock:
+            entry = self._offsets.get((PAYMENT, _key(order_id)))
+            if entry is None:
+                return None
+            *fields, history = json.loads(bytes(self._payload(entry[0])))
+        return PaymentRecord(*fields, history=tuple(history))
+
+    def flush(self) -> None:
+        """Flush buffered appends to the OS and fsync them."""
+
+        with self._lock:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def stats(self) -> LogStats:
+        with self._lock:
+            return LogStats(len(self._offsets), self._size, self._garbage)
+
+    def compact(self, background: bool = False) -> threading.Thread | None:
+        """Rewrite the log keeping only live records.
+
+        With ``background`` the copy runs on a daemon thread (returned) and only the
+        final tail copy and file swap block other calls. A no-op if a compaction
+        is already running.
+        """
+
+        with self._lock:
+            if self._compacting:
+                return None
+            self._compacting = True
+            self._file.flush()
+            offsets = self._offsets
+            live = [
+                offsets[(kind, key)]
+                for key in self._sequence
+                for kind in (ORDER, LINK, PAYMENT)
+                if (kind, key) in offsets
+            ]
+            snapshot = (self._size, live, self._garbage)
+        if not background:
+            self._compact(*snapshot)
+            return None
+        thread = threading.Thread(
+            target=self._compact, args=snapshot, name="log-compaction", daemon=True
+        )
+        thread.start()
+        return thread
+
+    def _open(self) -> None:
+        self._file = open(self.path, "a+b")
+        self._size = os.fstat(self._file.fileno()).st_size
+        self._offsets: dict[tuple[int, bytes], tuple[int, int]] = {}
+        self._status_of: dict[bytes, OrderStatus] = {}
+        self._sequence: list[bytes] = []
+        self._position: dict[bytes, int] = {}
+        self._status_positions = StatusPositions()
+        self._by_status: dict[OrderStatus, dict[bytes, None]] = {s: {} for s in OrderStatus}
+        self._garbage = 0
+        valid = self._replay(self._view(), 0, self._size) if self._size else 0
+        if valid < self._size:
+            self._unmap()
+            self._file.truncate(valid)
+            self._size = valid
+
+    def _replay(self, view: mmap.mmap, start: int, end: int) -> int:
+        """Index records in view[start:end]; return the end of the last valid record."""
+
+        offsets = self._offsets
+        position = start
+        while position + HEADER.size <= end:
+            crc, length, kind, status, key = HEADER.unpack_from(view, position)
+            stop = position + HEADER.size + length
+            if stop > end or zlib.crc32(view[position + 4 : stop]) != crc:
+                break
+            previous = offsets.get((kind, key))
+            if previous is not None:
+                self._garbage += previous[1]
+            offsets[(kind, key)] = (position, stop - position)
+            if kind == ORDER:
+                self._index(key, _STATUSES[status])
+            position = stop
+        return position
+
+    def _index(self, key: bytes, status: OrderStatus) -> None:
+        previous = self._status_of.get(key)
+        if previous is not None:
+            del self._by_status[previous][key]
+        else:
+            self._position[key] = len(self._sequence)
+            self._sequence.append(key)
+        self._status_of[key] = status
+        self._by_status[status][key] = None
+        if previous is not status:
+            self._status_positions.move(self._position[key], previous, status)
+
+    def _append(self, kind: int, key: bytes, payload: bytes, status: int = 0) -> None:
+        body = HEADER.pack(0, len(payload), kind, status, key)[4:] + payload
+        self._file.write(struct.pack("<I", zlib.crc32(body)) + body)
+        size = 4 + len(body)
+        previous = self._offsets.get((kind, key))
+        if previous is not None:
+            self._garbage += previous[1]
+        self._offsets[(kind, key)] = (self._size, size)
+        self._size += size
+
+    def _payload(self, offset: int) -> memoryview:
+        view = self._view()
+        length = HEADER.unpack_from(view, offset)[1]
+        start = offset + HEADER.size
+        return memoryview(view)[start : start + length]
+
+    def _view(self) -> mmap.mmap:
+        if self._mapped < self._size:
+            self._file.flush()
+            self._unmap()
+            self._map = mmap.mmap(self._file.fileno(), self._size, access=mmap.ACCESS_READ)
+            self._mapped = self._size
+        assert self._map is not None
+        return self._map
+
+    def _unmap(self) -> None:
+        if self._map is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                pass  # a caller still holds a payload view; the map is released with it
+            self._map = None
+            self._mapped = 0
+
+    def _compact(self, end: int, live: list[tuple[int, int]], garbage: int) -> None:
+        target = self.path.with_name(self.path.name + ".compact")
+        moved: dict[int, int] = {}
+        try:
+            with open(self.path, "rb") as source, open(target, "wb") as out:
+                if end:
+                    with mmap.mmap(source.fileno(), end, access=mmap.ACCESS_READ) as view:
+                        for offset, size in live:
+                            moved[offset] = out.tell()
+                            out.write(view[offset : offset + size])
+                copied = out.tell()
+                with self._lock:
+                    # Records appended since the snapshot are copied verbatim after the live set.
+                    self._file.flush()
+                    source.seek(end)
+                    out.write(source.read(self._size - end))
+                    out.flush()
+                    os.fsync(out.fileno())
+                    self._unmap()
+                    self._file.close()
+                    os.replace(target, self.path)
+                    self._file = open(self.path, "a+b")
+                    shift = copied - end
+                    self._offsets = {
+                        ref: (moved[offset] if offset < end else offset + shift, size)
+                        for ref, (offset, size) in self._offsets.items()
+                    }
+                    self._size += shift
+                    self._garbage -= garbage
+        finally:
+            self._compacting = False
+
+    def _encode(self, order: Order) -> bytes:
+        return self._codec.encode(order)
+
+    def _decode(self, key: bytes, payload: memoryview) -> Order:
+        return self._codec.decode(payload)
+
+    def _load(self, key: bytes) -> Order:
+        return self._decode(key, self._payload(self._offsets[(ORDER, key)][0]))
+
+
+def _key(order_id: str) -> bytes:
+    try:
+        return uuid.UUID(order_id).bytes
+    except ValueError:
+        raise OrderNotFound(order_id) from None
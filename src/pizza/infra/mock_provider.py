@@ -0,0 +1,162 @@
+"""Local mock payment provider speaking JSON over HTTP/1.1 (tests and benchmarks)."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, Callable
+
+from .http import encode_message, read_message
+
+Latency = float | Callable[[str], float]
+"""Fixed delay in seconds or a function of the operation name ("authorize", ...)."""
+
+
+@dataclass(slots=True)
+class _Account:
+    payment_id: str
+    authorized: Decimal
+    captured: Decimal = Decimal("0")
+    refunded: Decimal = Decimal("0")
+
+
+class MockPaymentProvider:
+    """In-process provider: POST /authorize, /capture, /refund keyed by order_id.
+
+    POST /capture-batch takes {"items": [{"order_id", "amount"}, ...]} and answers
+    {"results": [...]} with one capture reply (plus "order_id" and "code") per item.
+    ``in_flight`` counts requests being served right now, ``max_in_flight`` the most
+    served at once.
+
+    Usage:
+        async with MockPaymentProvider() as provider:
+            client = AsyncPaymentClient(provider.host, provider.port)
+    """
+
+    def __init__(self, name: str = "mock-card", latency: Latency = 0.0) -> None:
+        self.name = name
+        self.latency = latency
+        self.host = "127.0.0.1"
+        self.port = 0
+        self.calls: Counter[str] = Counter()
+        self.connections = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._accounts: dict[str, _Account] = {}
+        self._ids = itertools.count(1)
+        self._server: asyncio.Server | None = None
+        self._handlers: set[asyncio.Task] = set()
+
+    async def start(self) -> "MockPaymentProvider":
+        self._server = await asyncio.start_server(self._serve, self.host, 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            for handler in self._handlers:
+                handler.cancel()
+            await asyncio.gather(*self._handlers, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "MockPaymentProvider":
+        return await self.start()
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.close()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        handler = asyncio.current_task()
+        if handler is not None:
+            self._handlers.add(handler)
+        try:
+            while (message := await read_message(reader)) is not None:
+                start, _, body = message
+                operation = start.split()[1].lstrip("/")
+                delay = self.latency(operation) if callable(self.latency) else self.latency
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+                try:
+                    if delay:
+                        await asyncio.sleep(delay)
+                    code, reply = self.handle(operation, body or {})
+                finally:
+                    self.in_flight -= 1
+                writer.write(
+                    encode_message(f"HTTP/1.1 {code} {'OK' if code == 200 else 'ERR'}", reply)
+                )
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            pass
+        finally:
+            self._handlers.discard(handler)  # type: ignore[arg-type]
+            writer.close()
+
+    def handle(self, operation: str, body: dict[str, Any]) -> tuple[int, dict[str, Any]]:
+        """Apply one operation to provider state; return (HTTP status, JSON reply)."""
+
+        self.calls[operation] += 1
+        handler = getattr(self, f"_op_{operation.replace('-', '_')}", None)
+        if handler is None:
+            return 404, {"error": "unknown-operation", "reason": operation}
+        return handler(body)
+
+    def _reply(self, account: _Account, status: str, amount: Decimal) -> tuple[int, dict]:
+        created_at = datetime.now(timezone.utc).isoformat()
+        return 200, {
+            "payment_id": account.payment_id,
+            "status": status,
+            "amount": str(amount),
+            "created_at": created_at,
+        }
+
+    def _op_authorize(self, body: dict[str, Any]) -> tuple[int, dict]:
+        amount = Decimal(body["amount"])
+        account = self._accounts.get(body["order_id"])
+        if account is not None:
+            return self._reply(account, "already-authorized", account.authorized)
+        if amount <= 0:
+            return 422, {"error": "amount-mismatch", "amount": str(amount), "reason": "must be > 0"}
+        account = _Account(payment_id=f"{self.name}-{next(self._ids)}", authorized=amount)
+        self._accounts[body["order_id"]] = account
+        return self._reply(account, "authorized", amount)
+
+    def _op_capture(self, body: dict[str, Any]) -> tuple[int, dict]:
+        amount = Decimal(body["amount"])
+        account = self._accounts.get(body["order_id"])
+        if account is None:
+            return 409, {"error": "not-authorized"}
+        if account.captured:
+            return self._reply(account, "already-captured", account.captured)
+        if not 0 < amount <= account.authorized:
+            reason = f"must be within (0, {account.authorized}]"
+            return 422, {"error": "amount-mismatch", "amount": str(amount), "reason": reason}
+        account.captured = amount
+        return self._reply(account, "captured", amount)
+
+    def _op_refund(self, body: dict[str, Any]) -> tuple[int, dict]:
+        amount = Decimal(body["amount"])
+        account = self._accounts.get(body["order_id"])
+        if account is None or not account.captured:
+            return 409, {"error": "not-authorized"}
+        if amount <= 0:
+            return self._reply(account, "no-op", Decimal("0"))
+        if account.refunded + amount > account.captured:
+            return 422, {"error": "refund-exceeds", "amount": str(amount)}
+        account.refunded += amount
+        status = "refunded" if account.refunded == account.captured else "partial-refund"
+        return self._reply(account, status, amount)
+
+    def _op_capture_batch(self, body: dict[str, Any]) -> tuple[int, dict]:
+        results = []
+        for item in body.get("items", ()):
+            code, reply = self._op_capture(item)
+            results.append({"order_id": item["order_id"], "code": code, **reply})
+        return 200, {"results": results}
@@ -0,0 +1,237 @@
+"""Asyncio client for HTTP payment providers with a bounded keep-alive connection pool."""
+
+from __future__ import annotations
+
+import asyncio
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, Literal, Sequence
+
+from ..domain.errors import (
+    PaymentAmountMismatch,
+    PaymentError,
+    PaymentNotAuthorized,
+    PaymentProviderError,
+    PaymentTimeout,
+    RefundExceedsCapture,
+)
+from ..domain.metrics import instrumented
+from ..domain.payment import (
+    Money,
+    PaymentAuthResult,
+    PaymentCaptureResult,
+    PaymentRefundResult,
+)
+from .http import encode_message, read_message
+
+if TYPE_CHECKING:
+    from ..domain.order import Order
+
+
+class _Connection:
+    __slots__ = ("reader", "writer")
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.reader = reader
+        self.writer = writer
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class ConnectionPool:
+    """At most ``size`` open connections; idle ones are reused (LIFO keeps them warm)."""
+
+    def __init__(self, host: str, port: int, size: int = 10) -> None:
+        if size <= 0:
+            raise ValueError(f"pool size must be > 0, got {size}")
+        self.host = host
+        self.port = port
+        self.size = size
+        self.opened = 0
+        self._slots = asyncio.Semaphore(size)
+        self._idle: list[_Connection] = []
+
+    async def acquire(self) -> _Connection:
+        await self._slots.acquire()
+        if self._idle:
+            return self._idle.pop()
+        try:
+            reader, writer = await asyncio.open_connection(self.host, self.port)
+        except BaseException:
+            self._slots.release()
+            raise
+        self.opened += 1
+        return _Connection(reader, writer)
+
+    def release(self, connection: _Connection, reusable: bool = True) -> None:
+        """Return a connection; broken or timed-out connections are closed instead."""
+
+        if reusable:
+            self._idle.append(connection)
+        else:
+            connection.close()
+        self._slots.release()
+
+    def idle(self) -> int:
+        return len(self._idle)
+
+    async def close(self) -> None:
+        while self._idle:
+            self._idle.pop().close()
+
+
+class AsyncPaymentClient:
+    """Async authorize/capture/refund against a provider reachable at host:port.
+
+    Every call is bounded by ``timeout`` seconds as a whole: waiting for a pooled
+    connection, connecting, sending and reading the reply. On timeout a borrowed
+    connection is discarded and PaymentTimeout is raised. Malformed replies (bad
+    status line, invalid JSON, missing fields) raise PaymentProviderError.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        method: Literal["card", "online"] = "card",
+        provider: str = "mock-card",
+        pool_size: int = 10,
+        timeout: float = 2.0,
+    ) -> None:
+        self.method = method
+        self.provider = provider
+        self.timeout = timeout
+        self.pool = ConnectionPool(host, port, pool_size)
+
+    async def __aenter__(self) -> "AsyncPaymentClient":
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        await self.pool.close()
+
+    @instrumented("payment.client.authorize")
+    async def authorize(self, order: "Order") -> PaymentAuthResult:
+        """Freeze order.final_total() on the provider."""
+
+        reply = await self._call("authorize", str(order.id), order.final_total())
+        return PaymentAuthResult(**self._fields(reply))
+
+    @instrumented("payment.client.capture")
+    async def capture(self, order: "Order", amount: Money) -> PaymentCaptureResult:
+        """Charge up to the authorized amount."""
+
+        reply = await self._call("capture", str(order.id), amount)
+        return PaymentCaptureResult(**self._fields(reply))
+
+    @instrumented("payment.client.refund")
+    async def refund(self, order: "Order", amount: Money) -> PaymentRefundResult:
+        """Refund within the captured amount."""
+
+        reply = await self._call("refund", str(order.id), amount)
+        return PaymentRefundResult(**self._fields(reply))
+
+    async def authorize_many(
+        self, orders: Sequence["Order"]
+    ) -> list[PaymentAuthResult | PaymentError]:
+        """Authorize orders concurrently (bounded by the pool); failures are returned in place."""
+
+        results = await asyncio.gather(
+            *(self.authorize(order) for order in orders), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, PaymentError):
+                raise result
+        return results  # type: ignore[return-value]
+
+    async def capture_batch(
+        self, items: Sequence[tuple["Order", Money]]
+    ) -> list[PaymentCaptureResult | PaymentError]:
+        """Capture many orders in one provider call; per-item failures are returned in place."""
+
+        body = {
+            "method": self.method,
+            "items": [
+                {"order_id": str(order.id), "amount": str(amount)} for order, amount in items
+            ],
+        }
+        reply = await self._send("capture-batch", body)
+        try:
+            results = reply["results"]
+            return [
+                PaymentCaptureResult(**self._fields(result))
+                if result["code"] == 200
+                else self._error(result)
+                for result in results
+            ]
+        except (KeyError, TypeError, AttributeError) as exc:
+            raise self._malformed(exc) from exc
+
+    async def _call(self, operation: str, order_id: str, amount: Money) -> dict[str, Any]:
+        body = {"order_id": order_id, "amount": str(amount), "method": self.method}
+        return await self._send(operation, body)
+
+    async def _send(self, operation: str, body: dict[str, Any]) -> dict[str, Any]:
+        request = encode_message(f"POST /{operation} HTTP/1.1", body, {"Host": self.pool.host})
+        try:
+            async with asyncio.timeout(self.timeout):
+                message = await self._exchange(request)
+        except TimeoutError:
+            raise PaymentTimeout(self.provider, self.timeout) from None
+        except (ConnectionError, asyncio.IncompleteReadError) as exc:
+            raise PaymentProviderError(self.provider, str(exc) or type(exc).__name__) from exc
+        except ValueError as exc:  # JSONDecodeError, bad Content-Length or encoding
+            raise self._malformed(exc) from exc
+
+        start, _, reply = message
+        try:
+            code = int(start.split()[1])
+        except (IndexError, ValueError) as exc:
+            raise self._malformed(exc) from exc
+        if code != 200:
+            raise self._error(reply if isinstance(reply, dict) else {})
+        if not isinstance(reply, dict):
+            raise PaymentProviderError(self.provider, f"malformed reply: {reply!r}")
+        return reply
+
+    async def _exchange(self, request: bytes) -> tuple[str, dict[str, str], Any]:
+        connection = await self.pool.acquire()
+        reusable = False
+        try:
+            connection.writer.write(request)
+            await connection.writer.drain()
+            message = await read_message(connection.reader)
+            if message is None:
+                raise PaymentProviderError(self.provider, "connection closed")
+            reusable = True
+            return message
+        finally:
+            self.pool.release(connection, reusable)
+
+    def _fields(self, reply: dict[str, Any]) -> dict[str, Any]:
+        try:
+            return {
+                "payment_id": reply["payment_id"],
+                "status": reply["status"],
+                "amount": Decimal(reply["amount"]),
+                "method": self.method,
+                "notes": (f"provider={self.provider}",),
+                "created_at": reply.get("created_at", ""),
+            }
+        except (KeyError, TypeError, AttributeError, ArithmeticError) as exc:
+            raise self._malformed(exc) from exc
+
+    def _malformed(self, exc: Exception) -> PaymentProviderError:
+        return PaymentProviderError(self.provider, f"malformed reply: {exc!r}")
+
+    def _error(self, reply: dict[str, Any]) -> PaymentError:
+        error = reply.get("error")
+        if error == "not-authorized":
+            return PaymentNotAuthorized()
+        if error == "amount-mismatch":
+            return PaymentAmountMismatch(reply.get("amount", ""), reply.get("reason", ""))
+        if error == "refund-exceeds":
+            return RefundExceedsCapture(reply.get("amount", ""))
+        return PaymentProviderError(self.provider, str(error or reply))
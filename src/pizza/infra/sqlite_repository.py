@@ -0,0 +1,335 @@
+"""SQLite-backed OrderRepository (stdlib sqlite3, WAL mode, pooled readers)."""
+
+from __future__ import annotations
+
+import queue
+import sqlite3
+import threading
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, Iterator, Sequence
+
+from ..domain.delivery import Coordinates
+from ..domain.errors import OrderNotFound
+from ..domain.menu import Menu
+from ..domain.order import Order, OrderItem
+from ..domain.products import PizzaSize
+from ..domain.repository import Page, PaymentRecord, iter_pages
+from ..domain.status import OrderStatus
+from ..domain.types import OrderId
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS orders (
+    id BLOB PRIMARY KEY,
+    customer TEXT NOT NULL,
+    x REAL NOT NULL,
+    y REAL NOT NULL,
+    status TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS orders_status ON orders (status);
+CREATE INDEX IF NOT EXISTS orders_customer ON orders (customer);
+
+CREATE TABLE IF NOT EXISTS order_items (
+    order_id BLOB NOT NULL REFERENCES orders (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    pizza_sku TEXT NOT NULL,
+    size TEXT NOT NULL,
+    qty INTEGER NOT NULL,
+    toppings TEXT NOT NULL,
+    PRIMARY KEY (order_id, position)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS courier_links (
+    order_id BLOB PRIMARY KEY REFERENCES orders (id) ON DELETE CASCADE,
+    courier_id TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS courier_links_courier ON courier_links (courier_id);
+
+CREATE TABLE IF NOT EXISTS payments (
+    order_id BLOB PRIMARY KEY REFERENCES orders (id) ON DELETE CASCADE,
+    payment_id TEXT NOT NULL,
+    method TEXT NOT NULL,
+    authorized TEXT NOT NULL,
+    captured TEXT NOT NULL,
+    refunded TEXT NOT NULL,
+    status TEXT NOT NULL,
+    history TEXT NOT NULL
+) WITHOUT ROWID;
+"""
+
+_UPSERT_ORDER = """
+INSERT INTO orders (id, customer, x, y, status) VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET
+    customer = excluded.customer, x = excluded.x, y = excluded.y, status = excluded.status
+"""
+_DELETE_ITEMS = "DELETE FROM order_items WHERE order_id = ?"
+_INSERT_ITEM = "INSERT INTO order_items VALUES (?, ?, ?, ?, ?, ?)"
+_SELECT_ORDERS = """
+SELECT o.id, o.customer, o.x, o.y, o.status, i.pizza_sku, i.size, i.qty, i.toppings
+FROM orders o LEFT JOIN order_items i ON i.order_id = o.id
+"""
+_LINK_COURIER = "INSERT OR REPLACE INTO courier_links VALUES (?, ?)"
+_UPSERT_PAYMENT = "INSERT OR REPLACE INTO payments VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+_SELECT_PAYMENT = "SELECT * FROM payments WHERE order_id = ?"
+
+_STATUSES = {status.value: status for status in OrderStatus}
+_SIZES = {size.value: size for size in PizzaSize}
+
+
+class SQLiteOrderRepository:
+    """OrderRepository persisted in one SQLite database file.
+
+    Storage:
+      - orders: one row per order (id as 16 raw bytes), indexed by status and customer.
+      - order_items: (order_id, position) -> pizza SKU, size, qty, space-separated topping SKUs.
+      - courier_links, payments: one row per order.
+
+    Items are stored by SKU and resolved against ``menu`` on load, so the menu must
+    still contain every SKU that was saved. Pricing strategies are not persisted.
+
+    Writes go through one connection under a lock; reads borrow one of ``readers``
+    read-only connections, which WAL lets run concurrently with the writer.
+    Every loaded Order is a fresh object: mutate it and save() it back.
+    """
+
+    def __init__(self, path: str | Path, menu: Menu, readers: int = 4) -> None:
+        if readers <= 0:
+            raise ValueError(f"readers must be > 0, got {readers}")
+        self.path = Path(path)
+        self.menu = menu
+        self._pizzas = {pizza.sku.casefold(): pizza for pizza in menu.list_pizzas()}
+        self._toppings = {topping.sku.casefold(): topping for topping in menu.list_toppings()}
+
+        self._writer = self._connect(self.path)
+        self._writer.executescript(SCHEMA)
+        self._write_lock = threading.Lock()
+        uri = self.path.resolve().as_uri() + "?mode=ro"
+        self._readers: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        for _ in range(readers):
+            self._readers.put(self._connect(uri, uri=True))
+
+    def __enter__(self) -> "SQLiteOrderRepository":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        while not self._readers.empty():
+            self._readers.get_nowait().close()
+        self._writer.close()
+
+    def save(self, order: Order) -> str:
+        """Upsert an order and its items in one transaction; returns the order ID."""
+
+        return self.save_many((order,))[0]
+
+    def save_many(self, orders: Iterable[Order]) -> list[str]:
+        """Upsert many orders in a single transaction; returns their IDs in order.
+
+        An order given more than once (e.g. replayed history) is written once, as
+        its last occurrence.
+        """
+
+        latest: dict[bytes, tuple[tuple, list[tuple]]] = {}
+        ids = []
+        for order in orders:
+            if order.id is None:
+                order.id = OrderId.generate()
+            key = order.id.value.bytes
+            ids.append(str(order.id))
+            address = order.delivery_address
+            item_rows = []
+            for position, item in enumerate(order.items_view()):
+                toppings = " ".join(topping.sku for topping in item.toppings)
+                item_rows.append(
+                    (key, position, item.pizza.sku, item.size.value, item.qty, toppings)
+                )
+            order_row = (key, order.customer, address.x, address.y, order.status.value)
+            latest[key] = (order_row, item_rows)
+
+        with self._write_lock, self._writer:
+            self._writer.executemany(_UPSERT_ORDER, [row for row, _ in latest.values()])
+            self._writer.executemany(_DELETE_ITEMS, [(key,) for key in latest])
+            self._writer.executemany(
+                _INSERT_ITEM, [row for _, items in latest.values() for row in items]
+            )
+        return ids
+
+    def get(self, order_id: str) -> Order:
+        """Return the order by ID or raise OrderNotFound."""
+
+        with self._reader() as connection:
+            rows = connection.execute(
+                _SELECT_ORDERS + "WHERE o.id = ? ORDER BY i.position", (_key(order_id),)
+            ).fetchall()
+        if not rows:
+            raise OrderNotFound(order_id)
+        return self._build(rows)[0]
+
+    def find_by_status(self, status: OrderStatus) -> Sequence[Order]:
+        """List orders filtered by status (served by the status index)."""
+
+        return self._query("WHERE o.status = ?", (status.value,))
+
+    def find_by_customer(self, customer: str) -> Sequence[Order]:
+        """List orders of one customer."""
+
+        return self._query("WHERE o.customer = ?", (customer,))
+
+    def find_by_courier(self, courier_id: str) -> Sequence[Order]:
+        """List orders currently linked to the courier."""
+
+        return self._query(
+            "WHERE o.id IN (SELECT order_id FROM courier_links WHERE courier_id = ?)",
+            (courier_id,),
+        )
+
+    def list_all(self) -> Sequence[Order]:
+        """List all stored orders."""
+
+        return self._query("", ())
+
+    def page_all(self, cursor: str | None = None, limit: int = 1000) -> Page:
+        """Next ``limit`` orders by ascending ID; the cursor is the last ID in hex."""
+
+        return self._page("", (), cursor, limit)
+
+    def page_by_status(
+        self, status: OrderStatus, cursor: str | None = None, limit: int = 1000
+    ) -> Page:
+        """Next ``limit`` orders with the status by ascending ID (keyset on the status index)."""
+
+        return self._page("status = ? AND", (status.value,), cursor, limit)
+
+    def iter_all(self, cursor: str | None = None, page_size: int = 1000) -> Iterator[Order]:
+        return iter_pages(lambda after: self.page_all(after, page_size), cursor)
+
+    def iter_by_status(
+        self, status: OrderStatus, cursor: str | None = None, page_size: int = 1000
+    ) -> Iterator[Order]:
+        return iter_pages(lambda after: self.page_by_status(status, after, page_size), cursor)
+
+    def link_courier(self, order_id: str, courier_id: str) -> None:
+        """Link courier to order (overwrites previous link)."""
+
+        try:
+            with self._write_lock, self._writer:
+                self._writer.execute(_LINK_COURIER, (_key(order_id), courier_id))
+        except sqlite3.IntegrityError:
+            raise OrderNotFound(order_id) from None
+
+    def record_payment(self, order_id: str, record: PaymentRecord) -> None:
+        """Store the current PaymentRecord of an order (replaces the previous one)."""
+
+        row = (
+            _key(order_id),
+            record.payment_id,
+            record.method,
+            record.authorized_amount,
+            record.captured_amount,
+            record.refunded_amount,
+            record.status,
+            "\n".join(record.history),
+        )
+        try:
+            with self._write_lock, self._writer:
+                self._writer.execute(_UPSERT_PAYMENT, row)
+        except sqlite3.IntegrityError:
+            raise OrderNotFound(order_id) from None
+
+    def payment_record(self, order_id: str) -> PaymentRecord | None:
+        """Get PaymentRecord for order, or None if not set."""
+
+        with self._reader() as connection:
+            row = connection.execute(_SELECT_PAYMENT, (_key(order_id),)).fetchone()
+        if row is None:
+            return None
+        _, payment_id, method, authorized, captured, refunded, status, history = row
+        return PaymentRecord(
+            payment_id=payment_id,
+            method=method,
+            authorized_amount=authorized,
+            captured_amount=captured,
+            refunded_amount=refunded,
+            status=status,
+            history=tuple(history.split("\n")) if history else (),
+        )
+
+    def __len__(self) -> int:
+        with self._reader() as connection:
+            return connection.execute("SELECT count(*) FROM orders").fetchone()[0]
+
+    @staticmethod
+    def _connect(database: str | Path, uri: bool = False) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            database, uri=uri, check_same_thread=False, cached_statements=64
+        )
+        if not uri:
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = NORMAL")
+            connection.execute("PRAGMA foreign_keys = ON")
+        return connection
+
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        connection = self._readers.get()
+        try:
+            yield connection
+        finally:
+            self._readers.put(connection)
+
+    def _query(self, where: str, params: tuple) -> Sequence[Order]:
+        with self._reader() as connection:
+            rows = connection.execute(
+                f"{_SELECT_ORDERS}{where} ORDER BY o.id, i.position", params
+            ).fetchall()
+        return self._build(rows)
+
+    def _page(self, where: str, params: tuple, cursor: str | None, limit: int) -> Page:
+        after = bytes.fromhex(cursor) if cursor else b""
+        orders = self._query(
+            f"WHERE o.id IN (SELECT id FROM orders WHERE {where} id > ? ORDER BY id LIMIT ?)",
+            (*params, after, limit),
+        )
+        if len(orders) < limit:
+            return Page(tuple(orders), None)
+        return Page(tuple(orders), orders[-1].id.value.bytes.hex())
+
+    def _build(self, rows: list[tuple]) -> list[Order]:
+        """Group joined (order, item) rows, sorted by order id, into Orders."""
+
+        grouped: dict[bytes, tuple[tuple, list[OrderItem]]] = {}
+        for key, customer, x, y, status, sku, size, qty, toppings in rows:
+            entry = grouped.get(key)
+            if entry is None:
+                entry = grouped[key] = ((customer, x, y, status), [])
+            if sku is not None:
+                entry[1].append(
+                    OrderItem(
+                        self._pizzas[sku.casefold()],
+                        qty,
+                        _SIZES[size],
+                        tuple(self._toppings[t.casefold()] for t in toppings.split()),
+                    )
+                )
+        return [
+            Order(
+                self.menu,
+                OrderId(uuid.UUID(bytes=key)),
+                customer,
+                Coordinates(x, y),
+                items,
+                _STATUSES[status],
+                None,
+            )
+            for key, ((customer, x, y, status), items) in grouped.items()
+        ]
+
+
+def _key(order_id: str) -> bytes:
+    try:
+        return uuid.UUID(order_id).bytes
+    except ValueError:
+        raise OrderNotFound(order_id) from None
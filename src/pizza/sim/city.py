@@ -0,0 +1,257 @@
+"""Discrete-event city simulator for comparing courier assignment strategies offline."""
+
+from __future__ import annotations
+
+import heapq
+import math
+import random
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Mapping, Sequence
+
+from ..domain.delivery import (
+    AssignmentStrategy,
+    Coordinates,
+    Courier,
+    Dispatcher,
+    Vehicle,
+    travel_time,
+)
+from ..domain.menu import Menu
+from ..domain.order import Order
+from ..domain.status import OrderStatus
+from ..domain.types import OrderId
+
+RateCurve = Callable[[float], float]
+"""Hour of day (0..24, fractional) -> expected orders per hour."""
+
+# fmt: off
+DINNER_PEAK: tuple[float, ...] = (
+    2, 1, 0, 0, 0, 0, 1, 3, 5, 6, 10, 25,
+    40, 30, 15, 12, 18, 35, 60, 70, 50, 30, 15, 6,
+)
+# fmt: on
+"""Hourly order rates of a typical day: lunch bump and a dinner peak."""
+
+
+def hourly_rate(rates: Sequence[float]) -> RateCurve:
+    """Piecewise-constant rate curve from 24 hourly values."""
+
+    if len(rates) != 24:
+        raise ValueError(f"expected 24 hourly rates, got {len(rates)}")
+    if any(rate < 0 for rate in rates):
+        raise ValueError("rates must be >= 0")
+    values = tuple(rates)
+    return lambda hour: values[int(hour) % 24]
+
+
+@dataclass(frozen=True, slots=True)
+class SimulationConfig:
+    """Simulation parameters. Time is in hours, distances in the same units as Coordinates."""
+
+    seed: int = 0
+    hours: float = 24.0
+    rate: RateCurve = hourly_rate(DINNER_PEAK)
+    peak_rate: float | None = None
+    couriers: int = 20
+    vehicles: Sequence[Vehicle] = (
+        Vehicle(kind="bike", speed_coef=0.8),
+        Vehicle(kind="scooter", speed_coef=1.0),
+        Vehicle(kind="car", speed_coef=1.3),
+    )
+    depot: Coordinates = Coordinates(0, 0)
+    city_radius: float = 5.0
+    prep_minutes: tuple[float, float] = (10.0, 20.0)
+    handover_minutes: float = 2.0
+
+
+@dataclass(frozen=True, slots=True)
+class SimulationReport:
+    """Simulation outcome.
+
+    Fields:
+      orders: Orders that arrived.
+      delivered: Orders that reached DELIVERED.
+      delivery_minutes: Arrival -> DELIVERED times, sorted ascending.
+      percentiles: p50/p90/p99/max of delivery_minutes.
+      utilization: courier_id -> busy share of the simulated period.
+      mean_utilization: Average over the fleet.
+      max_backlog: Most BOXED orders waiting for a courier at once.
+      wall_seconds: Real time spent simulating.
+    """
+
+    orders: int
+    delivered: int
+    delivery_minutes: Sequence[float]
+    percentiles: Mapping[str, float]
+    utilization: Mapping[str, float]
+    mean_utilization: float
+    max_backlog: int
+    wall_seconds: float
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending sequence (0 for empty input)."""
+
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+_ARRIVAL, _READY, _DELIVERED = range(3)
+
+
+class CitySimulator:
+    """Seeded discrete-event simulation of one restaurant and its couriers.
+
+    Orders arrive as a non-homogeneous Poisson process following ``config.rate``,
+    are BOXED after a prep delay, then go through Dispatcher.assign
+    (BOXED -> DISPATCHED) and are DELIVERED when the courier reaches the customer.
+    The strategy is asked for a courier for the depot, where the order is picked
+    up. Couriers are released where they drop off and ride back to the depot while
+    available, so a strategy can pick whoever is closest to it at dispatch time.
+    """
+
+    def __init__(
+        self, config: SimulationConfig, strategy: AssignmentStrategy | None = None
+    ) -> None:
+        self.config = config
+        self.strategy = strategy
+
+    def run(self) -> SimulationReport:
+        started = time.perf_counter()
+        cfg = self.config
+        rng = random.Random(cfg.seed)
+        menu = Menu(pizzas=[], toppings=[])
+        fleet = [
+            Courier(
+                id=f"c{i}",
+                location=cfg.depot,
+                vehicle=cfg.vehicles[i % len(cfg.vehicles)],
+                available=True,
+            )
+            for i in range(cfg.couriers)
+        ]
+        dispatcher = Dispatcher(fleet, self.strategy)
+        peak = cfg.peak_rate or max(cfg.rate(h + 0.5) for h in range(24))
+
+        events: list[tuple[float, int, int, object]] = []
+        seq = 0
+
+        def schedule(at: float, kind: int, payload: object) -> None:
+            nonlocal seq
+            seq += 1
+            heapq.heappush(events, (at, seq, kind, payload))
+
+        def next_arrival(now: float) -> None:
+            if peak <= 0:
+                return
+            t = now
+            while True:
+                t += rng.expovariate(peak)
+                if t >= cfg.hours:
+                    return
+                if rng.random() * peak <= cfg.rate(t % 24):
+                    schedule(t, _ARRIVAL, None)
+                    return
+
+        arrived_at: dict[str, float] = {}
+        busy_since: dict[str, float] = {}
+        busy: dict[str, float] = {courier.id: 0.0 for courier in fleet}
+        backlog: deque[Order] = deque()
+        delivery_minutes: list[float] = []
+        max_backlog = 0
+        arrivals = 0
+
+        returning: dict[str, tuple[Coordinates, float]] = {}
+
+        def ride_back(now: float) -> None:
+            for courier_id, (start, released) in list(returning.items()):
+                courier = dispatcher.courier(courier_id)
+                total = travel_time(start, cfg.depot, courier.vehicle)
+                done = (now - released) / total if total else 1.0
+                if done >= 1.0:
+                    courier.location = cfg.depot
+                    del returning[courier_id]
+                else:
+                    courier.location = Coordinates(
+                        start.x + (cfg.depot.x - start.x) * done,
+                        start.y + (cfg.depot.y - start.y) * done,
+                    )
+
+        def dispatch_waiting(now: float) -> None:
+            if backlog and returning:
+                ride_back(now)
+            while backlog and dispatcher.has_available():
+                order = backlog.popleft()
+                # Pizzas are picked up at the depot, so that is where the strategy looks.
+                result = dispatcher.assign(str(order.id), cfg.depot)
+                order.dispatch_with(result.courier_id, result.strategy_name)
+                courier = dispatcher.courier(result.courier_id)
+                returning.pop(courier.id, None)
+                busy_since[courier.id] = now
+                pickup = travel_time(courier.location, cfg.depot, courier.vehicle)
+                drop = travel_time(cfg.depot, order.delivery_address, courier.vehicle)
+                delivered_at = now + pickup + cfg.handover_minutes / 60 + drop
+                schedule(delivered_at, _DELIVERED, (order, courier))
+
+        now = 0.0
+        next_arrival(now)
+        while events:
+            now, _, kind, payload = heapq.heappop(events)
+            if kind == _ARRIVAL:
+                arrivals += 1
+                angle = rng.uniform(0, 2 * math.pi)
+                reach = cfg.city_radius * math.sqrt(rng.random())
+                address = Coordinates(
+                    cfg.depot.x + reach * math.cos(angle), cfg.depot.y + reach * math.sin(angle)
+                )
+                prep = rng.uniform(*cfg.prep_minutes) / 60
+                schedule(now + prep, _READY, (address, now))
+                next_arrival(now)
+            elif kind == _READY:
+                address, arrived = payload  # type: ignore[misc]
+                order = Order(
+                    menu=menu,
+                    id=OrderId(uuid.UUID(int=rng.getrandbits(128), version=4)),
+                    customer=f"customer-{arrivals}",
+                    delivery_address=address,
+                    items=[],
+                    status=OrderStatus.BOXED,
+                    pricing_strategy=None,
+                )
+                arrived_at[str(order.id)] = arrived
+                backlog.append(order)
+                max_backlog = max(max_backlog, len(backlog))
+                dispatch_waiting(now)
+            elif kind == _DELIVERED:
+                order, courier = payload  # type: ignore[misc]
+                order.deliver()
+                courier.location = order.delivery_address
+                delivery_minutes.append((now - arrived_at.pop(str(order.id))) * 60)
+                busy[courier.id] += now - busy_since.pop(courier.id)
+                returning[courier.id] = (courier.location, now)
+                dispatcher.release(courier.id)
+                dispatch_waiting(now)
+
+        period = max(cfg.hours, now)
+        utilization = {courier_id: spent / period for courier_id, spent in busy.items()}
+        delivery_minutes.sort()
+        return SimulationReport(
+            orders=arrivals,
+            delivered=len(delivery_minutes),
+            delivery_minutes=tuple(delivery_minutes),
+            percentiles={
+                "p50": percentile(delivery_minutes, 50),
+                "p90": percentile(delivery_minutes, 90),
+                "p99": percentile(delivery_minutes, 99),
+                "max": delivery_minutes[-1] if delivery_minutes else 0.0,
+            },
+            utilization=utilization,
+            mean_utilization=sum(utilization.values()) / len(utilization) if utilization else 0.0,
+            max_backlog=max_backlog,
+            wall_seconds=time.perf_counter() - started,
+        )
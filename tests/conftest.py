@@ -0,0 +1,61 @@
+from decimal import Decimal
+from typing import Callable
+
+import pytest
+
+from src.pizza.domain.delivery import Coordinates
+from src.pizza.domain.inventory import Ingredient, IngredientRequirement
+from src.pizza.domain.menu import Menu
+from src.pizza.domain.order import Order, OrderId
+from src.pizza.domain.products import Pizza
+from src.pizza.domain.status import OrderStatus
+
+
+class FakeClock:
+    """Injectable clock: returns ``now``, which the test moves by hand."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def menu() -> Menu:
+    """A Margherita (pz-mar, 10.00, 1kg of dough) and no toppings."""
+
+    dough = IngredientRequirement(Ingredient(name="Dough", unit="kg"), Decimal("1"))
+    return Menu(pizzas=[Pizza("Margherita", Decimal("10.00"), "pz-mar", [dough])], toppings=[])
+
+
+@pytest.fixture
+def make_order(menu: Menu) -> Callable[..., Order]:
+    """Order factory on the ``menu`` fixture.
+
+    Usage:
+      make_order()  # empty NEW order for "test-user" at (0, 0), with an id
+      make_order(("pz-mar", PizzaSize.LARGE, 2, ()), customer="alice", with_id=False)
+
+    Positional arguments are (sku, size, qty, toppings) items passed to add_item.
+    """
+
+    def make(
+        *items: tuple,
+        customer: str = "test-user",
+        status: OrderStatus | None = None,
+        address: Coordinates = Coordinates(0, 0),
+        with_id: bool = True,
+    ) -> Order:
+        order_id = OrderId.generate() if with_id else None
+        order = Order(menu, order_id, customer, address, [], status, None)
+        for item in items:
+            order.add_item(*item)
+        return order
+
+    return make
@@ -0,0 +1,19 @@
+import pytest
+
+from benchmarks.suite import CASES, DataGenerator, compare, run
+
+
+def test_benchmark_suite_runs_every_case_and_flags_regressions():
+    assert DataGenerator(7).menu(3).list_pizzas()[0].default_price == (
+        DataGenerator(7).menu(3).list_pizzas()[0].default_price
+    )
+    document = run(CASES, [10], repeat=1, min_time=0.0001)
+    assert [r["case"] for r in document["results"]] == list(CASES)
+
+    faster = {**document, "results": [dict(r) for r in document["results"]]}
+    faster["results"][0]["ns_per_op"] /= 2
+    regressions = compare(document, faster, threshold=0.5)
+    assert [(r.case, r.size) for r in regressions] == [(document["results"][0]["case"], 10)]
+    assert compare(document, document, threshold=0.0) == []
+    with pytest.raises(ValueError):
+        compare(document, {"schema": 0, "results": []}, threshold=0.25)
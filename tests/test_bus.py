@@ -0,0 +1,159 @@
+import asyncio
+from typing import Callable
+
+import pytest
+
+from src.pizza.domain.bus import EventBus
+from src.pizza.domain.errors import EventBufferOverflow
+from src.pizza.domain.events import OrderEventLog
+from src.pizza.domain.order import Order, TransitionOutcome, accept_all
+from src.pizza.domain.status import OrderStatus
+
+
+@pytest.fixture
+def make_orders(make_order) -> Callable[[EventBus, int], list[Order]]:
+    """``make_orders(bus, count)``: new orders, each tracked by ``bus``."""
+
+    def make(bus: EventBus, count: int) -> list[Order]:
+        orders = [make_order() for _ in range(count)]
+        for order in orders:
+            bus.track(order)
+        return orders
+
+    return make
+
+
+def test_sync_subscribers_get_batches_filtered_by_status(make_orders):
+    bus = EventBus()
+    batches, canceled = [], []
+    bus.subscribe(batches.append, batch_size=3, max_delay=60)
+    bus.subscribe(canceled.append, statuses=[OrderStatus.CANCELED])
+    orders = make_orders(bus, 4)
+
+    for order in orders:
+        order.accept()
+    orders[0].cancel()
+
+    assert [len(batch) for batch in batches] == [3]
+    assert [e.order_id for e in batches[0]] == [str(o.id) for o in orders[:3]]
+    assert [[e.status for e in batch] for batch in canceled] == [[OrderStatus.CANCELED]]
+    assert canceled[0][0].previous is OrderStatus.ACCEPTED
+
+    bus.flush()
+    assert [len(batch) for batch in batches] == [3, 2]
+    assert [e.seq for batch in batches for e in batch] == [0, 1, 2, 3, 4]
+
+
+def test_sync_batch_is_flushed_when_oldest_event_exceeds_max_delay(make_orders, clock):
+    bus = EventBus(clock)
+    batches = []
+    bus.subscribe(batches.append, batch_size=100, max_delay=0.5)
+    first, second = make_orders(bus, 2)
+
+    first.accept()
+    clock.now = 0.6
+    second.accept()
+
+    assert [len(batch) for batch in batches] == [2]
+
+
+@pytest.mark.parametrize(
+    ("policy", "kept"), [("drop-oldest", [2, 3, 4]), ("drop-newest", [0, 1, 2])]
+)
+def test_overflow_policies(make_orders, policy, kept):
+    bus = EventBus()
+    received = []
+
+    async def slow(batch):
+        received.extend(e.seq for e in batch)
+
+    subscription = bus.subscribe(slow, batch_size=3, max_buffer=3, overflow=policy)
+    for order in make_orders(bus, 5):
+        order.accept()  # the bus is not started, so nothing is delivered yet
+    asyncio.run(bus.drain())
+
+    assert received == kept
+    assert subscription.stats().dropped == 2
+
+
+def test_error_policy_reports_overflow_out_of_band(make_orders):
+    bus = EventBus()
+
+    async def never(batch):
+        pass
+
+    bus.subscribe(never, batch_size=1, max_buffer=1, overflow="error", name="analytics")
+    orders = make_orders(bus, 3)
+    outcomes = accept_all(orders)  # the second and third events overflow
+
+    assert outcomes == [TransitionOutcome.APPLIED] * 3
+    assert all(order.status is OrderStatus.ACCEPTED for order in orders)
+    with pytest.raises(EventBufferOverflow) as info:
+        bus.check()
+    assert info.value.subscriber == "analytics"
+    bus.check()  # reported once
+    assert bus.stats()["analytics"].dropped == 2
+
+
+def test_track_keeps_the_orders_event_log(make_orders):
+    bus = EventBus()
+    batches = []
+    bus.subscribe(batches.append)
+    log = OrderEventLog()
+    (order,) = make_orders(bus, 1)
+    log.track(order)
+    bus.track(order)  # already tracked: not added twice
+    order.accept()
+
+    assert [e.status for e in log.events()] == [OrderStatus.NEW, OrderStatus.ACCEPTED]
+    assert [[e.status for e in batch] for batch in batches] == [[OrderStatus.ACCEPTED]]
+
+
+def test_async_subscriber_batches_by_size_and_delay(make_orders):
+    async def scenario():
+        bus = EventBus()
+        batches = []
+
+        async def analytics(batch):
+            batches.append(len(batch))
+
+        subscription = bus.subscribe(analytics, batch_size=4, max_delay=0.02)
+        await bus.start()
+        orders = make_orders(bus, 6)
+        for order in orders:
+            order.accept()
+        await asyncio.sleep(0)
+        full = list(batches)
+        await asyncio.sleep(0.05)
+        timed = list(batches)
+        orders[0].cancel()
+        await bus.stop()
+        return full, timed, batches, subscription.stats()
+
+    full, timed, batches, stats = asyncio.run(scenario())
+    assert full == [4]
+    assert timed == [4, 2]
+    assert batches == [4, 2, 1]
+    assert (stats.received, stats.delivered, stats.batches, stats.buffered) == (7, 7, 3, 0)
+
+
+def test_handler_errors_are_counted_not_raised(make_orders):
+    bus = EventBus()
+
+    def broken(batch):
+        raise RuntimeError("display offline")
+
+    subscription = bus.subscribe(broken)
+    (order,) = make_orders(bus, 1)
+    order.accept()
+
+    assert order.status is OrderStatus.ACCEPTED
+    assert subscription.stats().errors == 1
+
+
+def test_invalid_subscription_settings():
+    bus = EventBus()
+    with pytest.raises(ValueError):
+        bus.subscribe(print, batch_size=10, max_buffer=5)
+    with pytest.raises(ValueError):
+        bus.subscribe(print, overflow="block")
@@ -0,0 +1,74 @@
+from typing import Sequence
+
+import pytest
+
+from src.pizza.domain.delivery import AssignmentStrategy, Coordinates, Courier, distance
+from src.pizza.sim.city import CitySimulator, SimulationConfig, hourly_rate, percentile
+
+
+class Nearest(AssignmentStrategy):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def choose(self, order_address: Coordinates, couriers: Sequence[Courier]) -> Courier:
+        self.calls += 1
+        return min(couriers, key=lambda courier: distance(courier.location, order_address))
+
+
+def test_same_seed_same_report() -> None:
+    first = CitySimulator(SimulationConfig(seed=3)).run()
+    second = CitySimulator(SimulationConfig(seed=3)).run()
+
+    assert first.orders > 0
+    assert first.delivery_minutes == second.delivery_minutes
+    assert first.utilization == second.utilization
+
+
+def test_full_day_delivers_every_order() -> None:
+    report = CitySimulator(SimulationConfig(seed=1)).run()
+
+    assert report.delivered == report.orders
+    assert 0 < report.mean_utilization <= 1
+    assert all(0 <= share <= 1 for share in report.utilization.values())
+    assert report.percentiles["p50"] <= report.percentiles["p90"] <= report.percentiles["max"]
+    assert report.wall_seconds < 5
+
+
+def test_smaller_fleet_delivers_slower() -> None:
+    large = CitySimulator(SimulationConfig(seed=2, couriers=30)).run()
+    small = CitySimulator(SimulationConfig(seed=2, couriers=5)).run()
+
+    assert small.percentiles["p90"] > large.percentiles["p90"]
+    assert small.mean_utilization > large.mean_utilization
+
+
+def test_strategy_drives_assignment() -> None:
+    strategy = Nearest()
+    report = CitySimulator(SimulationConfig(seed=4), strategy=strategy).run()
+
+    assert strategy.calls == report.orders
+
+
+def test_nearest_courier_beats_any_available() -> None:
+    config = SimulationConfig(seed=5, couriers=20)
+    nearest = CitySimulator(config, strategy=Nearest()).run()
+    any_available = CitySimulator(config).run()
+
+    def mean(values: Sequence[float]) -> float:
+        return sum(values) / len(values)
+
+    assert nearest.delivered == any_available.delivered
+    assert mean(nearest.delivery_minutes) < mean(any_available.delivery_minutes)
+
+
+def test_zero_rate_means_no_orders() -> None:
+    report = CitySimulator(SimulationConfig(rate=hourly_rate([0] * 24))).run()
+
+    assert (report.orders, report.delivered, report.mean_utilization) == (0, 0, 0)
+
+
+def test_rate_curve_validation_and_percentile() -> None:
+    with pytest.raises(ValueError):
+        hourly_rate([1, 2, 3])
+    assert percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.0
+    assert percentile([], 99) == 0.0
@@ -0,0 +1,113 @@
+import io
+import json
+
+from src.pizza.cli.app import main
+from src.pizza.cli.session import Session, load_config
+
+
+def run(argv: list[str], stdin: str = "") -> tuple[int, list[dict]]:
+    out = io.StringIO()
+    status = main(argv, io.StringIO(stdin), out)
+    return status, [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+def test_batch_streams_one_result_per_command():
+    commands = "\n".join(
+        [
+            "order new 'Ann Lee' 1 2",
+            "add-item @ pz-mar large 2 tp-basil",
+            '{"cmd": "add-item", "order": "@", "sku": "pz-pep", "qty": 1}',
+            "",
+            "# comments and blank lines are skipped",
+            "accept @",
+            "bake @",
+            "box @",
+            "dispatch @",
+            "deliver @",
+            "pay @",
+            "pay @",
+            "show @",
+            "bake nope",
+            '{"cmd": "teleport"}',
+        ]
+    )
+    status, results = run(["batch"], commands)
+
+    assert status == 1
+    assert [r["line"] for r in results] == [1, 2, 3, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15]
+    order_id = results[0]["order"]
+    assert results[2]["subtotal"] == "35.76"
+    assert [r.get("status") for r in results[3:8]] == [
+        "accepted",
+        "baking",
+        "boxed",
+        "dispatched",
+        "delivered",
+    ]
+    assert results[8] == {
+        "line": 11,
+        "ok": True,
+        "order": order_id,
+        "payment": f"cash-{order_id}",
+        "amount": "35.76",
+        "status": "captured",
+    }
+    assert results[9]["error"] == "PaymentAlreadyCaptured"
+    assert results[10]["customer"] == "Ann Lee"
+    assert [r["error"] for r in results[11:]] == ["OrderNotFound", "CommandError"]
+
+
+def test_session_reports_usage_errors_without_raising():
+    session = Session(*load_config(None))
+
+    assert session.run(["add-item"])["error"] == "CommandError"
+    assert session.run(["accept", "@"])["message"] == "no order created yet"
+    session.run(["order", "new", "bob"])
+    assert session.run(["add-item", "@", "pz-mar", "huge"])["message"] == "unknown size 'huge'"
+    assert session.run(["add-item", "@", "pz-mar", "small", "x"])["error"] == "ValueError"
+    assert session.run_json({"cmd": "add-item", "sku": "pz-mar"})["message"] == (
+        "add-item: missing 'order'"
+    )
+    assert session.run_line("   ") is None
+
+
+def test_batch_reports_wrongly_typed_json_arguments():
+    session = Session(*load_config(None))
+    lines = [
+        '{"cmd": "order new", "customer": "a", "x": null}',
+        '{"cmd": "order new", "customer": "a", "x": 1.5}',
+        '{"cmd": "add-item", "order": "@", "sku": "pz-mar", "toppings": 5}',
+        '{"cmd": "add-item", "order": "@", "sku": "pz-mar", "toppings": "tp-basil"}',
+        '{"cmd": "add-item", "order": "@", "sku": {"a": 1}}',
+        '{"cmd": "add-item", "order": "@", "sku": "pz-mar", "toppings": ["tp-basil"]}',
+        '{"cmd": "add-item", "order": "@", "sku": "pz-mar", "toppings": [1]}',
+        '{"cmd": "add-item", "order": "@", "sku": "pz-mar", "qty": true}',
+        '{"cmd": "add-item", "order": "@", "sku": "pz-mar", "qty": 2.9}',
+        '{"cmd": "add-item", "order": "@", "sku": "pz-mar", "qty": 2.0}',
+    ]
+    results = [json.loads(line) for line in session.run_batch(lines)]
+
+    ok = [r["ok"] for r in results]
+    assert ok == [False, True, False, False, False, True, False, False, False, True]
+    assert results[0]["message"] == "order new: 'x' must be a string or number"
+    assert results[2]["message"] == "add-item: 'toppings' must be a list of strings"
+    assert results[6]["message"] == "add-item: 'toppings' must be a list of strings"
+    assert results[7]["message"] == "add-item: 'qty' must be a string or number"
+    assert results[8]["message"] == "qty must be a whole number, got 2.9"
+    assert session.errors == 7
+
+
+def test_one_shot_commands_share_state_through_the_store(tmp_path):
+    store = str(tmp_path / "orders.log")
+    status, [created] = run(["--store", store, "order", "new", "dana"])
+    assert status == 0
+
+    order_id = created["order"]
+    assert run(["--store", store, "add-item", order_id, "pz-pep", "large"])[0] == 0
+    assert run(["--store", store, "accept", order_id])[0] == 0
+    status, [shown] = run(["--store", store, "show", order_id])
+
+    assert status == 0
+    assert shown["status"] == "accepted"
+    assert shown["items"] == [{"sku": "pz-pep", "size": "large", "qty": 1, "toppings": []}]
+    assert run(["--store", store, "box", order_id])[0] == 1
@@ -0,0 +1,100 @@
+import pickle
+from decimal import Decimal
+
+import pytest
+
+from src.pizza.domain.delivery import Coordinates
+from src.pizza.domain.errors import OrderDecodeError
+from src.pizza.domain.inventory import Ingredient, IngredientRequirement
+from src.pizza.domain.menu import Menu
+from src.pizza.domain.order import Order
+from src.pizza.domain.products import Pizza, PizzaSize, Topping
+from src.pizza.domain.status import OrderStatus
+from src.pizza.infra.codec import HEADER, OrderCodec
+
+
+@pytest.fixture
+def menu() -> Menu:
+    dough = IngredientRequirement(Ingredient(name="Dough", unit="kg"), Decimal("1"))
+    return Menu(
+        pizzas=[
+            Pizza("Margherita", Decimal("10.00"), "pz-mar", [dough]),
+            Pizza("Pepperoni", Decimal("11.00"), "pz-pep", [dough]),
+        ],
+        toppings=[
+            Topping("Olives", Decimal("1.00"), "tp-oli"),
+            Topping("Basil", Decimal("0.50"), "tp-bas"),
+        ],
+    )
+
+
+@pytest.fixture
+def order(make_order) -> Order:
+    return make_order(
+        ("pz-pep", PizzaSize.LARGE, 3, ["tp-oli", "tp-bas", "tp-oli"]),
+        ("pz-mar", PizzaSize.SMALL, 1, []),
+        customer="Zoë",
+        status=OrderStatus.BOXED,
+        address=Coordinates(3.25, -1.5),
+    )
+
+
+def test_round_trip(menu, order) -> None:
+    codec = OrderCodec(menu, menu_version=7)
+    decoded = codec.decode(codec.encode(order))
+
+    assert decoded.id == order.id
+    assert (decoded.customer, decoded.delivery_address) == ("Zoë", Coordinates(3.25, -1.5))
+    assert decoded.status is OrderStatus.BOXED
+    assert decoded.subtotal() == order.subtotal()
+    first = decoded.items_view()[0]
+    assert (first.pizza.sku, first.size, first.qty) == ("pz-pep", PizzaSize.LARGE, 3)
+    assert [t.sku for t in first.toppings] == ["tp-oli", "tp-bas", "tp-oli"]
+
+
+def test_decode_from_memoryview_offset_and_missing_id(menu, order) -> None:
+    codec = OrderCodec(menu)
+    order.id = None
+    buffer = bytearray(b"junk") + codec.encode(order)
+
+    decoded = codec.decode(memoryview(buffer), offset=4)
+    assert decoded.id is None
+    assert len(decoded.items_view()) == 2
+
+
+def test_rejects_other_menu_version_and_corrupt_data(menu, order) -> None:
+    data = OrderCodec(menu, menu_version=1).encode(order)
+    with pytest.raises(OrderDecodeError):
+        OrderCodec(menu, menu_version=2).decode(data)
+    with pytest.raises(OrderDecodeError):
+        OrderCodec(menu, menu_version=1).decode(data[:-3])
+    with pytest.raises(OrderDecodeError):
+        OrderCodec(menu, menu_version=1).decode(data[:10])
+
+
+def test_default_version_follows_menu_order(menu, order) -> None:
+    data = OrderCodec(menu).encode(order)
+    reordered = Menu(list(reversed(menu.list_pizzas())), menu.list_toppings())
+    assert OrderCodec(Menu(menu.list_pizzas(), menu.list_toppings())).decode(data)
+    with pytest.raises(OrderDecodeError):
+        OrderCodec(reordered).decode(data)
+
+
+@pytest.mark.parametrize(
+    "position, value",
+    [
+        (21, 200),  # status code
+        (HEADER.size - 2, 255),  # customer length past the end of the data
+        (HEADER.size, 0xFF),  # invalid UTF-8 in the customer
+    ],
+)
+def test_every_corrupt_field_raises_decode_error(menu, order, position, value) -> None:
+    codec = OrderCodec(menu)
+    data = bytearray(codec.encode(order))
+    data[position] = value
+    with pytest.raises(OrderDecodeError):
+        codec.decode(data)
+
+
+def test_encoding_is_much_smaller_than_pickle(menu, order) -> None:
+    assert len(OrderCodec(menu).encode(order)) * 5 < len(pickle.dumps(order))
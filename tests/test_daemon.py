@@ -0,0 +1,133 @@
+import asyncio
+import io
+import json
+import socket
+
+import pytest
+
+from src.pizza.cli.app import _RaisingParser, build_parser, execute, main
+from src.pizza.cli.daemon import CommandDaemon
+from src.pizza.cli.protocol import FRAME, DaemonClient
+from src.pizza.cli.session import Session, load_config
+
+
+def make_daemon(path: str) -> CommandDaemon:
+    session = Session(*load_config(None))
+    parser = build_parser(_RaisingParser)
+    return CommandDaemon(lambda argv: execute(session, parser, argv), path)
+
+
+def request(path: str, *commands: list[str]) -> list[dict]:
+    with DaemonClient.connect(path) as client:
+        return [client.request(argv) for argv in commands]
+
+
+def test_daemon_keeps_state_across_connections_and_survives_bad_frames(tmp_path):
+    path = str(tmp_path / "d.sock")
+
+    async def scenario():
+        daemon = make_daemon(path)
+        running = asyncio.create_task(daemon.run())
+        await asyncio.sleep(0.05)
+        first = await asyncio.to_thread(
+            request, path, ["order", "new", "ann"], ["add-item", "@", "pz-mar", "large"]
+        )
+
+        def garbage() -> None:
+            with socket.socket(socket.AF_UNIX) as raw:
+                raw.connect(path)
+                raw.sendall(FRAME.pack(5) + b"{oops")
+
+        await asyncio.to_thread(garbage)
+        second = await asyncio.to_thread(
+            request, path, ["show", first[0]["order"]], ["add-item"], ["teleport"]
+        )
+        with DaemonClient.connect(path) as client:
+            stopped = await asyncio.to_thread(client.send, {"op": "shutdown"})
+        await running
+        return first, second, stopped
+
+    first, (shown, usage, unknown), stopped = asyncio.run(scenario())
+
+    assert first[1]["subtotal"] == "11.88"
+    assert shown["items"] == [{"sku": "pz-mar", "size": "large", "qty": 1, "toppings": []}]
+    assert usage["error"] == "CommandError"
+    assert "invalid choice" in unknown["message"]
+    assert stopped == {"ok": True}
+    assert DaemonClient.connect(path) is None
+
+
+def test_cli_forwards_to_a_running_daemon(tmp_path, monkeypatch):
+    path = str(tmp_path / "d.sock")
+    monkeypatch.setenv("PIZZA_SOCKET", path)
+
+    def cli(*argv: str) -> tuple[int, dict]:
+        out = io.StringIO()
+        status = main(list(argv), None, out)
+        return status, json.loads(out.getvalue())
+
+    async def scenario():
+        daemon = await make_daemon(path).start()
+        try:
+            created = await asyncio.to_thread(cli, "order", "new", "bo")
+            shown = await asyncio.to_thread(cli, "show", "@")
+            local = await asyncio.to_thread(cli, "--no-daemon", "show", "@")
+            status = await asyncio.to_thread(cli, "daemon", "status")
+        finally:
+            await daemon.close()
+        return created, shown, local, status, daemon.requests
+
+    created, shown, local, status, requests = asyncio.run(scenario())
+
+    assert created[0] == 0
+    assert shown[0] == 0
+    assert (shown[1]["order"], shown[1]["customer"]) == (created[1]["order"], "bo")
+    assert local[0] == 1 and local[1]["message"] == "no order created yet"
+    assert status[1]["requests"] == 3
+    assert requests == 3
+
+
+def test_second_daemon_on_live_socket_is_refused_and_stale_socket_replaced(tmp_path):
+    path = str(tmp_path / "d.sock")
+    stale = socket.socket(socket.AF_UNIX)
+    stale.bind(path)
+    stale.close()  # socket file left behind without a listener
+
+    async def scenario():
+        daemon = await make_daemon(path).start()
+        try:
+            with pytest.raises(RuntimeError):
+                await make_daemon(path).start()
+            return await asyncio.to_thread(request, path, ["menu"])
+        finally:
+            await daemon.close()
+
+    [menu] = asyncio.run(scenario())
+    assert [pizza["sku"] for pizza in menu["pizzas"]] == ["pz-mar", "pz-pep"]
+
+
+def test_help_and_handler_errors_are_answered_without_stopping_the_daemon(tmp_path, capsys):
+    path = str(tmp_path / "d.sock")
+
+    async def scenario():
+        daemon = await make_daemon(path).start()
+        try:
+            helped = await asyncio.to_thread(request, path, ["menu", "-h"], ["-h"])
+            with DaemonClient.connect(path) as client:
+                pong = await asyncio.to_thread(client.send, {"op": "ping"})
+        finally:
+            await daemon.close()
+        return helped, pong
+
+    (menu_help, top_help), pong = asyncio.run(scenario())
+
+    assert menu_help["error"] == "CommandError" and "usage: pizza menu" in menu_help["message"]
+    assert top_help["error"] == "CommandError" and "usage: pizza" in top_help["message"]
+    assert pong["ok"] is True and pong["requests"] == 3
+    assert capsys.readouterr().out == ""
+
+    def broken(argv: list[str]) -> dict:
+        raise KeyError(argv[0])
+
+    answer = CommandDaemon(broken, path).handle({"argv": ["menu"]})
+    assert answer == {"ok": False, "error": "KeyError", "message": "'menu'"}
@@ -0,0 +1,70 @@
+from typing import Sequence
+
+import pytest
+
+from src.pizza.domain.delivery import (
+    AssignmentStrategy,
+    Coordinates,
+    Courier,
+    Dispatcher,
+    Vehicle,
+    distance,
+)
+from src.pizza.domain.errors import CourierUnavailable, NoCouriersAvailable
+
+BIKE = Vehicle(kind="bike", speed_coef=1.0)
+
+
+class Nearest(AssignmentStrategy):
+    def choose(self, order_address: Coordinates, couriers: Sequence[Courier]) -> Courier:
+        return min(couriers, key=lambda courier: distance(courier.location, order_address))
+
+
+@pytest.fixture
+def dispatcher() -> Dispatcher:
+    couriers = [
+        Courier(id="c0", location=Coordinates(0, 0), vehicle=BIKE, available=True),
+        Courier(id="c1", location=Coordinates(5, 5), vehicle=BIKE, available=True),
+        Courier(id="c2", location=Coordinates(9, 9), vehicle=BIKE, available=False),
+    ]
+    return Dispatcher(couriers=couriers)
+
+
+def test_assign_takes_couriers_until_none_left(dispatcher: Dispatcher) -> None:
+    first = dispatcher.assign("o1")
+    second = dispatcher.assign("o2")
+
+    assert {first.courier_id, second.courier_id} == {"c0", "c1"}
+    assert not dispatcher.has_available()
+    assert dispatcher.courier(first.courier_id).current_load == 1
+    with pytest.raises(NoCouriersAvailable):
+        dispatcher.assign("o3")
+
+
+def test_release_and_mark_unavailable(dispatcher: Dispatcher) -> None:
+    result = dispatcher.assign("o1")
+    dispatcher.release(result.courier_id)
+    assert dispatcher.available_count() == 2
+    assert dispatcher.courier(result.courier_id).available is True
+
+    dispatcher.mark_unavailable("c0")
+    dispatcher.mark_unavailable("c1")
+    assert not dispatcher.has_available()
+    assert dispatcher.courier("c0").available is False
+
+
+def test_strategy_sees_only_available_couriers(dispatcher: Dispatcher) -> None:
+    dispatcher.set_strategy(Nearest())
+
+    result = dispatcher.assign("o1", Coordinates(8, 8))
+
+    assert result.courier_id == "c1"
+    assert result.strategy_name == "Nearest"
+    assert result.eta == pytest.approx(distance(Coordinates(5, 5), Coordinates(8, 8)) / 20.0)
+
+
+def test_unknown_courier_lookup_raises(dispatcher: Dispatcher) -> None:
+    with pytest.raises(CourierUnavailable):
+        dispatcher.courier("ghost")
+    with pytest.raises(CourierUnavailable):
+        dispatcher.release("ghost")
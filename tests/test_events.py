@@ -0,0 +1,85 @@
+import pytest
+
+from src.pizza.domain.delivery import Coordinates, Courier, Dispatcher, Vehicle
+from src.pizza.domain.errors import InvalidTransition
+from src.pizza.domain.events import OrderEventLog, StatusCounts, StuckOrders, TimeInStatus
+from src.pizza.domain.status import OrderStatus
+
+
+def test_transitions_emit_events_and_update_projections(make_order, clock) -> None:
+    counts, durations = StatusCounts(), TimeInStatus()
+    log = OrderEventLog([counts, durations], clock=clock)
+    first, second = make_order(), make_order()
+    log.track(first)
+    log.track(second)
+
+    clock.now = 60
+    first.accept()
+    clock.now = 90
+    second.accept()
+    second.cancel()
+    with pytest.raises(InvalidTransition):
+        first.box()
+
+    assert [(e.previous, e.status) for e in log.events(after=1)] == [
+        (OrderStatus.NEW, OrderStatus.ACCEPTED),
+        (OrderStatus.NEW, OrderStatus.ACCEPTED),
+        (OrderStatus.ACCEPTED, OrderStatus.CANCELED),
+    ]
+    assert counts[OrderStatus.NEW] == 0
+    assert counts[OrderStatus.ACCEPTED] == counts[OrderStatus.CANCELED] == 1
+    assert durations.average(OrderStatus.NEW) == 75
+    assert durations.average(OrderStatus.ACCEPTED) == 0
+    assert durations.average(OrderStatus.BAKING) == 0.0
+
+
+def test_stuck_orders_oldest_first(make_order, clock) -> None:
+    stuck = StuckOrders(OrderStatus.BOXED, threshold=600)
+    log = OrderEventLog([stuck], clock=clock)
+    orders = [make_order(status=OrderStatus.BAKING) for _ in range(3)]
+    for minute, order in enumerate(orders):
+        log.track(order)
+        clock.now = minute * 300
+        order.box()
+
+    assert stuck.stuck(now=700) == [str(orders[0].id)]
+    assert stuck.stuck(now=1000) == [str(orders[0].id), str(orders[1].id)]
+    bike = Vehicle(kind="bike", speed_coef=1.0)
+    orders[0].dispatch(Dispatcher([Courier("c1", Coordinates(0, 0), bike, available=True)]))
+    assert stuck.stuck(now=1000) == [str(orders[1].id)]
+    assert len(stuck) == 2
+
+
+def test_replay_rebuilds_projections(make_order) -> None:
+    log = OrderEventLog([StatusCounts()])
+    orders = [make_order() for _ in range(10)]
+    for order in orders:
+        log.track(order)
+    for order in orders[:4]:
+        order.accept()
+
+    rebuilt = StatusCounts()
+    log.replay([rebuilt])
+    assert rebuilt.as_dict() == log.projections[0].as_dict()
+
+    restored = OrderEventLog([StatusCounts()], events=log.events())
+    assert len(restored) == 14
+    assert restored.projections[0][OrderStatus.ACCEPTED] == 4
+
+
+def test_track_is_idempotent_per_order(make_order) -> None:
+    counts = StatusCounts()
+    log = OrderEventLog([counts])
+    order = make_order()
+    log.track(order)
+    log.track(order)
+    order.accept()
+
+    assert len(log) == 2
+    assert counts[OrderStatus.NEW] == 0
+    assert counts[OrderStatus.ACCEPTED] == 1
+
+    restored = OrderEventLog([StatusCounts()], events=log.events())
+    restored.track(order)
+    assert len(restored) == 2
+    assert restored.projections[0][OrderStatus.ACCEPTED] == 1
@@ -0,0 +1,122 @@
+import asyncio
+import threading
+import time
+from decimal import Decimal
+
+import pytest
+
+from src.pizza.domain.errors import PaymentNotAuthorized
+from src.pizza.domain.idempotency import (
+    AsyncIdempotentPayment,
+    IdempotencyStore,
+    IdempotentPayment,
+)
+from src.pizza.domain.order import Order
+from src.pizza.domain.payment import PaymentAuthResult, PaymentCaptureResult
+from src.pizza.infra.mock_provider import MockPaymentProvider
+from src.pizza.infra.payment_client import AsyncPaymentClient
+
+
+class CountingCard:
+    method = "card"
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.calls = 0
+        self.delay = delay
+        self.fail_capture = False
+
+    def authorize(self, order: Order) -> PaymentAuthResult:
+        self.calls += 1
+        time.sleep(self.delay)
+        return PaymentAuthResult(f"p-{order.id}", "authorized", order.final_total(), "card")
+
+    def capture(self, order: Order, amount: Decimal) -> PaymentCaptureResult:
+        self.calls += 1
+        if self.fail_capture:
+            raise PaymentNotAuthorized()
+        return PaymentCaptureResult(f"p-{order.id}", "captured", amount, "card")
+
+    def refund(self, order, amount):
+        raise NotImplementedError
+
+
+def test_store_is_lru_with_ttl(clock) -> None:
+    store: IdempotencyStore[str] = IdempotencyStore(max_entries=2, ttl=10, clock=clock)
+    store.put("a", "A")
+    store.put("b", "B")
+    assert store.get("a") == "A"
+    store.put("c", "C")
+
+    assert store.get("b") is None
+    assert store.evictions == 1
+    clock.now = 11
+    assert store.get("a") is None
+    assert store.expired == 1
+
+
+def test_repeated_call_is_served_from_store(make_order) -> None:
+    card = CountingCard()
+    payment = IdempotentPayment(card)
+    order = make_order()
+
+    first = payment.authorize(order)
+    second = payment.authorize(order)
+    payment.capture(order, Decimal("1"))
+    payment.capture(order, Decimal("1.00"))
+    payment.capture(order, Decimal("2.00"))
+
+    assert first is second
+    assert card.calls == 3
+    stats = payment.stats()
+    assert (stats.hits, stats.misses) == (2, 3)
+    assert stats.hit_rate == pytest.approx(2 / 5)
+
+
+def test_errors_are_not_cached(make_order) -> None:
+    card = CountingCard()
+    card.fail_capture = True
+    payment = IdempotentPayment(card)
+    order = make_order()
+
+    for _ in range(2):
+        with pytest.raises(PaymentNotAuthorized):
+            payment.capture(order, Decimal("1"))
+    assert card.calls == 2
+
+
+def test_concurrent_threads_share_one_call(make_order) -> None:
+    card = CountingCard(delay=0.05)
+    payment = IdempotentPayment(card)
+    order = make_order()
+    results = []
+
+    threads = [
+        threading.Thread(target=lambda: results.append(payment.authorize(order))) for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert card.calls == 1
+    assert len({id(result) for result in results}) == 1
+    assert payment.stats().coalesced + payment.stats().hits == 7
+
+
+def test_async_duplicates_are_coalesced(make_order) -> None:
+    async def scenario() -> None:
+        async with MockPaymentProvider(latency=0.02) as provider:
+            async with AsyncPaymentClient(provider.host, provider.port) as client:
+                payment = AsyncIdempotentPayment(client)
+                order = make_order()
+                order.final_total = lambda: Decimal("12.50")  # type: ignore[method-assign]
+
+                results = await asyncio.gather(*(payment.authorize(order) for _ in range(10)))
+                again = await payment.authorize(order)
+
+                assert provider.calls["authorize"] == 1
+                assert {result.payment_id for result in results} == {again.payment_id}
+                stats = payment.stats()
+                assert (stats.misses, stats.coalesced, stats.hits) == (1, 9, 1)
+
+    asyncio.run(scenario())
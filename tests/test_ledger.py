@@ -0,0 +1,83 @@
+import os
+import uuid
+from decimal import Decimal
+
+from src.pizza.domain.payment import PaymentAuthResult, PaymentCaptureResult, PaymentRefundResult
+from src.pizza.domain.types import OrderId
+from src.pizza.infra.ledger import RECORD, PaymentLedger
+
+
+def test_payment_record_is_rebuilt_from_events(tmp_path) -> None:
+    order_id = str(OrderId.generate())
+    with PaymentLedger(tmp_path / "payments.log") as ledger:
+        ledger.record_authorize(
+            order_id, PaymentAuthResult("pay-1", "authorized", Decimal("25.50"), "card")
+        )
+        ledger.record_capture(
+            order_id, PaymentCaptureResult("pay-1", "captured", Decimal("25.50"), "card")
+        )
+        ledger.record_refund(
+            order_id, PaymentRefundResult("pay-1", "partial-refund", Decimal("5.25"), "card")
+        )
+        record = ledger.payment_record(order_id)
+
+        assert ledger.payment_record(str(OrderId.generate())) is None
+
+    assert record is not None
+    assert (record.payment_id, record.method) == ("pay-1", "card")
+    assert record.status == "partial-refund"
+    assert record.authorized_amount == "25.50"
+    assert record.captured_amount == "25.50"
+    assert record.refunded_amount == "5.25"
+    assert [line.split()[1] for line in record.history] == ["authorize", "capture", "refund"]
+
+
+def test_replayed_results_are_counted_once(tmp_path) -> None:
+    order_id = str(OrderId.generate())
+    auth = PaymentAuthResult("pay-1", "authorized", Decimal("20.00"), "card")
+    capture = PaymentCaptureResult("pay-1", "captured", Decimal("20.00"), "card")
+    refund = PaymentRefundResult("pay-1", "partial-refund", Decimal("5.00"), "card")
+    requests = [str(uuid.uuid4()) for _ in range(2)]
+    with PaymentLedger(tmp_path / "payments.log") as ledger:
+        for _ in range(2):
+            ledger.record_authorize(order_id, auth, requests[0])
+            ledger.record_capture(order_id, capture, requests[1])
+        ledger.record_refund(order_id, refund)  # two separate refunds of the same amount
+        ledger.record_refund(order_id, refund)
+        record = ledger.payment_record(order_id)
+
+    assert record is not None
+    assert (record.authorized_amount, record.captured_amount) == ("20.00", "20.00")
+    assert (record.refunded_amount, record.status) == ("10.00", "partial-refund")
+    replays = [line.endswith("replay") for line in record.history]
+    assert replays == [False, False, True, True, False, False]
+
+
+def test_records_are_fixed_width_and_survive_reopen(tmp_path) -> None:
+    path = tmp_path / "payments.log"
+    ids = [str(OrderId.generate()) for _ in range(50)]
+    with PaymentLedger(path) as ledger:
+        for i, order_id in enumerate(ids):
+            ledger.append(order_id, "authorize", Decimal(i), "online", f"p{i}")
+        ledger.flush()
+
+    assert os.path.getsize(path) == 50 * RECORD.size
+    with PaymentLedger(path) as ledger:
+        assert len(ledger) == 50
+        assert ledger.events(ids[7])[0].amount_cents == 700
+        ledger.append(ids[7], "capture", Decimal("7"), "online", "p7")
+        assert ledger.payment_record(ids[7]).status == "captured"
+
+
+def test_torn_tail_is_truncated(tmp_path) -> None:
+    path = tmp_path / "payments.log"
+    order_id = str(OrderId.generate())
+    with PaymentLedger(path) as ledger:
+        ledger.append(order_id, "authorize", Decimal("10"), "card", "p1")
+    with open(path, "ab") as handle:
+        handle.write(b"\x01" * (RECORD.size // 2))
+
+    with PaymentLedger(path) as ledger:
+        assert len(ledger) == 1
+        assert os.path.getsize(path) == RECORD.size
+        assert ledger.payment_record(order_id).authorized_amount == "10.00"
@@ -0,0 +1,108 @@
+import os
+from decimal import Decimal
+
+import pytest
+
+from src.pizza.domain.errors import OrderNotFound
+from src.pizza.domain.inventory import Ingredient, IngredientRequirement
+from src.pizza.domain.menu import Menu
+from src.pizza.domain.products import Pizza, PizzaSize, Topping
+from src.pizza.domain.repository import PaymentRecord
+from src.pizza.domain.status import OrderStatus
+from src.pizza.domain.types import OrderId
+from src.pizza.infra.log_store import LogStructuredOrderRepository
+
+
+@pytest.fixture
+def menu() -> Menu:
+    dough = IngredientRequirement(Ingredient(name="Dough", unit="kg"), Decimal("1"))
+    return Menu(
+        pizzas=[Pizza("Margherita", Decimal("10.00"), "pz-mar", [dough])],
+        toppings=[Topping("Olives", Decimal("1.00"), "tp-oli")],
+    )
+
+
+LARGE_WITH_OLIVES = ("pz-mar", PizzaSize.LARGE, 2, ["tp-oli"])
+
+
+def test_latest_version_wins_and_survives_reopen(tmp_path, menu, make_order) -> None:
+    path = tmp_path / "orders.log"
+    order = make_order(LARGE_WITH_OLIVES)
+    with LogStructuredOrderRepository(path, menu) as repo:
+        order_id = repo.save(order)
+        order.accept()
+        repo.save(order)
+        repo.link_courier(order_id, "c1")
+        repo.record_payment(order_id, PaymentRecord("p1", "card", "24", "0", "0", "authorized"))
+        assert repo.get(order_id).status is OrderStatus.ACCEPTED
+        assert repo.stats().garbage_bytes > 0
+
+    with LogStructuredOrderRepository(path, menu) as repo:
+        loaded = repo.get(order_id)
+        assert loaded.status is OrderStatus.ACCEPTED
+        assert loaded.subtotal() == order.subtotal()
+        assert repo.find_by_status(OrderStatus.NEW) == ()
+        assert [str(o.id) for o in repo.find_by_status(OrderStatus.ACCEPTED)] == [order_id]
+        assert repo.courier_of(order_id) == "c1"
+        record = repo.payment_record(order_id)
+        assert record is not None and record.status == "authorized"
+        with pytest.raises(OrderNotFound):
+            repo.get(str(OrderId.generate()))
+
+
+def test_torn_final_write_is_truncated_on_recovery(tmp_path, menu, make_order) -> None:
+    path = tmp_path / "orders.log"
+    with LogStructuredOrderRepository(path, menu) as repo:
+        ids = [repo.save(make_order(LARGE_WITH_OLIVES)) for _ in range(5)]
+        intact = repo.stats().file_bytes
+        repo.save(make_order(LARGE_WITH_OLIVES))
+    os.truncate(path, os.path.getsize(path) - 7)
+
+    with LogStructuredOrderRepository(path, menu) as repo:
+        assert len(repo.list_all()) == 5
+        assert repo.stats().file_bytes == intact == os.path.getsize(path)
+        assert repo.get(ids[-1]).customer == "test-user"
+        repo.save(make_order(LARGE_WITH_OLIVES))
+    with LogStructuredOrderRepository(path, menu) as repo:
+        assert len(repo.list_all()) == 6
+
+
+def test_corrupt_tail_record_is_dropped(tmp_path, menu, make_order) -> None:
+    path = tmp_path / "orders.log"
+    with LogStructuredOrderRepository(path, menu) as repo:
+        repo.save(make_order(LARGE_WITH_OLIVES))
+        repo.save(make_order(LARGE_WITH_OLIVES))
+    with open(path, "r+b") as file:
+        file.seek(-3, os.SEEK_END)
+        file.write(b"\xff\xff\xff")
+
+    with LogStructuredOrderRepository(path, menu) as repo:
+        assert len(repo.list_all()) == 1
+
+
+def test_compaction_drops_superseded_versions(tmp_path, menu, make_order) -> None:
+    path = tmp_path / "orders.log"
+    with LogStructuredOrderRepository(path, menu) as repo:
+        orders = [make_order(LARGE_WITH_OLIVES) for _ in range(20)]
+        for _ in range(5):
+            for order in orders:
+                repo.save(order)
+        orders[0].accept()
+        repo.save(orders[0])
+        before = repo.stats()
+
+        thread = repo.compact(background=True)
+        assert thread is not None
+        extra = make_order(LARGE_WITH_OLIVES)
+        repo.save(extra)
+        thread.join()
+
+        after = repo.stats()
+        assert after.file_bytes < before.file_bytes / 4
+        assert after.garbage_bytes == 0
+        assert len(repo.list_all()) == 21
+        assert repo.get(str(orders[0].id)).status is OrderStatus.ACCEPTED
+        assert repo.get(str(extra.id)).customer == "test-user"
+
+    with LogStructuredOrderRepository(path, menu) as repo:
+        assert repo.stats() == after
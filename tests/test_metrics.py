@@ -0,0 +1,134 @@
+import asyncio
+import threading
+
+import pytest
+
+from benchmarks.payment_authorize import make_orders
+from src.pizza.domain import metrics
+from src.pizza.domain.errors import MenuItemNotFound, NoCouriersAvailable
+from src.pizza.domain.metrics import Histogram, Registry
+from src.pizza.domain.order import Order
+from src.pizza.domain.products import PizzaSize
+
+
+@pytest.fixture
+def registry() -> Registry:
+    return Registry()
+
+
+def test_histogram_buckets_bound_values_within_an_eighth():
+    for value in [1, 15, 16, 17, 1_000, 123_456, 2**39 + 12_345]:
+        index = Histogram.index(value)
+        assert Histogram.upper_bound(index - 1) < value <= Histogram.upper_bound(index)
+        assert Histogram.upper_bound(index) <= value * 1.125 + 1
+
+    histogram = Histogram()
+    for value in range(1, 1001):
+        histogram.record(value * 1_000)
+    assert histogram.count == 1000
+    assert 500_000 <= histogram.percentile(50) <= 500_000 * 1.125
+    assert histogram.percentile(100) == histogram.max == 1_000_000
+
+
+def test_disabled_methods_are_the_original_functions(registry):
+    class Kitchen:
+        @registry.instrumented("kitchen.fire")
+        def fire(self, n: int) -> int:
+            return n * 2
+
+    original = Kitchen.__dict__["fire"]
+    assert Kitchen().fire(2) == 4 and registry.snapshot().histograms == {}
+
+    registry.enable()
+    assert Kitchen.__dict__["fire"] is not original
+    assert Kitchen().fire(3) == 6
+    registry.disable()
+    assert Kitchen.__dict__["fire"] is original
+    Kitchen().fire(4)
+
+    assert registry.snapshot().histograms["kitchen.fire"].count == 1
+
+
+def test_errors_counted_by_domain_class_and_timer(registry):
+    class Fleet:
+        @registry.instrumented("fleet.assign")
+        def assign(self, error: Exception) -> None:
+            raise error
+
+        @registry.instrumented("fleet.ping")
+        async def ping(self) -> str:
+            await asyncio.sleep(0)
+            return "pong"
+
+    registry.enable()
+    for error in (NoCouriersAvailable(), NoCouriersAvailable(), KeyError("k")):
+        with pytest.raises(type(error)):
+            Fleet().assign(error)
+    assert asyncio.run(Fleet().ping()) == "pong"
+    with pytest.raises(ValueError):
+        with registry.timer("block"):
+            raise ValueError
+    with registry.timer("block"):
+        pass
+
+    snapshot = registry.snapshot()
+    assert snapshot.errors == {
+        ("fleet.assign", "NoCouriersAvailable"): 2,
+        ("fleet.assign", "other"): 1,
+        ("block", "other"): 1,
+    }
+    assert snapshot.histograms["fleet.assign"].count == 3
+    assert snapshot.histograms["fleet.ping"].count == 1
+    assert snapshot.histograms["block"].count == 2
+
+
+def test_threads_record_separately_and_snapshot_merges(registry):
+    registry.enable()
+
+    def work() -> None:
+        for _ in range(1000):
+            with registry.timer("work"):
+                pass
+
+    work()
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert registry.snapshot().histograms["work"].count == 5000
+    assert len(registry._threads) == 1  # ended threads were folded into one aggregate
+    registry.reset()
+    assert registry.snapshot().histograms == {}
+
+
+def test_domain_hot_paths_export_prometheus_text():
+    order = make_orders(1)[0]
+    metrics.enable()
+    try:
+        metrics.reset()
+        order.add_item("pz-mar", PizzaSize.SMALL, 1, ())
+        with pytest.raises(MenuItemNotFound):
+            order.add_item("pz-none", PizzaSize.SMALL, 1, ())
+        order.final_total()
+        assert hasattr(Order.add_item, "__wrapped__")
+        text = metrics.prometheus_text()
+    finally:
+        metrics.disable()
+        metrics.reset()
+    assert not hasattr(Order.add_item, "__wrapped__")
+
+    assert "# TYPE pizza_operation_duration_seconds histogram" in text
+    assert 'pizza_operation_duration_seconds_count{operation="order.add_item"} 2' in text
+    assert 'pizza_operation_duration_seconds_bucket{operation="order.add_item",le="+Inf"} 2' in text
+    assert 'pizza_operation_duration_seconds_count{operation="order.final_total"} 1' in text
+    assert (
+        'pizza_domain_errors_total{operation="order.add_item",error="MenuItemNotFound"} 1' in text
+    )
+    counts = [
+        int(line.rsplit(" ", 1)[1])
+        for line in text.splitlines()
+        if line.startswith('pizza_operation_duration_seconds_bucket{operation="order.add_item"')
+    ]
+    assert counts == sorted(counts)
@@ -1,5 +1,56 @@
+from decimal import Decimal
+
 import pytest
 
+from src.pizza.domain.delivery import Coordinates, Courier, Dispatcher, Vehicle
+from src.pizza.domain.errors import (
+    AlreadyFinalized,
+    InsufficientIngredients,
+    InvalidTransition,
+    OvenCapacityExceeded,
+)
+from src.pizza.domain.events import OrderEventLog, StatusCounts
+from src.pizza.domain.inventory import (
+    BatchOven,
+    Ingredient,
+    IngredientRequirement,
+    InMemoryInventory,
+)
+from src.pizza.domain.menu import Menu
+from src.pizza.domain.order import Order, accept_all, cancel_all, transition_all
+from src.pizza.domain.products import Pizza, PizzaSize, Topping
+from src.pizza.domain.status import OUTCOMES, OrderStatus, TransitionOutcome
+from src.pizza.domain.types import OrderId
+
+CAN = {
+    "ACCEPTED": "can_accept",
+    "BAKING": "can_bake",
+    "BOXED": "can_box",
+    "DISPATCHED": "can_dispatch",
+    "DELIVERED": "can_deliver",
+    "CANCELED": "can_cancel",
+}
+
+
+def make_dispatcher() -> Dispatcher:
+    bike = Vehicle(kind="bike", speed_coef=1.0)
+    return Dispatcher([Courier(id="c1", location=Coordinates(0, 0), vehicle=bike, available=True)])
+
+
+def move(order: Order, target: str) -> None:
+    if target == "ACCEPTED":
+        order.accept()
+    elif target == "BOXED":
+        order.box()
+    elif target == "DISPATCHED":
+        order.dispatch(make_dispatcher())
+    elif target == "DELIVERED":
+        order.deliver()
+    elif target == "CANCELED":
+        order.cancel()
+    else:
+        raise AssertionError(f"no direct transition method for {target}")
+
 
 @pytest.mark.parametrize(
     "path",
@@ -19,21 +70,116 @@ import pytest
         ("DISPATCHED", "CANCELED"),
     ],
 )
-@pytest.mark.xfail(reason="transitions not implemented yet")
-def test_invalid_transitions_raise(path):
+def test_invalid_transitions_raise(path, make_order):
     """Invalid Transitions raises error."""
-    ...
+    source, target = path
+    order = make_order(status=OrderStatus[source])
+
+    assert getattr(order, CAN[target])() is False
+    if target != "BAKING":
+        with pytest.raises(InvalidTransition):
+            move(order, target)
+    assert order.status is OrderStatus[source]
 
 
 @pytest.mark.parametrize("final_status", ["DELIVERED", "CANCELED"])
-@pytest.mark.xfail(reason="finalization rules not implemented")
-def test_no_changes_after_final(final_status):
+def test_no_changes_after_final(final_status, make_order):
     """No changes available after DELIVERED/CANCELED."""
-    ...
+    for target in ("ACCEPTED", "BOXED", "DISPATCHED", "DELIVERED", "CANCELED"):
+        order = make_order(status=OrderStatus[final_status])
+        with pytest.raises(AlreadyFinalized):
+            move(order, target)
+        assert order.status is OrderStatus[final_status]
 
 
-@pytest.mark.xfail(reason="workflow not implemented")
-def test_happy_path():
+def test_happy_path(make_order):
     """Expected chain."""
-    # chain = ["NEW", "ACCEPTED", "BAKING", "BOXED", "DISPATCHED", "DELIVERED"]
-    ...
+    order = make_order()
+    order.accept()
+    assert order.can_bake()
+    order.status = OrderStatus.BAKING  # bake() needs inventory and oven
+    order.box()
+    result = order.dispatch(make_dispatcher())
+    order.deliver()
+
+    assert result.courier_id == "c1"
+    assert order.status is OrderStatus.DELIVERED
+
+
+def test_bake_consumes_ingredients_and_releases_them_on_oven_failure(make_order):
+    dough, basil = Ingredient("Dough", "kg"), Ingredient("Basil", "g")
+    menu = Menu(
+        pizzas=[
+            Pizza("Margherita", Decimal("10"), "pz", [IngredientRequirement(dough, Decimal("1"))])
+        ],
+        toppings=[
+            Topping("Basil", Decimal("1"), "tp", [IngredientRequirement(basil, Decimal("5"))])
+        ],
+    )
+    order = Order(menu, OrderId.generate(), "c", Coordinates(0, 0), [], OrderStatus.ACCEPTED, None)
+    order.add_item("pz", PizzaSize.LARGE, 2, ("tp",))
+    assert order.compute_total_requirements() == {dough: Decimal("2.5"), basil: Decimal("10")}
+    assert len(order.to_units()) == 2
+
+    inventory = InMemoryInventory({dough: Decimal("3"), basil: Decimal("10")})
+    with pytest.raises(OvenCapacityExceeded):
+        order.bake(inventory, OvenRejectingBatches(1))
+    assert order.status is OrderStatus.ACCEPTED
+    assert inventory.availability({dough: Decimal("3")})
+
+    oven = BatchOven(capacity=4)
+    order.bake(inventory, oven)
+    assert order.status is OrderStatus.BAKING
+    assert oven.baked == 2
+    assert inventory.current_stock() == {dough: Decimal("0.5"), basil: Decimal("0")}
+
+    again = make_order(status=OrderStatus.ACCEPTED)
+    again.menu = menu
+    again.add_item("pz", PizzaSize.SMALL, 1, ())
+    with pytest.raises(InsufficientIngredients):
+        again.bake(inventory, oven)
+    assert again.status is OrderStatus.ACCEPTED
+
+
+class OvenRejectingBatches(BatchOven):
+    def can_bake(self, count: int) -> bool:
+        return True
+
+
+def test_outcome_table_matches_transition_methods(make_order):
+    """Every (status, target) pair agrees with the can_* checks."""
+    for status in OrderStatus:
+        for target, can in CAN.items():
+            allowed = getattr(make_order(status=status), can)()
+            outcome = OUTCOMES[status][OrderStatus[target]]
+            assert (outcome is TransitionOutcome.APPLIED) is allowed
+            if status in (OrderStatus.DELIVERED, OrderStatus.CANCELED):
+                assert outcome is TransitionOutcome.FINALIZED
+
+
+def test_bulk_transitions_report_outcomes_without_raising(make_order):
+    """accept_all/cancel_all apply what they can and report the rest."""
+    orders = [
+        make_order(status=OrderStatus[status]) for status in ("NEW", "ACCEPTED", "DELIVERED", "NEW")
+    ]
+    counts = StatusCounts()
+    log = OrderEventLog([counts])
+    for order in orders:
+        log.track(order)
+
+    assert accept_all(orders) == [
+        TransitionOutcome.APPLIED,
+        TransitionOutcome.INVALID,
+        TransitionOutcome.FINALIZED,
+        TransitionOutcome.APPLIED,
+    ]
+    assert cancel_all(orders[:2]) == [TransitionOutcome.APPLIED, TransitionOutcome.APPLIED]
+    assert [order.status for order in orders] == [
+        OrderStatus.CANCELED,
+        OrderStatus.CANCELED,
+        OrderStatus.DELIVERED,
+        OrderStatus.ACCEPTED,
+    ]
+    assert counts[OrderStatus.CANCELED] == 2 and counts[OrderStatus.ACCEPTED] == 1
+    with pytest.raises(ValueError):
+        transition_all(orders, OrderStatus.DISPATCHED)
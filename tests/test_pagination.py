@@ -0,0 +1,119 @@
+import tracemalloc
+from typing import Callable
+
+import pytest
+
+from src.pizza.domain.order import Order
+from src.pizza.domain.products import PizzaSize
+from src.pizza.domain.repository import InMemoryOrderRepository, ShardedOrderRepository
+from src.pizza.domain.status import OrderStatus
+from src.pizza.infra.log_store import LogStructuredOrderRepository
+from src.pizza.infra.sqlite_repository import SQLiteOrderRepository
+
+
+@pytest.fixture
+def make_orders(make_order) -> Callable[[int], list[Order]]:
+    """``make_orders(count)``: one medium Margherita each, every third one ACCEPTED."""
+
+    def make(count: int) -> list[Order]:
+        return [
+            make_order(
+                ("pz-mar", PizzaSize.MEDIUM, 1, []),
+                customer=f"c{i}",
+                status=OrderStatus.ACCEPTED if i % 3 == 0 else OrderStatus.NEW,
+            )
+            for i in range(count)
+        ]
+
+    return make
+
+
+@pytest.fixture(params=["memory", "sharded", "sqlite", "log"])
+def repo(request, tmp_path, menu):
+    if request.param == "memory":
+        yield InMemoryOrderRepository()
+    elif request.param == "sharded":
+        yield ShardedOrderRepository(shards=4)
+    elif request.param == "sqlite":
+        with SQLiteOrderRepository(tmp_path / "orders.db", menu) as repo:
+            yield repo
+    else:
+        with LogStructuredOrderRepository(tmp_path / "orders.log", menu) as repo:
+            yield repo
+
+
+def test_pages_cover_every_order_once_and_resume(repo, make_orders) -> None:
+    orders = make_orders(250)
+    for order in orders:
+        repo.save(order)
+
+    streamed = [str(order.id) for order in repo.iter_all(page_size=40)]
+    assert sorted(streamed) == sorted(str(order.id) for order in orders)
+
+    first = repo.page_all(limit=100)
+    assert first.cursor is not None
+    resumed = [str(order.id) for order in repo.iter_all(first.cursor, page_size=40)]
+    assert [str(order.id) for order in first.orders] + resumed == streamed
+
+    accepted = [str(order.id) for order in repo.iter_by_status(OrderStatus.ACCEPTED, page_size=7)]
+    expected = {str(order.id) for order in orders if order.status is OrderStatus.ACCEPTED}
+    assert len(accepted) == len(expected) and set(accepted) == expected
+    assert repo.page_by_status(OrderStatus.DELIVERED).orders == ()
+
+
+def test_new_orders_during_paging_are_not_repeated(repo, make_orders) -> None:
+    for order in make_orders(30):
+        repo.save(order)
+    page = repo.page_all(limit=10)
+    for order in make_orders(5):
+        repo.save(order)
+
+    rest = [str(order.id) for order in repo.iter_all(page.cursor, page_size=10)]
+    seen = [str(order.id) for order in page.orders] + rest
+    assert len(seen) == len(set(seen)) >= 30
+
+
+@pytest.mark.parametrize("kind", ["memory", "log"])
+def test_status_pages_follow_status_changes(kind, tmp_path, menu, make_orders) -> None:
+    if kind == "memory":
+        repo = InMemoryOrderRepository()
+    else:
+        repo = LogStructuredOrderRepository(tmp_path / "orders.log", menu)
+    orders = make_orders(100)  # every third order is ACCEPTED: 34 of them
+    for order in orders:
+        repo.save(order)
+
+    everything = repo.page_by_status(OrderStatus.ACCEPTED, limit=34)
+    assert len(everything.orders) == 34 and everything.cursor is None
+
+    first = repo.page_by_status(OrderStatus.ACCEPTED, limit=10)
+    orders[1].accept()  # behind the cursor: not returned
+    orders[98].accept()  # ahead of it: returned once
+    repo.save(orders[1])
+    repo.save(orders[98])
+    orders[99].cancel()  # was ACCEPTED, now left out
+    repo.save(orders[99])
+    rest = list(repo.iter_by_status(OrderStatus.ACCEPTED, first.cursor, page_size=7))
+
+    ids = [str(order.id) for order in list(first.orders) + rest]
+    assert ids == [str(o.id) for i, o in enumerate(orders) if (i % 3 == 0 and i != 99) or i == 98]
+    if kind == "log":
+        repo.close()
+
+
+def test_streaming_peak_memory_is_bounded_by_page_size(tmp_path, menu, make_orders) -> None:
+    with SQLiteOrderRepository(tmp_path / "orders.db", menu) as repo:
+        for _ in range(10):
+            repo.save_many(make_orders(5_000))
+
+        def peak(consume) -> int:
+            tracemalloc.start()
+            consume()
+            _, top = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            return top
+
+        streamed = peak(lambda: sum(1 for _ in repo.iter_all(page_size=500)))
+        materialized = peak(lambda: len(repo.list_all()))
+
+    assert streamed * 20 < materialized
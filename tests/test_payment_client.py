@@ -0,0 +1,125 @@
+import asyncio
+from decimal import Decimal
+
+import pytest
+
+from src.pizza.domain.errors import (
+    PaymentAmountMismatch,
+    PaymentNotAuthorized,
+    PaymentProviderError,
+    PaymentTimeout,
+    RefundExceedsCapture,
+)
+from src.pizza.domain.payment import PaymentAuthResult
+from src.pizza.domain.products import PizzaSize
+from src.pizza.infra.mock_provider import MockPaymentProvider
+from src.pizza.infra.payment_client import AsyncPaymentClient
+
+TWO_MEDIUM = ("pz-mar", PizzaSize.MEDIUM, 2, ())  # 20.00 on the default menu
+
+
+def test_authorize_capture_refund_flow(make_order) -> None:
+    async def scenario() -> None:
+        async with MockPaymentProvider() as provider:
+            async with AsyncPaymentClient(provider.host, provider.port) as client:
+                order = make_order(TWO_MEDIUM)
+                auth = await client.authorize(order)
+                again = await client.authorize(order)
+                capture = await client.capture(order, Decimal("20.00"))
+                partial = await client.refund(order, Decimal("5.00"))
+                with pytest.raises(RefundExceedsCapture):
+                    await client.refund(order, Decimal("20.00"))
+
+                assert (auth.status, auth.amount, auth.method) == (
+                    "authorized",
+                    Decimal("20.00"),
+                    "card",
+                )
+                assert again.status == "already-authorized"
+                assert again.payment_id == auth.payment_id
+                assert capture.status == "captured"
+                assert partial.status == "partial-refund"
+                assert provider.connections == 1
+
+    asyncio.run(scenario())
+
+
+def test_provider_errors_map_to_domain_errors(make_order) -> None:
+    async def scenario() -> None:
+        async with MockPaymentProvider() as provider:
+            async with AsyncPaymentClient(provider.host, provider.port) as client:
+                order = make_order(TWO_MEDIUM)
+                with pytest.raises(PaymentNotAuthorized):
+                    await client.capture(order, Decimal("1.00"))
+                await client.authorize(order)
+                with pytest.raises(PaymentAmountMismatch):
+                    await client.capture(order, Decimal("99.00"))
+
+    asyncio.run(scenario())
+
+
+def test_concurrent_authorize_is_bounded_by_pool(make_order) -> None:
+    async def scenario() -> None:
+        async with MockPaymentProvider(latency=0.05) as provider:
+            async with AsyncPaymentClient(provider.host, provider.port, pool_size=10) as client:
+                orders = [make_order(TWO_MEDIUM) for _ in range(40)]
+                results = await client.authorize_many(orders)
+
+                assert all(isinstance(result, PaymentAuthResult) for result in results)
+                assert client.pool.opened == 10
+                assert 1 < provider.max_in_flight <= 10
+                assert provider.in_flight == 0
+
+    asyncio.run(scenario())
+
+
+def test_slow_provider_times_out(make_order) -> None:
+    async def scenario() -> None:
+        async with MockPaymentProvider(latency=5.0) as provider:
+            async with AsyncPaymentClient(provider.host, provider.port, timeout=0.05) as client:
+                results = await client.authorize_many([make_order(TWO_MEDIUM)])
+                assert isinstance(results[0], PaymentTimeout)
+                assert client.pool.idle() == 0
+
+    asyncio.run(scenario())
+
+
+def test_timeout_covers_waiting_for_a_pooled_connection(make_order) -> None:
+    async def scenario() -> None:
+        async with MockPaymentProvider(latency=0.6) as provider:
+            async with AsyncPaymentClient(
+                provider.host, provider.port, pool_size=1, timeout=1.0
+            ) as client:
+                first, second = await client.authorize_many(
+                    [make_order(TWO_MEDIUM), make_order(TWO_MEDIUM)]
+                )
+                assert isinstance(first, PaymentAuthResult)
+                assert isinstance(second, PaymentTimeout)  # 0.6s queued + 0.6s call
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        b"HTTP/1.1 200 OK\r\nContent-Length: 5\r\n\r\n{bad}",
+        b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\n{}",
+        b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\n[]",
+        b"garbage\r\n\r\n",
+    ],
+)
+def test_malformed_replies_raise_provider_errors(make_order, response) -> None:
+    async def reply(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        await reader.readuntil(b"\r\n\r\n")
+        writer.write(response)
+        await writer.drain()
+        writer.close()
+
+    async def scenario() -> None:
+        server = await asyncio.start_server(reply, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server, AsyncPaymentClient("127.0.0.1", port) as client:
+            with pytest.raises(PaymentProviderError):
+                await client.authorize(make_order(TWO_MEDIUM))
+
+    asyncio.run(scenario())
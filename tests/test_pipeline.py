@@ -0,0 +1,124 @@
+import asyncio
+from decimal import Decimal
+from typing import Callable
+
+import pytest
+
+from src.pizza.domain.delivery import Coordinates, Courier, Dispatcher, Vehicle
+from src.pizza.domain.errors import InsufficientIngredients, NoCouriersAvailable
+from src.pizza.domain.inventory import BatchOven, InMemoryInventory
+from src.pizza.domain.order import Order
+from src.pizza.domain.pipeline import OrderPipeline, Stage, kitchen_stages
+from src.pizza.domain.products import PizzaSize
+from src.pizza.domain.status import OrderStatus
+
+
+@pytest.fixture
+def make_orders(make_order) -> Callable[[int], list[Order]]:
+    """``make_orders(count)``: orders of 1 to 3 large Margheritas."""
+
+    def make(count: int) -> list[Order]:
+        return [make_order(("pz-mar", PizzaSize.LARGE, 1 + i % 3, ())) for i in range(count)]
+
+    return make
+
+
+def make_dispatcher(count: int) -> Dispatcher:
+    bike = Vehicle("bike", 1.0)
+    return Dispatcher([Courier(f"k{i}", Coordinates(0, 0), bike, True) for i in range(count)])
+
+
+def test_orders_go_through_kitchen_to_door(make_orders):
+    orders = make_orders(500)
+    dough = orders[0].items_view()[0].pizza.recipe[0].ingredient
+    needed = sum(order.compute_total_requirements()[dough] for order in orders)
+    inventory = InMemoryInventory({dough: needed + 1})
+    ovens = [BatchOven(capacity=4) for _ in range(4)]
+    dispatcher = make_dispatcher(10)
+    pipeline = OrderPipeline(kitchen_stages(inventory, ovens, dispatcher, queue_size=20))
+
+    stats = asyncio.run(pipeline.run(orders))
+
+    assert pipeline.completed == 500
+    assert not pipeline.failures
+    assert all(order.status is OrderStatus.DELIVERED for order in orders)
+    assert inventory.current_stock() == {dough: 1}
+    assert sum(oven.baked for oven in ovens) == sum(len(order.to_units()) for order in orders)
+    assert dispatcher.available_count() == 10
+    assert [s.name for s in stats] == ["accept", "bake", "box", "dispatch", "deliver"]
+    for stage in stats:
+        assert stage.processed == 500
+        assert stage.queue_depth == 0
+        assert stage.max_queue_depth <= 20
+        assert stage.throughput > 0
+
+
+def test_slow_stage_blocks_submit_instead_of_buffering(make_orders):
+    gate = asyncio.Event()
+
+    async def slow(order) -> None:
+        await gate.wait()
+
+    async def noop(order) -> None:
+        pass
+
+    async def scenario() -> tuple[int, int]:
+        pipeline = OrderPipeline([Stage("fast", noop, 1, 2), Stage("slow", slow, 1, 2)])
+        await pipeline.start()
+        submitted = 0
+
+        async def feed() -> None:
+            nonlocal submitted
+            for order in make_orders(100):
+                await pipeline.submit(order)
+                submitted += 1
+
+        feeder = asyncio.create_task(feed())
+        for _ in range(50):
+            await asyncio.sleep(0)
+        blocked_at = submitted
+        gate.set()
+        await feeder
+        await pipeline.join()
+        await pipeline.stop()
+        return blocked_at, pipeline.completed
+
+    blocked_at, completed = asyncio.run(scenario())
+    # 2 queued + 1 in-flight per stage, plus the fast worker blocked on put()
+    assert blocked_at <= 7
+    assert completed == 100
+
+
+def test_failed_orders_are_reported_and_do_not_stall_the_pipeline(make_orders):
+    orders = make_orders(30)
+    dough = orders[0].items_view()[0].pizza.recipe[0].ingredient
+    inventory = InMemoryInventory({dough: Decimal("10")})
+    pipeline = OrderPipeline(kitchen_stages(inventory, [BatchOven(4)], make_dispatcher(2)))
+
+    stats = asyncio.run(pipeline.run(orders))
+
+    assert pipeline.completed + len(pipeline.failures) == 30
+    assert pipeline.failures
+    assert all(f.stage == "bake" for f in pipeline.failures)
+    assert all(isinstance(f.error, InsufficientIngredients) for f in pipeline.failures)
+    assert all(f.order.status is OrderStatus.ACCEPTED for f in pipeline.failures)
+    assert stats[1].failed == len(pipeline.failures)
+    assert inventory.current_stock()[dough] >= 0
+
+
+def test_invalid_stage_configuration():
+    async def noop(order) -> None:
+        pass
+
+    with pytest.raises(ValueError):
+        OrderPipeline([])
+    with pytest.raises(ValueError):
+        OrderPipeline([Stage("x", noop, workers=0)])
+
+
+def test_kitchen_stages_reject_an_empty_fleet_or_kitchen():
+    inventory = InMemoryInventory({})
+    with pytest.raises(NoCouriersAvailable):
+        kitchen_stages(inventory, [BatchOven(4)], make_dispatcher(0))
+    with pytest.raises(ValueError):
+        kitchen_stages(inventory, [], make_dispatcher(1))
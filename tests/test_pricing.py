@@ -0,0 +1,91 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from benchmarks.payment_authorize import make_orders
+from src.pizza.domain.delivery import Coordinates
+from src.pizza.domain.errors import (
+    CouponExpired,
+    CouponNotFirstOrder,
+    InvalidPricingOperation,
+)
+from src.pizza.domain.inventory import Ingredient, IngredientRequirement
+from src.pizza.domain.menu import Menu
+from src.pizza.domain.order import Order
+from src.pizza.domain.pricing import BuyNGetMFree, FirstOrderCoupon, NoDiscount, PercentOff
+from src.pizza.domain.products import Pizza, PizzaSize, Topping
+from src.pizza.domain.status import OrderStatus
+
+
+@pytest.fixture
+def order() -> Order:
+    order = make_orders(1)[0]  # one large Margherita, 12.50
+    order.add_item("pz-mar", PizzaSize.SMALL, 2, ())  # 7.50 each
+    return order
+
+
+def test_strategies_discount_the_subtotal(order):
+    view = order.as_view()
+    assert view.subtotal() == Decimal("27.50")
+    assert len(view.items) == 3
+
+    assert NoDiscount().apply(view).final_total == Decimal("27.50")
+    percent = PercentOff(Decimal("15")).apply(view)
+    assert (percent.discount_amount, percent.final_total) == (Decimal("4.12"), Decimal("23.38"))
+    free = BuyNGetMFree(2, 1).apply(view)
+    assert (free.discount_amount, free.final_total) == (Decimal("7.50"), Decimal("20.00"))
+    assert BuyNGetMFree(3, 1).apply(view).discount_amount == 0
+
+
+def test_buy_n_get_m_free_scope_decides_whether_toppings_are_free():
+    dough = IngredientRequirement(Ingredient("Dough", "kg"), Decimal("1"))
+    menu = Menu(
+        [Pizza("Margherita", Decimal("10.00"), "pz-mar", [dough])],
+        [Topping("Truffle", Decimal("6.00"), "tp-truffle")],
+    )
+    order = Order(menu, None, "c", Coordinates(0, 0), [], None, None)
+    order.add_item("pz-mar", PizzaSize.LARGE, 2, ())  # 12.50 each
+    order.add_item("pz-mar", PizzaSize.SMALL, 1, ["tp-truffle"])  # 7.50 + 6.00
+    view = order.as_view()
+
+    pizza_only = BuyNGetMFree(2, 1).apply(view)
+    assert pizza_only.discount_amount == Decimal("7.50")  # toppings still charged
+    whole = BuyNGetMFree(2, 1, scope="all").apply(view)
+    assert whole.discount_amount == Decimal("12.50")  # cheapest whole unit is a plain large
+
+
+def test_first_order_coupon_checks_metadata(order):
+    coupon = FirstOrderCoupon("WELCOME", Decimal("20"), expires_at=date(2030, 1, 1))
+    order.set_pricing_strategy(coupon)
+    with pytest.raises(InvalidPricingOperation):
+        order.final_total()
+
+    order.metadata.update(coupon_code="WELCOME", is_first_order=False)
+    with pytest.raises(CouponNotFirstOrder):
+        order.final_total()
+
+    order.metadata.update(is_first_order=True, today=date(2030, 1, 2))
+    with pytest.raises(CouponExpired):
+        order.final_total()
+
+    order.metadata["today"] = date(2029, 12, 31)
+    assert order.final_total() == Decimal("22.00")
+
+
+def test_pricing_strategy_is_fixed_once_baking(order):
+    order.accept()
+    order.set_pricing_strategy(PercentOff(Decimal("10")))
+    order.status = OrderStatus.BAKING
+    with pytest.raises(InvalidPricingOperation):
+        order.set_pricing_strategy(NoDiscount())
+    assert order.final_total() == Decimal("24.75")
+
+
+def test_invalid_strategy_config():
+    with pytest.raises(ValueError):
+        PercentOff(Decimal("120"))
+    with pytest.raises(ValueError):
+        BuyNGetMFree(0, 1)
+    with pytest.raises(ValueError):
+        BuyNGetMFree(2, 1, scope="drinks")
@@ -0,0 +1,299 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.pizza.domain.delivery import Coordinates
+from src.pizza.domain.errors import OrderNotFound, StaleOrderVersion
+from src.pizza.domain.menu import Menu
+from src.pizza.domain.order import Order
+from src.pizza.domain.repository import (
+    CachingOrderRepository,
+    ExecutorOrderRepository,
+    InMemoryOrderRepository,
+    PaymentRecord,
+    ShardedOrderRepository,
+)
+from src.pizza.domain.status import OrderStatus
+from src.pizza.domain.types import OrderId
+
+
+def test_save_assigns_id_and_get_returns_order(make_order) -> None:
+    repo = InMemoryOrderRepository()
+    order = make_order(with_id=False)
+    order_id = repo.save(order)
+
+    assert order_id == str(order.id)
+    assert repo.get(order_id) is order
+    assert repo.list_all() == (order,)
+    with pytest.raises(OrderNotFound):
+        repo.get(str(OrderId.generate()))
+
+
+def test_status_index_follows_upserts(make_order) -> None:
+    repo = InMemoryOrderRepository()
+    first, second = make_order(), make_order()
+    repo.save(first)
+    repo.save(second)
+    assert repo.find_by_status(OrderStatus.NEW) == (first, second)
+
+    first.accept()
+    repo.save(first)
+    repo.save(first)
+
+    assert repo.find_by_status(OrderStatus.NEW) == (second,)
+    assert repo.find_by_status(OrderStatus.ACCEPTED) == (first,)
+    assert repo.find_by_status(OrderStatus.DELIVERED) == ()
+    counts = repo.count_by_status()
+    assert (counts[OrderStatus.NEW], counts[OrderStatus.ACCEPTED]) == (1, 1)
+    assert len(repo.list_all()) == 2
+
+
+def test_status_index_follows_transitions_without_save(make_order) -> None:
+    repo = InMemoryOrderRepository()
+    first, second = make_order(), make_order()
+    repo.save(first)
+    repo.save(second)
+
+    second.accept()
+    second.cancel()
+    first.accept()
+
+    assert repo.find_by_status(OrderStatus.NEW) == ()
+    assert repo.find_by_status(OrderStatus.ACCEPTED) == (first,)
+    assert repo.find_by_status(OrderStatus.CANCELED) == (second,)
+    assert repo.page_by_status(OrderStatus.CANCELED).orders == (second,)
+
+
+def test_customer_and_courier_indexes(make_order) -> None:
+    repo = InMemoryOrderRepository()
+    a1, a2, b1 = (
+        make_order(customer="alice"),
+        make_order(customer="alice"),
+        make_order(customer="bob"),
+    )
+    for order in (a1, a2, b1):
+        repo.save(order)
+
+    repo.link_courier(str(a1.id), "c1")
+    repo.link_courier(str(b1.id), "c1")
+    repo.link_courier(str(b1.id), "c2")
+
+    assert repo.find_by_customer("alice") == (a1, a2)
+    assert repo.find_by_customer("nobody") == ()
+    assert repo.find_by_courier("c1") == (a1,)
+    assert repo.find_by_courier("c2") == (b1,)
+
+    b1.customer = "carol"
+    repo.save(b1)
+    assert repo.find_by_customer("bob") == ()
+    assert repo.find_by_customer("carol") == (b1,)
+
+    with pytest.raises(OrderNotFound):
+        repo.link_courier(str(OrderId.generate()), "c1")
+    assert repo.payment_record(str(a1.id)) is None
+
+
+def test_sharded_repository_rejects_stale_writes(make_order) -> None:
+    repo = ShardedOrderRepository(shards=4)
+    order = make_order()
+    order_id = repo.save(order, expected_version=0)
+    with pytest.raises(StaleOrderVersion):
+        repo.save(make_order(), expected_version=3)
+
+    stored, version = repo.get_versioned(order_id)
+    assert (stored.id, version) == (order.id, 1)
+    repo.save(order, expected_version=version)
+    stored.accept()
+    with pytest.raises(StaleOrderVersion) as excinfo:
+        repo.save(stored, expected_version=version)
+    assert (excinfo.value.expected, excinfo.value.actual) == (1, 2)
+    assert repo.get(order_id).status is OrderStatus.NEW  # the rejected write left no trace
+    assert repo.find_by_status(OrderStatus.ACCEPTED) == ()
+    repo.save(order)
+    assert repo.version(order_id) == 3
+    assert repo.get(order_id) is not repo.get(order_id)
+
+
+def test_sharded_repository_queries_span_shards(make_order) -> None:
+    repo = ShardedOrderRepository(shards=8)
+    orders = [make_order(customer=f"c{i % 3}") for i in range(100)]
+    for order in orders[:40]:
+        order.accept()
+    for order in orders:
+        repo.save(order)
+    repo.link_courier(str(orders[0].id), "c1")
+
+    assert len(repo) == len(repo.list_all()) == 100
+    accepted = repo.find_by_status(OrderStatus.ACCEPTED)
+    assert {order.id for order in accepted} == {order.id for order in orders[:40]}
+    assert len(repo.find_by_customer("c0")) == 34
+    assert [order.id for order in repo.find_by_courier("c1")] == [orders[0].id]
+    with pytest.raises(OrderNotFound):
+        repo.get(str(OrderId.generate()))
+
+
+def test_concurrent_conditional_saves_lose_no_updates(make_order) -> None:
+    repo = ShardedOrderRepository(shards=4)
+    ids = [repo.save(make_order()) for _ in range(8)]
+    successes = [0] * 8
+    conflicts = [0] * 8
+    barrier = threading.Barrier(8)
+
+    def worker(slot: int) -> None:
+        barrier.wait()
+        for i in range(2_000):
+            order_id = ids[i % len(ids)]
+            order, version = repo.get_versioned(order_id)
+            try:
+                repo.save(order, expected_version=version)
+            except StaleOrderVersion:
+                conflicts[slot] += 1
+            else:
+                successes[slot] += 1
+
+    threads = [threading.Thread(target=worker, args=(slot,)) for slot in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sum(successes) + sum(conflicts) == 16_000
+    assert sum(repo.version(order_id) - 1 for order_id in ids) == sum(successes)
+
+
+class SlowRepository(ShardedOrderRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.gets = 0
+
+    def get(self, order_id: str) -> Order:
+        self.gets += 1
+        time.sleep(0.05)
+        return super().get(order_id)
+
+
+def test_executor_repository_coalesces_concurrent_gets(make_order) -> None:
+    inner = SlowRepository()
+    order = make_order()
+    order_id = inner.save(order)
+    repo = ExecutorOrderRepository(inner, max_workers=4)
+
+    async def scenario() -> None:
+        results = await asyncio.gather(*(repo.get(order_id) for _ in range(20)))
+        assert len({id(result) for result in results}) == 20
+        assert {result.id for result in results} == {order.id}
+        results[1].accept()  # one caller's change is not seen by the others
+        assert results[0].status is results[2].status is OrderStatus.NEW
+        assert (inner.gets, repo.coalesced) == (1, 19)
+
+        first = asyncio.ensure_future(repo.get(order_id))
+        await asyncio.sleep(0)
+        await repo.save(order)
+        await asyncio.gather(first, repo.get(order_id))
+        assert inner.gets == 3
+
+        missing = str(OrderId.generate())
+        outcomes = await asyncio.gather(
+            repo.get(missing), repo.get(missing), return_exceptions=True
+        )
+        assert all(isinstance(outcome, OrderNotFound) for outcome in outcomes)
+
+        await repo.link_courier(order_id, "c1")
+        assert [o.id for o in await repo.find_by_status(OrderStatus.NEW)] == [order.id]
+        assert [o.id for o in await repo.list_all()] == [order.id]
+        assert await repo.payment_record(order_id) is None
+        record = PaymentRecord("p1", "cash", "1.00", "1.00", "0.00", "captured")
+        await repo.record_payment(order_id, record)
+        assert await repo.payment_record(order_id) is record
+
+    asyncio.run(scenario())
+    repo.close()
+
+
+class CountingRepository(InMemoryOrderRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.gets = 0
+
+    def get(self, order_id: str) -> Order:
+        self.gets += 1
+        return super().get(order_id)
+
+
+def test_caching_repository_read_through_and_ttl(make_order, clock) -> None:
+    inner = CountingRepository()
+    repo = CachingOrderRepository(inner, max_entries=2, ttl=10, clock=clock)
+    orders = [make_order() for _ in range(3)]
+    ids = [inner.save(order) for order in orders]
+
+    assert repo.get(ids[0]) is orders[0]
+    assert repo.get(ids[0]) is orders[0]
+    assert inner.gets == 1
+
+    repo.get(ids[1])
+    repo.get(ids[2])
+    repo.get(ids[0])
+    assert inner.gets == 4
+
+    clock.now = 11
+    repo.get(ids[0])
+    stats = repo.stats()
+    assert (stats.hits, stats.misses, inner.gets) == (1, 5, 5)
+    assert (stats.evictions, stats.expired) == (2, 1)
+    assert stats.hit_ratio == pytest.approx(1 / 6)
+
+
+def test_caching_repository_negative_cache_and_invalidation(make_order, clock) -> None:
+    inner = CountingRepository()
+    repo = CachingOrderRepository(inner, negative_ttl=1, clock=clock)
+    order = make_order()
+    order_id = str(order.id)
+
+    for _ in range(3):
+        with pytest.raises(OrderNotFound):
+            repo.get(order_id)
+    assert (inner.gets, repo.stats().negative_hits) == (1, 2)
+
+    repo.save(order)
+    assert repo.get(order_id) is order
+    assert inner.gets == 1
+
+    repo.link_courier(order_id, "c1")
+    repo.get(order_id)
+    assert inner.gets == 2
+    assert repo.find_by_status(OrderStatus.NEW) == (order,)
+
+
+def test_caching_repository_does_not_cache_a_read_overtaken_by_a_save(make_order) -> None:
+    class SlowGets(InMemoryOrderRepository):
+        reading = threading.Event()
+        resume = threading.Event()
+
+        def get(self, order_id: str) -> Order:
+            order = super().get(order_id)
+            self.reading.set()
+            self.resume.wait(5)
+            return order
+
+    inner = SlowGets()
+    repo = CachingOrderRepository(inner)
+    old = make_order()
+    order_id = inner.save(old)
+    reader = threading.Thread(target=repo.get, args=(order_id,))
+    reader.start()
+    inner.reading.wait(5)
+
+    new = Order(Menu([], []), old.id, "alice", Coordinates(1, 1), [], None, None)
+    repo.save(new)
+    inner.resume.set()
+    reader.join()
+
+    assert repo.get(order_id) is new
+    repo.link_courier(order_id, "c1")
+    assert repo.find_by_courier("c1") == (new,)
+    assert repo.find_by_customer("alice") == (new,)
+    record = PaymentRecord("p1", "cash", "1.00", "0.00", "0.00", "authorized")
+    repo.record_payment(order_id, record)
+    assert inner.payment_record(order_id) is record
@@ -0,0 +1,161 @@
+import threading
+import time
+from decimal import Decimal
+
+import pytest
+
+from src.pizza.domain.errors import (
+    PaymentCircuitOpen,
+    PaymentNotAuthorized,
+    PaymentProviderError,
+    PaymentTimeout,
+)
+from src.pizza.domain.order import Order
+from src.pizza.domain.payment import PaymentAuthResult, PaymentRefundResult
+from src.pizza.domain.resilience import (
+    CircuitBreaker,
+    ResilientPayment,
+    RetryBudget,
+)
+
+
+class SlowCard:
+    """Sync mock provider: per-call delays and failures are injected by the test."""
+
+    method = "card"
+
+    def __init__(self, delays=(), failures=0) -> None:
+        self.delays = list(delays)
+        self.failures = failures
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def authorize(self, order: Order) -> PaymentAuthResult:
+        with self._lock:
+            self.calls += 1
+            delay = self.delays.pop(0) if self.delays else 0.0
+            fail = self.failures > 0
+            self.failures -= 1
+        time.sleep(delay)
+        if fail:
+            raise PaymentProviderError("slow-card", "503")
+        return PaymentAuthResult(f"p-{order.id}", "authorized", Decimal("10"), "card")
+
+    def capture(self, order, amount):
+        raise PaymentNotAuthorized()
+
+    def refund(self, order: Order, amount: Decimal) -> PaymentRefundResult:
+        with self._lock:
+            self.calls += 1
+        raise PaymentProviderError("slow-card", "503")
+
+
+def test_breaker_opens_and_probes(clock) -> None:
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+    assert breaker.allow() == 0
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert breaker.allow() == pytest.approx(10)
+
+    clock.now = 10
+    assert breaker.allow() == 0
+    assert breaker.allow() == 10  # the single probe is already in flight
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    clock.now = 20
+    assert breaker.allow() == 0
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+def test_open_circuit_fails_fast(make_order) -> None:
+    card = SlowCard(failures=100)
+    payment = ResilientPayment(
+        card, "slow-card", breaker=CircuitBreaker(failure_threshold=3), retries=0
+    )
+    for _ in range(3):
+        with pytest.raises(PaymentProviderError):
+            payment.authorize(make_order())
+    with pytest.raises(PaymentCircuitOpen):
+        payment.authorize(make_order())
+
+    assert card.calls == 3
+    assert payment.stats().short_circuited == 1
+
+
+def test_retries_are_budgeted_and_only_for_idempotent_ops(make_order) -> None:
+    card = SlowCard(failures=1)
+    payment = ResilientPayment(card, "slow-card", retries=2, budget=RetryBudget(initial=1))
+    assert payment.authorize(make_order()).status == "authorized"
+    assert payment.stats().retries == 1
+
+    with pytest.raises(PaymentProviderError):
+        payment.refund(make_order(), Decimal("1"))
+    assert card.calls == 3
+
+
+def test_business_errors_do_not_trip_the_breaker(make_order) -> None:
+    payment = ResilientPayment(SlowCard(), "slow-card", breaker=CircuitBreaker(1))
+    for _ in range(3):
+        with pytest.raises(PaymentNotAuthorized):
+            payment.capture(make_order(), Decimal("1"))
+    assert payment.breaker.state == "closed"
+
+
+def test_probe_ending_in_business_error_closes_the_circuit(make_order, clock) -> None:
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+    payment = ResilientPayment(SlowCard(), "slow-card", breaker=breaker, retries=0)
+    breaker.record_failure()
+    clock.now = 10
+
+    with pytest.raises(PaymentNotAuthorized):
+        payment.capture(make_order(), Decimal("1"))  # the half-open probe
+    assert breaker.state == "closed"
+    assert payment.authorize(make_order()).status == "authorized"
+    assert payment.stats().short_circuited == 0
+
+
+def test_probe_ending_in_a_bug_keeps_the_circuit_half_open(make_order, clock) -> None:
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+    payment = ResilientPayment(SlowCard(), "slow-card", breaker=breaker, retries=0)
+    breaker.record_failure()
+    clock.now = 10
+
+    with pytest.raises(AttributeError):
+        payment.authorize(None)  # the half-open probe fails before reaching the provider
+    assert breaker.state == "half-open"
+    assert payment.authorize(make_order()).status == "authorized"  # the slot was given back
+    assert breaker.state == "closed"
+
+
+def test_hedged_request_bounds_tail_latency(make_order) -> None:
+    card = SlowCard(delays=[0.5, 0.01])
+    payment = ResilientPayment(card, "slow-card", hedge_after=0.02)
+    started = time.perf_counter()
+    result = payment.authorize(make_order())
+    elapsed = time.perf_counter() - started
+    payment.close()
+
+    assert result.status == "authorized"
+    assert elapsed < 0.3
+    stats = payment.stats()
+    assert (stats.hedges, card.calls) == (1, 2)
+
+
+def test_deadline_raises_timeout(make_order) -> None:
+    payment = ResilientPayment(SlowCard(delays=[0.5]), "slow-card", deadline=0.05, retries=0)
+    with pytest.raises(PaymentTimeout):
+        payment.authorize(make_order())
+    payment.close()
+
+
+def test_latency_histograms_per_provider_and_operation(make_order) -> None:
+    payment = ResilientPayment(SlowCard(delays=[0.01] * 5), "slow-card")
+    for _ in range(5):
+        payment.authorize(make_order())
+    histogram = payment.histograms()[("slow-card", "authorize")]
+
+    assert histogram.count == 5
+    assert 0.01e9 <= histogram.percentile(50) <= histogram.percentile(99) <= histogram.max
@@ -0,0 +1,113 @@
+import random
+from typing import Callable
+
+import pytest
+
+from src.pizza.domain.delivery import Coordinates, Courier, Dispatcher, Vehicle, distance
+from src.pizza.domain.order import Order
+from src.pizza.domain.routing import RouteBatcher, plan_route, tour_length
+from src.pizza.domain.status import OrderStatus
+
+DEPOT = Coordinates(0, 0)
+BIKE = Vehicle(kind="bike", speed_coef=1.0)
+
+
+@pytest.fixture
+def order_at(make_order) -> Callable[..., Order]:
+    """``order_at(x, y, status=BOXED)``: an order delivering to (x, y)."""
+
+    def make(x: float, y: float, status: OrderStatus = OrderStatus.BOXED) -> Order:
+        return make_order(status=status, address=Coordinates(x, y))
+
+    return make
+
+
+def make_courier(courier_id: str, load: int | None = None) -> Courier:
+    return Courier(id=courier_id, location=DEPOT, vehicle=BIKE, available=True, current_load=load)
+
+
+def nearest_neighbour(stops: list[Coordinates]) -> list[Coordinates]:
+    tour, remaining, current = [], list(stops), DEPOT
+    while remaining:
+        current = min(remaining, key=lambda stop: distance(current, stop))
+        remaining.remove(current)
+        tour.append(current)
+    return tour
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_plan_route_is_not_worse_than_nearest_neighbour(seed) -> None:
+    rng = random.Random(seed)
+    stops = [Coordinates(rng.uniform(-5, 5), rng.uniform(-5, 5)) for _ in range(8)]
+    route = plan_route(DEPOT, stops)
+
+    assert sorted(route) == list(range(len(stops)))
+    baseline = tour_length(DEPOT, nearest_neighbour(stops))
+    assert tour_length(DEPOT, [stops[i] for i in route]) <= baseline + 1e-9
+
+
+def test_nearby_orders_share_a_trip(order_at) -> None:
+    orders = [order_at(3, 0), order_at(3.2, 0.1), order_at(3.1, -0.2)]
+    couriers = [make_courier("c1"), make_courier("c2")]
+    dispatcher = Dispatcher(couriers)
+
+    plan = RouteBatcher(DEPOT, capacity=3, max_detour=1.0).plan(orders, dispatcher)
+
+    assert len(plan.trips) == 1
+    assert set(plan.trips[0].order_ids) == {str(order.id) for order in orders}
+    courier = dispatcher.courier(plan.trips[0].courier_id)
+    assert courier.current_load == 3
+    assert courier.available is False
+    assert dispatcher.available_count() == 1
+    assert dispatcher.assign("next").courier_id != courier.id
+
+
+def test_consecutive_plans_never_share_an_order(order_at) -> None:
+    orders = [order_at(3 + i / 10, (-1) ** i * i / 10) for i in range(8)]
+    dispatcher = Dispatcher([make_courier("c1"), make_courier("c2")])
+    batcher = RouteBatcher(DEPOT, capacity=2, max_detour=1.0)
+
+    first = batcher.plan(orders, dispatcher)
+    for trip in first.trips:
+        dispatcher.release(trip.courier_id)
+    second = batcher.plan(orders, dispatcher)
+
+    planned = [set(trip.order_ids) for plan in (first, second) for trip in plan.trips]
+    assert first.deliveries == second.deliveries == 4
+    assert len(set().union(*planned)) == sum(map(len, planned)) == 8
+    assert all(order.status is OrderStatus.DISPATCHED for order in orders)
+    assert batcher.plan(orders, dispatcher).trips == ()
+
+
+def test_current_load_limits_trip_size(order_at) -> None:
+    orders = [order_at(3, 0), order_at(3.1, 0), order_at(3.2, 0)]
+    couriers = [make_courier("c1", load=2)]
+
+    plan = RouteBatcher(DEPOT, capacity=3, max_detour=5.0).plan(orders, Dispatcher(couriers))
+
+    assert plan.deliveries == 1
+    assert len(plan.unassigned) == 2
+
+
+def test_far_apart_orders_are_not_batched(order_at) -> None:
+    orders = [order_at(5, 0), order_at(-5, 0)]
+    couriers = [make_courier("c1"), make_courier("c2")]
+
+    plan = RouteBatcher(DEPOT, capacity=3, max_detour=1.0).plan(orders, Dispatcher(couriers))
+
+    assert [len(trip.order_ids) for trip in plan.trips] == [1, 1]
+
+
+def test_only_boxed_orders_are_planned(order_at) -> None:
+    orders = [order_at(1, 1, OrderStatus.BAKING), order_at(1, 1, OrderStatus.DELIVERED)]
+
+    plan = RouteBatcher(DEPOT).plan(orders, Dispatcher([make_courier("c1")]))
+
+    assert plan.trips == ()
+    assert plan.unassigned == ()
+
+
+@pytest.mark.parametrize("kwargs", [{"capacity": 0}, {"max_detour": -1.0}])
+def test_invalid_batcher_config(kwargs) -> None:
+    with pytest.raises(ValueError):
+        RouteBatcher(DEPOT, **kwargs)
@@ -0,0 +1,124 @@
+import asyncio
+from decimal import Decimal
+
+import pytest
+
+from src.pizza.domain.errors import (
+    PaymentAlreadyQueued,
+    PaymentAmountMismatch,
+    PaymentNotAuthorized,
+    PaymentProviderError,
+)
+from src.pizza.domain.order import Order
+from src.pizza.domain.payment import PaymentAuthResult, PaymentCaptureResult
+from src.pizza.domain.products import PizzaSize
+from src.pizza.domain.settlement import SettlementEngine
+from src.pizza.infra.mock_provider import MockPaymentProvider
+from src.pizza.infra.payment_client import AsyncPaymentClient
+
+
+def medium(qty: int = 1) -> tuple:
+    """add_item arguments for ``qty`` medium Margheritas (10.00 each)."""
+
+    return ("pz-mar", PizzaSize.MEDIUM, qty, ())
+
+
+def auth_for(order: Order, amount: Decimal | None = None) -> PaymentAuthResult:
+    return PaymentAuthResult(f"p-{order.id}", "authorized", amount or order.final_total(), "card")
+
+
+class FakeBatchProvider:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.broken_calls: set[int] = set()
+        self.rejected: set[str] = set()
+
+    async def capture_batch(self, items):
+        self.calls += 1
+        if self.calls in self.broken_calls:
+            raise PaymentProviderError("fake", "batch rejected")
+        results = []
+        for order, amount in items:
+            if str(order.id) in self.rejected:
+                results.append(PaymentNotAuthorized())
+            else:
+                results.append(PaymentCaptureResult(f"p-{order.id}", "captured", amount, "card"))
+        return results
+
+
+def test_settlement_batches_and_reconciles(make_order) -> None:
+    provider = FakeBatchProvider()
+    engine = SettlementEngine(provider, batch_size=4)
+    orders = [make_order(medium(1 + i % 3)) for i in range(10)]
+    for order in orders:
+        engine.enqueue(order, auth_for(order))
+
+    report = asyncio.run(engine.settle())
+
+    assert provider.calls == 3
+    assert report.batches == 3
+    assert report.reconciled
+    assert report.captured_total == report.expected_total == sum(o.final_total() for o in orders)
+    assert engine.pending() == 0
+
+
+def test_partial_failures_are_reported_per_order(make_order) -> None:
+    provider = FakeBatchProvider()
+    provider.broken_calls = {2}
+    engine = SettlementEngine(provider, batch_size=2, concurrency=1)
+    orders = [make_order(medium()) for _ in range(6)]
+    provider.rejected = {str(orders[0].id)}
+    over = make_order(medium(5))
+    for order in orders:
+        engine.enqueue(order, auth_for(order))
+    engine.enqueue(over, auth_for(over, Decimal("10.00")))
+
+    report = asyncio.run(engine.settle())
+
+    assert not report.reconciled
+    assert isinstance(report.failed[str(orders[0].id)], PaymentNotAuthorized)
+    assert isinstance(report.failed[str(orders[2].id)], PaymentProviderError)
+    assert isinstance(report.failed[str(orders[3].id)], PaymentProviderError)
+    assert isinstance(report.failed[str(over.id)], PaymentAmountMismatch)
+    assert len(report.captured) == 3
+    assert report.expected_total - report.captured_total == Decimal("80.00")
+
+
+def test_short_batch_answers_and_duplicates_are_not_reconciled(make_order) -> None:
+    class ShortProvider(FakeBatchProvider):
+        async def capture_batch(self, items):
+            return (await super().capture_batch(items))[:-1]
+
+    engine = SettlementEngine(ShortProvider(), batch_size=2)
+    orders = [make_order(medium()) for _ in range(3)]
+    for order in orders:
+        engine.enqueue(order, auth_for(order))
+    with pytest.raises(PaymentAlreadyQueued):
+        engine.enqueue(orders[0], auth_for(orders[0]))
+
+    report = asyncio.run(engine.settle())
+
+    assert set(report.failed) == {str(order.id) for order in orders}
+    assert report.expected_total == Decimal("30.00") and not report.reconciled
+    engine.enqueue(orders[0], auth_for(orders[0]))  # queued again for the next run
+    assert engine.pending() == 1
+
+
+def test_settlement_against_mock_provider(make_order) -> None:
+    async def scenario() -> None:
+        async with MockPaymentProvider() as provider:
+            async with AsyncPaymentClient(provider.host, provider.port) as client:
+                orders = [make_order(medium(1 + i % 2)) for i in range(25)]
+                auths = await client.authorize_many(orders)
+                engine = SettlementEngine(client, batch_size=10)
+                for order, auth in zip(orders, auths):
+                    engine.enqueue(order, auth)
+
+                report = await engine.settle()
+
+                assert report.reconciled
+                assert len(report.captured) == 25
+                assert provider.calls["capture-batch"] == 3
+                assert provider.calls["capture"] == 0
+
+    asyncio.run(scenario())
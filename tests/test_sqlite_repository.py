@@ -0,0 +1,98 @@
+import copy
+from decimal import Decimal
+
+import pytest
+
+from src.pizza.domain.delivery import Coordinates
+from src.pizza.domain.errors import OrderNotFound
+from src.pizza.domain.inventory import Ingredient, IngredientRequirement
+from src.pizza.domain.menu import Menu
+from src.pizza.domain.order import Order
+from src.pizza.domain.products import Pizza, PizzaSize, Topping
+from src.pizza.domain.repository import PaymentRecord
+from src.pizza.domain.status import OrderStatus
+from src.pizza.domain.types import OrderId
+from src.pizza.infra.sqlite_repository import SQLiteOrderRepository
+
+
+@pytest.fixture
+def menu() -> Menu:
+    dough = IngredientRequirement(Ingredient(name="Dough", unit="kg"), Decimal("1"))
+    return Menu(
+        pizzas=[Pizza("Margherita", Decimal("10.00"), "pz-mar", [dough])],
+        toppings=[
+            Topping("Olives", Decimal("1.00"), "tp-oli"),
+            Topping("Basil", Decimal("0.50"), "tp-bas"),
+        ],
+    )
+
+
+ITEMS = (("pz-mar", PizzaSize.LARGE, 2, ["tp-oli", "tp-bas"]), ("pz-mar", PizzaSize.SMALL, 1, []))
+
+
+def test_round_trip_and_upsert(tmp_path, menu, make_order) -> None:
+    with SQLiteOrderRepository(tmp_path / "orders.db", menu) as repo:
+        order = make_order(*ITEMS, address=Coordinates(1.5, -2))
+        order_id = repo.save(order)
+
+        loaded = repo.get(order_id)
+        assert loaded is not order
+        assert (loaded.customer, loaded.delivery_address) == ("test-user", Coordinates(1.5, -2))
+        assert loaded.subtotal() == order.subtotal()
+        assert [item.qty for item in loaded.items_view()] == [2, 1]
+
+        order.accept()
+        order.remove_item(1)
+        repo.save(order)
+        loaded = repo.get(order_id)
+        assert loaded.status is OrderStatus.ACCEPTED
+        assert len(loaded.items_view()) == 1
+
+        with pytest.raises(OrderNotFound):
+            repo.get(str(OrderId.generate()))
+
+
+def test_save_many_indexes_and_links_survive_reopen(tmp_path, menu, make_order) -> None:
+    path = tmp_path / "orders.db"
+    orders = [make_order(*ITEMS, customer=f"c{i % 2}") for i in range(10)]
+    for order in orders[:3]:
+        order.accept()
+    with SQLiteOrderRepository(path, menu, readers=2) as repo:
+        ids = repo.save_many(orders)
+        repo.link_courier(ids[0], "courier-1")
+        repo.record_payment(
+            ids[0], PaymentRecord("p1", "card", "10.00", "0.00", "0.00", "authorized", ("a", "b"))
+        )
+        with pytest.raises(OrderNotFound):
+            repo.link_courier(str(OrderId.generate()), "courier-1")
+
+    with SQLiteOrderRepository(path, menu) as repo:
+        assert len(repo) == 10
+        accepted = repo.find_by_status(OrderStatus.ACCEPTED)
+        assert {str(order.id) for order in accepted} == set(ids[:3])
+        assert len(repo.find_by_customer("c0")) == 5
+        assert [str(order.id) for order in repo.find_by_courier("courier-1")] == [ids[0]]
+        assert len(repo.list_all()) == 10
+        record = repo.payment_record(ids[0])
+        assert record is not None and record.history == ("a", "b")
+        assert repo.payment_record(ids[1]) is None
+
+
+def test_save_many_writes_a_repeated_order_once_as_its_last_version(
+    tmp_path, menu, make_order
+) -> None:
+    order = make_order(*ITEMS)
+    history = []
+    for step in (None, Order.accept, lambda o: o.remove_item(0)):
+        if step is not None:
+            step(order)
+        history.append(copy.deepcopy(order))
+
+    with SQLiteOrderRepository(tmp_path / "orders.db", menu) as repo:
+        ids = repo.save_many(history + [make_order(*ITEMS)])
+        loaded = repo.get(ids[0])
+
+        assert ids[0] == ids[1] == ids[2] != ids[3]
+        assert len(repo) == 2
+        assert loaded.status is OrderStatus.ACCEPTED
+        assert [item.size for item in loaded.items_view()] == [PizzaSize.SMALL]
@@ -0,0 +1,77 @@
+import asyncio
+
+import pytest
+
+from src.pizza.domain.delivery import Coordinates, Courier, Dispatcher, Vehicle
+from src.pizza.domain.errors import CourierUnavailable
+from src.pizza.domain.tracking import LocationIngestor
+
+
+@pytest.fixture
+def dispatcher() -> Dispatcher:
+    bike = Vehicle(kind="bike", speed_coef=1.0)
+    couriers = [
+        Courier(id=f"c{i}", location=Coordinates(0, 0), vehicle=bike, available=True)
+        for i in range(3)
+    ]
+    return Dispatcher(couriers=couriers, strategy=None)
+
+
+def test_update_courier_location(dispatcher: Dispatcher) -> None:
+    dispatcher.update_courier_location("c1", Coordinates(1, 2))
+    assert dispatcher.couriers[1].location == Coordinates(1, 2)
+
+    with pytest.raises(CourierUnavailable):
+        dispatcher.update_courier_location("ghost", Coordinates(1, 2))
+
+
+def test_latest_ping_per_courier_wins(dispatcher: Dispatcher, clock) -> None:
+    ingestor = LocationIngestor(dispatcher, clock=clock)
+
+    for step in range(10):
+        for courier_id in ("c0", "c1", "c2", "ghost"):
+            ingestor.submit(courier_id, Coordinates(step, step))
+    clock.now = 0.5
+    applied = ingestor.flush()
+
+    stats = ingestor.stats()
+    assert applied == 3
+    assert [c.location for c in dispatcher.couriers] == [Coordinates(9, 9)] * 3
+    assert stats.received == 40
+    assert stats.coalesced == 36
+    assert stats.unknown == 1
+    assert stats.batches == 1
+    assert stats.max_lag == pytest.approx(0.5)
+
+
+def test_full_buffer_drops_new_couriers(dispatcher: Dispatcher) -> None:
+    ingestor = LocationIngestor(dispatcher, max_pending=1)
+
+    assert ingestor.submit("c0", Coordinates(1, 1))
+    assert not ingestor.submit("c1", Coordinates(1, 1))
+    assert ingestor.submit("c0", Coordinates(2, 2))
+
+    stats = ingestor.stats()
+    assert (stats.dropped, stats.coalesced) == (1, 1)
+
+
+def test_stream_is_applied_in_batches(dispatcher: Dispatcher) -> None:
+    async def pings():
+        for step in range(300):
+            yield f"c{step % 3}", Coordinates(step, 0)
+            if step % 50 == 0:
+                await asyncio.sleep(0.002)
+
+    async def scenario() -> None:
+        ingestor = LocationIngestor(dispatcher, tick=0.001)
+        runner = asyncio.create_task(ingestor.run())
+        await ingestor.consume(pings())
+        ingestor.stop()
+        await runner
+        stats = ingestor.stats()
+        assert stats.received == 300
+        assert stats.applied + stats.coalesced == 300
+        assert stats.batches >= 2
+
+    asyncio.run(scenario())
+    assert [c.location.x for c in dispatcher.couriers] == [297, 298, 299]